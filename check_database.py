@@ -5,13 +5,23 @@
 import pandas as pd
 import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
 import json
 import re
+import sqlite3
+from html import unescape
+import asyncio
+from bisect import bisect_right
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # pykrx 설치 및 import
 try:
@@ -23,6 +33,37 @@ except ImportError:
     PYKRX_AVAILABLE = False
     print("❌ pykrx 설치 필요: pip install pykrx")
 
+# HTML 파서 (selectolax가 있으면 C 기반 lexbor 파서 사용)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    print("⚠️ selectolax 설치 권장 (HTML 파싱 가속): pip install selectolax")
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 네이버 페이지 파싱 백엔드 (selectolax > lxml XPath > BeautifulSoup)
+if SELECTOLAX_AVAILABLE:
+    NAVER_PARSER = 'selectolax'
+elif LXML_AVAILABLE:
+    NAVER_PARSER = 'lxml'
+else:
+    NAVER_PARSER = 'bs4'
+
+# 비동기 HTTP (배치 수집 시 네이버 페이지 동시 요청)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("⚠️ aiohttp 설치 권장 (배치 수집 가속): pip install aiohttp")
+
 # 추가 라이브러리들
 try:
     import FinanceDataReader as fdr
@@ -34,9 +75,404 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 네이버 금융 ETF 페이지 URL
+NAVER_ETF_URL = "https://finance.naver.com/item/main.naver?code={code}"
+
+# 네이버 금융 페이지 기본 인코딩 (EUC-KR 상위 호환, 응답 헤더에 charset이 없을 때 사용)
+NAVER_ENCODING = 'cp949'
+
+# 배치 진행률 로그 간격 (ETF 수)
+PROGRESS_LOG_INTERVAL = 16
+
+# 배치 수집 중 DB 중간 저장 간격 (ETF 수 / 초)
+DB_FLUSH_SIZE = 25
+DB_FLUSH_SECONDS = 2.0
+
+# 하루 동안 재사용하는 ETF 기본 정보 (자주 바뀌지 않는 필드)
+STATIC_METADATA_FIELDS = ('name', 'expense_ratio', 'dividend_yield')
+
+# 값 추출용 정규식 (한 번만 컴파일, 소유 수량자로 실패 경로의 백트래킹 방지 - Python 3.11+)
+_RE_SIGNED_INT = re.compile(r'([+-]?\d++)')
+_RE_RATE = re.compile(r'([+-]?\d++(?:\.\d*+)?)%')
+_RE_PERCENT = re.compile(r'(\d++(?:\.\d*+)?)%')
+_RE_NUM = re.compile(r'(\d[\d,]*+)')
+
+# 정보 테이블(tbl_data) 라벨/값 추출용 정규식
+_RE_TBL_DATA = re.compile(r'<table[^>]*class="[^"]*\btbl_data\b[^"]*+"[^>]*+>(.*?)</table>', re.S | re.I)
+_RE_TABLE_PAIR = re.compile(
+    r'<t[hd][^>]*+>([^<]*+(?:<(?!/t[hd]>)[^<]*+)*+)</t[hd]>\s*+<td[^>]*+>([^<]*+(?:<(?!/td>)[^<]*+)*+)</td>',
+    re.I
+)
+_RE_TAG = re.compile(r'<[^>]++>')
+_TABLE_LABELS = ('보수', '배당', '순자산', '거래량')
+
+# BeautifulSoup 사용 시 필요한 영역만 파싱 (현재가/등락/정보 테이블/종목명)
+NAVER_STRAINER = SoupStrainer(attrs={'class': ['no_today', 'no_exday', 'tbl_data', 'wrap_company']})
+
+def _decode_naver_page(content: bytes, charset: Optional[str] = None) -> str:
+    """응답 바이트를 명시된 인코딩으로 한 번만 디코딩 (charset 추측 생략)"""
+    if not charset or charset.lower().replace('-', '').replace('_', '') in ('euckr', 'ksc5601'):
+        charset = NAVER_ENCODING
+    return content.decode(charset, errors='replace')
+
+def _json_default(obj):
+    """json.dumps용 변환기 (NumPy 배열/스칼라 지원)"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@dataclass(slots=True)
+class ETFRecord:
+    """여러 소스의 수집 결과를 병합하는 ETF 종합 데이터 레코드"""
+    code: str
+    collection_time: str = ''
+    sources_used: List[str] = field(default_factory=list)
+    data_quality: str = 'unknown'
+    timestamp: Optional[str] = None
+    source: Optional[str] = None
+    name: Optional[str] = None
+    current_price: Optional[float] = None
+    price_change: Optional[float] = None
+    change_rate: Optional[float] = None
+    volume: Optional[int] = None
+    expense_ratio: Optional[float] = None
+    dividend_yield: Optional[float] = None
+    aum: Optional[float] = None
+    high_52w: Optional[float] = None
+    low_52w: Optional[float] = None
+    price_history: Optional[Any] = None
+    volatility: Optional[float] = None
+    portfolio_info: Optional[List[Dict]] = None
+    ma_5: Optional[float] = None
+    ma_20: Optional[float] = None
+    rsi: Optional[float] = None
+    
+    def merge(self, data: Dict, overwrite: tuple = ()):
+        """비어 있는 필드만 채움 (overwrite 필드는 항상 덮어씀)"""
+        for key, value in data.items():
+            if key in ETF_RECORD_FIELDS and (key in overwrite or getattr(self, key) is None):
+                setattr(self, key, value)
+    
+    def to_json(self) -> str:
+        """JSON 문자열로 변환 (NumPy 배열은 리스트로 변환)"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=_json_default)
+    
+    def to_dict(self) -> Dict:
+        """값이 있는 필드만 dict로 변환 (NumPy 배열은 레코드 내부에만 두고 리스트로 반환)"""
+        result = {}
+        for key in ETF_RECORD_FIELD_ORDER:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value.tolist() if isinstance(value, np.ndarray) else value
+        return result
+
+ETF_RECORD_FIELDS = frozenset(f.name for f in fields(ETFRecord))
+ETF_RECORD_FIELD_ORDER = tuple(f.name for f in fields(ETFRecord))
+
+# 네이버 페이지에서 읽는 요소 (CSS 선택자)
+_NAVER_CSS = {
+    'price': '.no_today .blind',
+    'change': '.no_exday .blind',
+    'rate': '.no_exday',
+    'name': '.wrap_company h2',
+    'table_rows': 'table.tbl_data tr',
+    'cells': 'td, th',
+}
+
+def _xp_class(name: str) -> str:
+    """class 속성에 name이 포함되는지 검사하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# lxml 백엔드용 XPath (모듈 로드 시 한 번만 컴파일, CSS→XPath 변환 생략)
+if LXML_AVAILABLE:
+    _NAVER_XPATH = {
+        'price': etree.XPath(f"//*[{_xp_class('no_today')}]//*[{_xp_class('blind')}]"),
+        'change': etree.XPath(f"//*[{_xp_class('no_exday')}]//*[{_xp_class('blind')}]"),
+        'rate': etree.XPath(f"//*[{_xp_class('no_exday')}]"),
+        'name': etree.XPath(f"//*[{_xp_class('wrap_company')}]//h2"),
+        'table_rows': etree.XPath(f"//table[{_xp_class('tbl_data')}]//tr"),
+        'cells': etree.XPath("./td|./th"),
+    }
+
+def _load_naver_document(html: str):
+    """설정된 백엔드로 네이버 페이지 파싱"""
+    if NAVER_PARSER == 'selectolax':
+        return LexborHTMLParser(html)
+    if NAVER_PARSER == 'lxml':
+        return lxml_html.fromstring(html)
+    return BeautifulSoup(html, 'html.parser', parse_only=NAVER_STRAINER)
+
+def _select_all(doc, key: str) -> list:
+    """매칭되는 모든 요소"""
+    if NAVER_PARSER == 'selectolax':
+        return doc.css(_NAVER_CSS[key])
+    if NAVER_PARSER == 'lxml':
+        return _NAVER_XPATH[key](doc)
+    return doc.select(_NAVER_CSS[key])
+
+def _node_text(node, strip: bool = False) -> str:
+    """요소 텍스트 (strip=True이면 각 텍스트 조각의 공백 제거)"""
+    if NAVER_PARSER == 'selectolax':
+        return node.text(strip=strip)
+    if NAVER_PARSER == 'lxml':
+        if strip:
+            return ''.join(text.strip() for text in node.itertext())
+        return node.text_content()
+    return node.get_text(strip=strip)
+
+def _select_text(doc, key: str, strip: bool = False) -> Optional[str]:
+    """첫 번째로 매칭되는 요소의 텍스트"""
+    if NAVER_PARSER == 'selectolax':
+        node = doc.css_first(_NAVER_CSS[key])
+    else:
+        nodes = _select_all(doc, key)
+        node = nodes[0] if nodes else None
+    return _node_text(node, strip=strip) if node is not None else None
+
+def _apply_table_field(etf_data: Dict, key: str, value: str):
+    """정보 테이블의 라벨/값 한 쌍을 etf_data에 반영"""
+    # 운용보수 / 총보수
+    if '보수' in key and ('운용' in key or '총' in key):
+        expense_match = _RE_PERCENT.search(value)
+        if expense_match:
+            etf_data['expense_ratio'] = float(expense_match.group(1))
+    
+    # 배당수익률
+    elif '배당' in key and '수익률' in key:
+        dividend_match = _RE_PERCENT.search(value)
+        if dividend_match:
+            etf_data['dividend_yield'] = float(dividend_match.group(1))
+    
+    # 순자산 총액 (AUM)
+    elif '순자산' in key:
+        aum_match = _RE_NUM.search(value.replace(',', ''))
+        if aum_match:
+            aum_value = float(aum_match.group(1))
+            if '조' in value:
+                aum_value *= 10000  # 조원 -> 억원
+            elif '억' not in value and '만' in value:
+                aum_value /= 10000  # 만원 -> 억원
+            etf_data['aum'] = aum_value
+    
+    # 거래량
+    elif '거래량' in key:
+        volume_match = _RE_NUM.search(value.replace(',', ''))
+        if volume_match:
+            etf_data['volume'] = int(volume_match.group(1))
+
+def _extract_table_fields_regex(html: str, etf_data: Dict) -> bool:
+    """tbl_data 테이블 HTML에서 라벨/값 쌍을 정규식으로 추출 (하나라도 찾으면 True)"""
+    found = False
+    for table_match in _RE_TBL_DATA.finditer(html):
+        for key_html, value_html in _RE_TABLE_PAIR.findall(table_match.group(1)):
+            key = _RE_TAG.sub('', key_html).strip()
+            if any(label in key for label in _TABLE_LABELS):
+                _apply_table_field(etf_data, key, unescape(_RE_TAG.sub('', value_html)).strip())
+                found = True
+    return found
+
+def _parse_naver_page(code: str, html: str) -> Dict:
+    """네이버 금융 ETF 페이지 HTML에서 가격/펀드 정보 추출"""
+    doc = _load_naver_document(html)
+    
+    etf_data = {
+        'code': code,
+        'timestamp': datetime.now().isoformat(),
+        'source': 'naver'
+    }
+    
+    # 현재가 정보 추출
+    try:
+        # 현재가
+        current_price = _select_text(doc, 'price', strip=True)
+        if current_price:
+            etf_data['current_price'] = float(current_price.replace(',', ''))
+        
+        # 전일 대비
+        change_text = _select_text(doc, 'change', strip=True)
+        if change_text:
+            change_match = _RE_SIGNED_INT.search(change_text.replace(',', ''))
+            if change_match:
+                etf_data['price_change'] = float(change_match.group(1))
+        
+        # 등락률
+        rate_text = _select_text(doc, 'rate')
+        if rate_text:
+            rate_match = _RE_RATE.search(rate_text)
+            if rate_match:
+                etf_data['change_rate'] = float(rate_match.group(1))
+        
+    except Exception as e:
+        logger.debug(f"가격 정보 추출 실패: {e}")
+    
+    # ETF 기본 정보 추출 (정규식 한 번으로 테이블 라벨/값 추출, 실패 시 DOM 순회)
+    try:
+        if not _extract_table_fields_regex(html, etf_data):
+            for row in _select_all(doc, 'table_rows'):
+                cells = _select_all(row, 'cells')
+                if len(cells) >= 2:
+                    _apply_table_field(etf_data, _node_text(cells[0], strip=True),
+                                       _node_text(cells[1], strip=True))
+    
+    except Exception as e:
+        logger.debug(f"ETF 정보 추출 실패: {e}")
+    
+    # ETF 이름 추출
+    try:
+        name = _select_text(doc, 'name', strip=True)
+        if name:
+            etf_data['name'] = name
+    except Exception as e:
+        logger.debug(f"ETF 이름 추출 실패: {e}")
+    
+    return etf_data
+
+class AsyncRateLimiter:
+    """토큰 버킷 방식 비동기 요청 속도 제한기 (초당 rate개, 최대 capacity개 버스트)"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+# 수집 결과 저장 (etf_info 테이블 upsert, 값이 없는 필드는 기존 값 유지)
+# (컬럼, INSERT 값, UPDATE 값) - 테이블에 실제로 있는 컬럼만 사용
+_ETF_INFO_UPSERT_COLUMNS = (
+    ('code', ':code', None),
+    ('name', "COALESCE(:name, 'ETF_' || :code)", 'COALESCE(:name, etf_info.name)'),
+    ('market_price', 'COALESCE(:price, 0)', 'COALESCE(:price, etf_info.market_price)'),
+    ('expense_ratio', ':expense_ratio', 'COALESCE(:expense_ratio, etf_info.expense_ratio)'),
+    ('dividend_yield', 'COALESCE(:dividend_yield, 0)', 'COALESCE(:dividend_yield, etf_info.dividend_yield)'),
+    ('aum', 'COALESCE(:aum, 0)', 'COALESCE(:aum, etf_info.aum)'),
+    ('avg_volume', 'COALESCE(:volume, 0)', 'COALESCE(:volume, etf_info.avg_volume)'),
+    ('data_quality', ':data_quality', ':data_quality'),
+    ('data_source', ':data_source', ':data_source'),
+    ('last_updated', ':updated', ':updated'),
+    ('last_real_update', ':updated', ':updated'),
+)
+
+def _build_etf_info_upsert(conn: sqlite3.Connection) -> str:
+    """연결된 DB의 etf_info 실제 컬럼으로 upsert SQL 구성 (연결당 한 번 호출)
+    
+    etf_universe.py가 만든 테이블처럼 dividend_yield, data_quality 등이 없는 스키마도 지원한다.
+    """
+    available = {row[1] for row in conn.execute("PRAGMA table_info(etf_info)")}
+    if 'code' not in available:
+        raise sqlite3.OperationalError("etf_info 테이블(code 컬럼)이 없어 수집 결과를 저장할 수 없습니다")
+    
+    columns = [spec for spec in _ETF_INFO_UPSERT_COLUMNS if spec[0] in available]
+    updates = [f"{name} = {update}" for name, _, update in columns if update is not None]
+    return (
+        f"INSERT INTO etf_info ({', '.join(name for name, _, _ in columns)}) "
+        f"VALUES ({', '.join(value for _, value, _ in columns)}) "
+        "ON CONFLICT(code) DO "
+        + (f"UPDATE SET {', '.join(updates)}" if updates else "NOTHING")
+    )
+
+def _connect_db(db_path: str) -> sqlite3.Connection:
+    """쓰기용 SQLite 연결 (WAL + synchronous=NORMAL로 커밋마다 fsync 방지)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+def save_etf_results_to_db(results: List[Dict], db_path: str = 'etf_universe.db',
+                           conn: Optional[sqlite3.Connection] = None,
+                           upsert_sql: Optional[str] = None) -> int:
+    """수집 결과를 한 트랜잭션에서 executemany로 etf_info에 저장 (저장 건수 반환)
+    
+    upsert_sql은 같은 연결로 반복 저장할 때 _build_etf_info_upsert(conn) 결과를 넘겨 재사용한다.
+    """
+    rows = [
+        {
+            'code': result['code'],
+            'name': result.get('name'),
+            'price': result.get('current_price'),
+            'expense_ratio': result.get('expense_ratio'),
+            'dividend_yield': result.get('dividend_yield'),
+            'aum': result.get('aum'),
+            'volume': result.get('volume'),
+            'data_quality': result.get('data_quality', 'unknown'),
+            'data_source': '/'.join(result.get('sources_used', [])) or 'unknown',
+            'updated': result.get('collection_time', datetime.now().isoformat()),
+        }
+        for result in results
+        if 'error' not in result
+    ]
+    if not rows:
+        return 0
+    
+    own_conn = conn is None
+    if own_conn:
+        conn = _connect_db(db_path)
+    
+    try:
+        if upsert_sql is None:
+            upsert_sql = _build_etf_info_upsert(conn)
+        with conn:
+            conn.executemany(upsert_sql, rows)
+        return len(rows)
+    except sqlite3.Error as e:
+        logger.error("❌ 수집 결과 저장 실패 (%s): %s", db_path, e)
+        return 0
+    finally:
+        if own_conn:
+            conn.close()
+
+def _parse_naver_page_safe(code: str, html: str) -> Dict:
+    """_parse_naver_page 래퍼 (실패 시 에러 dict 반환, 프로세스 풀 작업용)"""
+    try:
+        return _parse_naver_page(code, html)
+    except Exception as e:
+        return {'code': code, 'error': str(e), 'source': 'naver'}
+
+def _parse_naver_pages(pages: Dict[str, str], chunksize: int = 16) -> Dict[str, Dict]:
+    """여러 네이버 페이지를 프로세스 풀에서 병렬 파싱 (소량이거나 풀 실패 시 순차 파싱)"""
+    codes = list(pages)
+    htmls = [pages[code] for code in codes]
+    
+    if len(codes) >= chunksize * 2 and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                parsed = list(pool.map(_parse_naver_page_safe, codes, htmls, chunksize=chunksize))
+            return dict(zip(codes, parsed))
+        except Exception as e:
+            logger.warning(f"병렬 파싱 실패, 순차 파싱으로 진행: {e}")
+    
+    return {code: _parse_naver_page_safe(code, html) for code, html in zip(codes, htmls)}
+
 class RealETFDataCollector:
     """실제 ETF 데이터 수집기"""
     
+    # 데이터 품질 점수 규칙: (필드, 조건, 점수)
+    _QUALITY_RULES = (
+        ('current_price', lambda v: v is not None and v > 0, 30),
+        ('expense_ratio', lambda v: v is not None, 20),
+        ('dividend_yield', lambda v: v is not None, 20),
+        ('price_history', lambda v: v is not None and len(v) > 10, 20),
+        ('volume', lambda v: v is not None and v > 0, 10),
+    )
+    # 점수 구간별 품질 등급 (40 미만 poor, 60 미만 fair, 80 미만 good)
+    _QUALITY_THRESHOLDS = (40, 60, 80)
+    _QUALITY_LABELS = ('poor', 'fair', 'good', 'excellent')
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -48,11 +484,41 @@ class RealETFDataCollector:
             'Upgrade-Insecure-Requests': '1',
         })
         
+        # 커넥션 풀 재사용 (호스트당 한 번의 TCP/TLS 핸드셰이크로 배치 전체 처리)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.last_request_time = 0
         self.request_delay = 1.0  # 1초 지연
         
+        # ETF 기본 정보 캐시: code -> (날짜, 필드 dict)
+        self._static_metadata_cache: Dict[str, tuple] = {}
+        
+        # KRX 당일 스냅샷 (배치 시작 시 한 번 수집) 및 기간별 히스토리 캐시
+        self._krx_snapshot = None
+        self._krx_history_cache: Dict[tuple, Any] = {}
+        
         print("🚀 실제 ETF 데이터 수집기 초기화 완료")
     
+    def _get_static_metadata(self, code: str) -> Optional[Dict]:
+        """오늘 수집된 ETF 기본 정보 (없으면 None)"""
+        entry = self._static_metadata_cache.get(code)
+        if entry and entry[0] == datetime.now().strftime('%Y%m%d'):
+            return entry[1]
+        return None
+    
+    def _store_static_metadata(self, code: str, etf_data: Dict):
+        """네이버 수집 결과에서 기본 정보만 캐시"""
+        fields = {key: etf_data[key] for key in STATIC_METADATA_FIELDS if key in etf_data}
+        if fields:
+            self._static_metadata_cache[code] = (datetime.now().strftime('%Y%m%d'), fields)
+    
     def _wait_for_rate_limit(self):
         """요청 간격 제한"""
         now = time.time()
@@ -65,123 +531,151 @@ class RealETFDataCollector:
     # 1. 네이버 금융 실시간 데이터 수집
     # ==========================================
     
-    def get_naver_etf_realtime_data(self, code: str) -> Dict:
-        """네이버 금융에서 실시간 ETF 데이터 수집"""
+    def get_naver_etf_realtime_data(self, code: str, html: Optional[str] = None) -> Dict:
+        """네이버 금융에서 실시간 ETF 데이터 수집 (html이 주어지면 요청 생략)"""
         try:
-            self._wait_for_rate_limit()
-            
-            # 네이버 금융 ETF 페이지 URL
-            url = f"https://finance.naver.com/item/main.naver?code={code}"
-            
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            etf_data = {
-                'code': code,
-                'timestamp': datetime.now().isoformat(),
-                'source': 'naver'
-            }
-            
-            # 현재가 정보 추출
-            try:
-                # 현재가
-                price_element = soup.select_one('.no_today .blind')
-                if price_element:
-                    current_price = price_element.get_text().strip()
-                    etf_data['current_price'] = float(current_price.replace(',', ''))
-                
-                # 전일 대비
-                change_element = soup.select_one('.no_exday .blind')
-                if change_element:
-                    change_text = change_element.get_text().strip()
-                    change_match = re.search(r'([+-]?\d+)', change_text.replace(',', ''))
-                    if change_match:
-                        etf_data['price_change'] = float(change_match.group(1))
-                
-                # 등락률
-                rate_element = soup.select_one('.no_exday')
-                if rate_element:
-                    rate_text = rate_element.get_text()
-                    rate_match = re.search(r'([+-]?\d+\.?\d*)%', rate_text)
-                    if rate_match:
-                        etf_data['change_rate'] = float(rate_match.group(1))
-                
-            except Exception as e:
-                logger.debug(f"가격 정보 추출 실패: {e}")
-            
-            # ETF 기본 정보 추출
-            try:
-                # 펀드 기본 정보 테이블
-                tables = soup.select('table.tbl_data')
-                for table in tables:
-                    rows = table.select('tr')
-                    for row in rows:
-                        cells = row.select('td, th')
-                        if len(cells) >= 2:
-                            key = cells[0].get_text(strip=True)
-                            value = cells[1].get_text(strip=True)
-                            
-                            # 운용보수 / 총보수
-                            if '보수' in key and ('운용' in key or '총' in key):
-                                expense_match = re.search(r'(\d+\.?\d*)%', value)
-                                if expense_match:
-                                    etf_data['expense_ratio'] = float(expense_match.group(1))
-                            
-                            # 배당수익률
-                            elif '배당' in key and '수익률' in key:
-                                dividend_match = re.search(r'(\d+\.?\d*)%', value)
-                                if dividend_match:
-                                    etf_data['dividend_yield'] = float(dividend_match.group(1))
-                            
-                            # 순자산 총액 (AUM)
-                            elif '순자산' in key:
-                                aum_match = re.search(r'(\d+[,\d]*)', value.replace(',', ''))
-                                if aum_match:
-                                    aum_value = float(aum_match.group(1))
-                                    if '조' in value:
-                                        aum_value *= 10000  # 조원 -> 억원
-                                    elif '억' not in value and '만' in value:
-                                        aum_value /= 10000  # 만원 -> 억원
-                                    etf_data['aum'] = aum_value
-                            
-                            # 거래량
-                            elif '거래량' in key:
-                                volume_match = re.search(r'(\d+[,\d]*)', value.replace(',', ''))
-                                if volume_match:
-                                    etf_data['volume'] = int(volume_match.group(1))
+            if html is None:
+                self._wait_for_rate_limit()
                 
-            except Exception as e:
-                logger.debug(f"ETF 정보 추출 실패: {e}")
+                response = self.session.get(NAVER_ETF_URL.format(code=code), timeout=10)
+                response.raise_for_status()
+                # response.text는 헤더에 charset이 없으면 본문 전체로 인코딩을 추측하므로 직접 디코딩
+                charset = response.encoding if 'charset' in response.headers.get('Content-Type', '') else None
+                html = _decode_naver_page(response.content, charset)
             
-            # ETF 이름 추출
-            try:
-                title_element = soup.select_one('.wrap_company h2')
-                if title_element:
-                    etf_data['name'] = title_element.get_text(strip=True)
-            except Exception as e:
-                logger.debug(f"ETF 이름 추출 실패: {e}")
+            etf_data = _parse_naver_page(code, html)
             
-            print(f"✅ {code} 네이버 데이터 수집 성공: {etf_data.get('current_price', 0):,}원")
+            logger.debug("✅ %s 네이버 데이터 수집 성공: %s원", code, etf_data.get('current_price', 0))
             return etf_data
             
         except Exception as e:
             logger.error(f"네이버 ETF 데이터 수집 실패 {code}: {e}")
             return {'code': code, 'error': str(e), 'source': 'naver'}
     
+    async def _fetch_naver_page_async(self, session, semaphore, limiter: AsyncRateLimiter, code: str) -> str:
+        """네이버 금융 ETF 페이지 비동기 요청"""
+        async with semaphore:
+            await limiter.acquire()
+            async with session.get(NAVER_ETF_URL.format(code=code)) as response:
+                response.raise_for_status()
+                return _decode_naver_page(await response.read(), response.charset)
+    
+    async def _fetch_naver_pages_async(self, codes: List[str], max_concurrent: int,
+                                       requests_per_second: float) -> Dict[str, str]:
+        """여러 ETF 페이지를 동시 요청 수/초당 요청 수 제한 하에 비동기 수집"""
+        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = AsyncRateLimiter(requests_per_second)
+        connector = aiohttp.TCPConnector(limit=max_concurrent, keepalive_timeout=85)
+        # 압축 방식은 aiohttp가 지원하는 것으로 자동 협상
+        headers = {k: v for k, v in self.session.headers.items() if k != 'Accept-Encoding'}
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector,
+                                         timeout=aiohttp.ClientTimeout(total=10)) as session:
+            pages = await asyncio.gather(
+                *(self._fetch_naver_page_async(session, semaphore, limiter, code) for code in codes),
+                return_exceptions=True
+            )
+        
+        result = {}
+        for code, page in zip(codes, pages):
+            if isinstance(page, BaseException):
+                logger.warning(f"네이버 페이지 비동기 수집 실패 {code}: {page}")
+            else:
+                result[code] = page
+        return result
+    
+    def prefetch_naver_pages(self, codes: List[str], max_concurrent: int = 5,
+                             requests_per_second: float = 5.0) -> Dict[str, str]:
+        """네이버 ETF 페이지 일괄 수집 (aiohttp 미설치 시 빈 결과)"""
+        if not AIOHTTP_AVAILABLE or not codes:
+            return {}
+        
+        try:
+            return asyncio.run(self._fetch_naver_pages_async(codes, max_concurrent, requests_per_second))
+        except RuntimeError as e:
+            # 이미 이벤트 루프가 실행 중인 환경 (Jupyter 등) - 순차 수집으로 대체
+            logger.warning(f"비동기 수집 불가, 순차 수집으로 진행: {e}")
+            return {}
+    
     # ==========================================
     # 2. pykrx를 통한 공식 데이터 수집
     # ==========================================
     
-    def get_krx_etf_data(self, code: str, days: int = 30) -> Dict:
-        """pykrx를 통한 KRX 공식 ETF 데이터 수집"""
+    def _prefetch_krx_snapshot(self, date: Optional[str] = None):
+        """전체 ETF의 당일 OHLCV를 한 번에 수집 (ETF별 최신가 조회용)"""
         if not PYKRX_AVAILABLE:
-            return {'code': code, 'error': 'pykrx not available', 'source': 'krx'}
+            return None
         
+        date = date or datetime.now().strftime('%Y%m%d')
         try:
             self._wait_for_rate_limit()
+            snapshot = stock.get_etf_ohlcv_by_ticker(date)
+            self._krx_snapshot = snapshot if snapshot is not None and not snapshot.empty else None
+        except Exception as e:
+            logger.debug(f"KRX ETF 스냅샷 수집 실패: {e}")
+            self._krx_snapshot = None
+        
+        return self._krx_snapshot
+    
+    def _prefetch_krx_history(self, days: int = 30) -> int:
+        """기간 내 거래일별 전체 ETF OHLCV를 일괄 수집해 종목별 히스토리 캐시 구성
+        
+        ETF마다 get_market_ohlcv_by_date를 호출하는 대신 거래일 수만큼만 요청한다.
+        캐시 키는 get_krx_etf_data(days=days)가 조회하는 (code, start, end)와 같다.
+        """
+        if not PYKRX_AVAILABLE:
+            return 0
+        
+        now = datetime.now()
+        end_date = now.strftime('%Y%m%d')
+        start_date = (now - timedelta(days=days)).strftime('%Y%m%d')
+        
+        snapshots = {}
+        for offset in range(days, -1, -1):
+            day = now - timedelta(days=offset)
+            if day.weekday() >= 5:
+                continue  # 주말은 거래일이 아님
             
+            date = day.strftime('%Y%m%d')
+            if date == end_date and self._krx_snapshot is not None:
+                snapshot = self._krx_snapshot  # 당일 스냅샷은 이미 수집됨
+            else:
+                try:
+                    self._wait_for_rate_limit()
+                    snapshot = stock.get_etf_ohlcv_by_ticker(date)
+                except Exception as e:
+                    logger.debug(f"KRX ETF 스냅샷 수집 실패 {date}: {e}")
+                    continue
+            
+            if snapshot is not None and not snapshot.empty and '종가' in snapshot.columns:
+                snapshots[pd.Timestamp(day.date())] = snapshot[['시가', '고가', '저가', '종가', '거래량']]
+        
+        if not snapshots:
+            return 0
+        
+        # (날짜, 티커) 패널을 종목별 일자 순 OHLCV로 분리 (휴장일 등 종가 0 행 제외)
+        panel = pd.concat(snapshots, names=['날짜', '티커'])
+        panel = panel[panel['종가'] > 0]
+        for code, frame in panel.groupby(level='티커'):
+            self._krx_history_cache[(code, start_date, end_date)] = frame.droplevel('티커')
+        
+        return len(snapshots)
+    
+    def _get_krx_history(self, code: str, start_date: str, end_date: str):
+        """ETF별 OHLCV 히스토리 (같은 기간 요청은 캐시 재사용)"""
+        key = (code, start_date, end_date)
+        if key not in self._krx_history_cache:
+            self._wait_for_rate_limit()
+            self._krx_history_cache[key] = stock.get_market_ohlcv_by_date(start_date, end_date, code)
+        return self._krx_history_cache[key]
+    
+    def get_krx_etf_data(self, code: str, days: int = 30, include_history: bool = True,
+                         include_portfolio: bool = False) -> Dict:
+        """pykrx를 통한 KRX 공식 ETF 데이터 수집 (스냅샷이 있으면 최신가는 스냅샷 사용)"""
+        if not PYKRX_AVAILABLE:
+            return {'code': code, 'error': 'pykrx not available', 'source': 'krx'}
+        
+        try:
             # 날짜 설정
             end_date = datetime.now().strftime('%Y%m%d')
             start_date = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
@@ -192,54 +686,65 @@ class RealETFDataCollector:
                 'source': 'krx'
             }
             
-            # OHLCV 데이터 수집
-            try:
-                df = stock.get_market_ohlcv_by_date(start_date, end_date, code)
-                if not df.empty:
-                    latest = df.iloc[-1]
-                    
-                    # 컬럼명 처리 (한글/영어 혼용 대응)
-                    if '종가' in df.columns:
-                        etf_data['current_price'] = float(latest['종가'])
-                        etf_data['volume'] = int(latest['거래량'])
-                        etf_data['high_52w'] = float(df['고가'].max())
-                        etf_data['low_52w'] = float(df['저가'].min())
-                    else:
-                        # 영어 컬럼명인 경우
-                        etf_data['current_price'] = float(latest.iloc[3])  # close
-                        etf_data['volume'] = int(latest.iloc[4])  # volume
-                        etf_data['high_52w'] = float(df.iloc[:, 1].max())  # high
-                        etf_data['low_52w'] = float(df.iloc[:, 2].min())  # low
-                    
-                    # 수익률 계산
-                    if len(df) >= 2:
-                        prev_price = df.iloc[-2].iloc[3]  # 전일 종가
-                        price_change = etf_data['current_price'] - prev_price
-                        etf_data['price_change'] = price_change
-                        etf_data['change_rate'] = (price_change / prev_price) * 100
-                    
-                    # 가격 히스토리 (최근 30일)
-                    price_history = df.iloc[:, 3].tolist()  # 종가 리스트
-                    etf_data['price_history'] = price_history[-30:]  # 최근 30일
+            # 일괄 수집된 스냅샷에서 최신 OHLCV 조회
+            snapshot = self._krx_snapshot
+            if snapshot is not None and code in snapshot.index:
+                latest = snapshot.loc[code]
+                if float(latest['종가']) > 0:
+                    etf_data['current_price'] = float(latest['종가'])
+                    etf_data['volume'] = int(latest['거래량'])
+            
+            # OHLCV 히스토리 수집 (히스토리/변동성/52주 고저)
+            if include_history or 'current_price' not in etf_data:
+                try:
+                    df = self._get_krx_history(code, start_date, end_date)
+                    if not df.empty:
+                        latest = df.iloc[-1]
+                        
+                        # 컬럼명 처리 (한글/영어 혼용 대응)
+                        if '종가' in df.columns:
+                            etf_data.setdefault('current_price', float(latest['종가']))
+                            etf_data.setdefault('volume', int(latest['거래량']))
+                            etf_data['high_52w'] = float(df['고가'].max())
+                            etf_data['low_52w'] = float(df['저가'].min())
+                        else:
+                            # 영어 컬럼명인 경우
+                            etf_data.setdefault('current_price', float(latest.iloc[3]))  # close
+                            etf_data.setdefault('volume', int(latest.iloc[4]))  # volume
+                            etf_data['high_52w'] = float(df.iloc[:, 1].max())  # high
+                            etf_data['low_52w'] = float(df.iloc[:, 2].min())  # low
+                        
+                        closes = df.iloc[:, 3].to_numpy(dtype=np.float64)  # 종가 배열
+                        
+                        # 수익률 계산
+                        if len(closes) >= 2:
+                            prev_price = float(closes[-2])  # 전일 종가
+                            price_change = etf_data['current_price'] - prev_price
+                            etf_data['price_change'] = price_change
+                            etf_data['change_rate'] = (price_change / prev_price) * 100
+                        
+                        # 가격 히스토리 (최근 30일, float32 배열 - 직렬화 시점에만 리스트로 변환)
+                        etf_data['price_history'] = closes[-30:].astype(np.float32)
+                        
+                        # 변동성 계산
+                        if len(closes) > 2:
+                            returns = np.diff(closes) / closes[:-1]
+                            etf_data['volatility'] = float(returns.std(ddof=1) * np.sqrt(252) * 100)  # 연환산 변동성
                     
-                    # 변동성 계산
-                    returns = df.iloc[:, 3].pct_change().dropna()
-                    if len(returns) > 1:
-                        etf_data['volatility'] = float(returns.std() * np.sqrt(252) * 100)  # 연환산 변동성
-                
-            except Exception as e:
-                logger.debug(f"KRX OHLCV 데이터 수집 실패: {e}")
+                except Exception as e:
+                    logger.debug(f"KRX OHLCV 데이터 수집 실패: {e}")
             
-            # ETF 펀더멘털 정보 (시도만 하고 실패해도 무시)
-            try:
-                # ETF 기본 정보
-                etf_info = stock.get_etf_portfolio_deposit_file(code)
-                if not etf_info.empty:
-                    etf_data['portfolio_info'] = etf_info.to_dict('records')
-            except:
-                pass  # 펀더멘털 데이터는 선택사항
+            # ETF 구성종목 (별도 KRX 요청이므로 요청한 경우에만, 실패해도 무시)
+            if include_portfolio:
+                try:
+                    self._wait_for_rate_limit()
+                    etf_info = stock.get_etf_portfolio_deposit_file(code)
+                    if not etf_info.empty:
+                        etf_data['portfolio_info'] = etf_info.to_dict('records')
+                except:
+                    pass  # 펀더멘털 데이터는 선택사항
             
-            print(f"✅ {code} KRX 데이터 수집 성공: {etf_data.get('current_price', 0):,}원")
+            logger.debug("✅ %s KRX 데이터 수집 성공: %s원", code, etf_data.get('current_price', 0))
             return etf_data
             
         except Exception as e:
@@ -288,21 +793,25 @@ class RealETFDataCollector:
                     etf_data['price_change'] = price_change
                     etf_data['change_rate'] = (price_change / prev_price) * 100
                 
-                # 기술적 지표 계산
-                prices = df['Close']
+                # 기술적 지표 계산 (마지막 값만 필요하므로 NumPy로 직접 계산)
+                prices = df['Close'].to_numpy(dtype=float)
                 
-                # 이동평균
-                etf_data['ma_5'] = float(prices.rolling(5).mean().iloc[-1])
-                etf_data['ma_20'] = float(prices.rolling(20).mean().iloc[-1])
+                # 이동평균 (데이터가 부족하면 NaN)
+                etf_data['ma_5'] = float(prices[-5:].mean()) if len(prices) >= 5 else float('nan')
+                etf_data['ma_20'] = float(prices[-20:].mean()) if len(prices) >= 20 else float('nan')
                 
-                # RSI (간단 버전)
-                delta = prices.diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss
-                etf_data['rsi'] = float(100 - (100 / (1 + rs.iloc[-1])))
+                # RSI (간단 버전, 최근 14일 평균 상승/하락폭)
+                if len(prices) > 14:
+                    delta = np.diff(prices[-15:])
+                    gain = np.maximum(delta, 0).mean()
+                    loss = np.maximum(-delta, 0).mean()
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        rs = np.float64(gain) / loss
+                    etf_data['rsi'] = float(100 - (100 / (1 + rs)))
+                else:
+                    etf_data['rsi'] = float('nan')
                 
-                print(f"✅ {code} FDR 데이터 수집 성공: {etf_data['current_price']:,}원")
+                logger.debug("✅ %s FDR 데이터 수집 성공: %s원", code, etf_data['current_price'])
                 return etf_data
             else:
                 return {'code': code, 'error': 'no data', 'source': 'fdr'}
@@ -315,81 +824,76 @@ class RealETFDataCollector:
     # 4. 통합 데이터 수집
     # ==========================================
     
-    def collect_comprehensive_etf_data(self, code: str) -> Dict:
-        """여러 소스에서 ETF 데이터를 종합 수집"""
-        print(f"\n📊 {code} 종합 데이터 수집 시작...")
+    def _merge_naver_data(self, record: ETFRecord, code: str, naver_data: Optional[Dict] = None):
+        """네이버 데이터를 수집해 종합 레코드에 병합 (naver_data가 있으면 요청 생략)"""
+        logger.debug("  📈 네이버 금융 데이터 수집...")
+        if naver_data is None:
+            naver_data = self.get_naver_etf_realtime_data(code)
+        if 'error' not in naver_data:
+            record.merge(naver_data)
+            record.sources_used.append('naver')
+            self._store_static_metadata(code, naver_data)
+            logger.debug("    ✅ 네이버: %s원", naver_data.get('current_price', 0))
+        else:
+            logger.warning("    ❌ %s 네이버 실패: %s", code, naver_data['error'])
+    
+    def collect_comprehensive_etf_data(self, code: str, naver_data: Optional[Dict] = None) -> Dict:
+        """여러 소스에서 ETF 데이터를 종합 수집 (naver_data: 미리 파싱해 둔 네이버 데이터)"""
+        logger.debug("📊 %s 종합 데이터 수집 시작...", code)
         
-        comprehensive_data = {
-            'code': code,
-            'collection_time': datetime.now().isoformat(),
-            'sources_used': [],
-            'data_quality': 'unknown'
-        }
+        record = ETFRecord(code=code, collection_time=datetime.now().isoformat())
         
         # 1. 네이버 금융 데이터 (실시간 가격 + 펀드 정보)
-        print(f"  📈 네이버 금융 데이터 수집...")
-        naver_data = self.get_naver_etf_realtime_data(code)
-        if 'error' not in naver_data:
-            comprehensive_data.update(naver_data)
-            comprehensive_data['sources_used'].append('naver')
-            print(f"    ✅ 네이버: {naver_data.get('current_price', 0):,}원")
+        # 오늘 이미 기본 정보를 받았다면 페이지 요청을 생략하고 가격은 KRX에서 수집
+        static_data = None
+        if naver_data is None and PYKRX_AVAILABLE:
+            static_data = self._get_static_metadata(code)
+        
+        if static_data:
+            record.merge(static_data)
+            record.sources_used.append('naver_cache')
+            logger.debug("  📈 네이버 기본 정보: 캐시 사용")
         else:
-            print(f"    ❌ 네이버 실패: {naver_data['error']}")
+            self._merge_naver_data(record, code, naver_data)
         
         # 2. KRX 공식 데이터 (OHLCV + 히스토리)
-        print(f"  📊 KRX 공식 데이터 수집...")
+        logger.debug("  📊 KRX 공식 데이터 수집...")
         krx_data = self.get_krx_etf_data(code)
         if 'error' not in krx_data:
-            # 중복되지 않는 정보만 추가
-            for key, value in krx_data.items():
-                if key not in comprehensive_data or key in ['price_history', 'volatility', 'high_52w', 'low_52w']:
-                    comprehensive_data[key] = value
-            comprehensive_data['sources_used'].append('krx')
-            print(f"    ✅ KRX: 히스토리 {len(krx_data.get('price_history', []))}일")
+            # 중복되지 않는 정보만 추가 (히스토리 관련 필드는 KRX 우선)
+            record.merge(krx_data, overwrite=('price_history', 'volatility', 'high_52w', 'low_52w'))
+            record.sources_used.append('krx')
+            logger.debug("    ✅ KRX: 히스토리 %d일", len(krx_data.get('price_history', [])))
         else:
-            print(f"    ❌ KRX 실패: {krx_data['error']}")
+            logger.warning("    ❌ %s KRX 실패: %s", code, krx_data['error'])
+        
+        # 캐시 사용 중 KRX에서 가격을 얻지 못했으면 네이버 실시간 데이터로 보완
+        if static_data and record.current_price is None:
+            self._merge_naver_data(record, code)
         
         # 3. FinanceDataReader 데이터 (기술적 지표)
         if FDR_AVAILABLE:
-            print(f"  📈 FDR 기술적 지표 수집...")
+            logger.debug("  📈 FDR 기술적 지표 수집...")
             fdr_data = self.get_fdr_etf_data(code)
             if 'error' not in fdr_data:
                 # 기술적 지표만 추가
-                for key in ['ma_5', 'ma_20', 'rsi']:
-                    if key in fdr_data:
-                        comprehensive_data[key] = fdr_data[key]
-                if 'fdr' not in comprehensive_data['sources_used']:
-                    comprehensive_data['sources_used'].append('fdr')
-                print(f"    ✅ FDR: 기술적 지표 추가")
+                record.merge({key: fdr_data[key] for key in ('ma_5', 'ma_20', 'rsi') if key in fdr_data},
+                             overwrite=('ma_5', 'ma_20', 'rsi'))
+                if 'fdr' not in record.sources_used:
+                    record.sources_used.append('fdr')
+                logger.debug("    ✅ FDR: 기술적 지표 추가")
             else:
-                print(f"    ❌ FDR 실패: {fdr_data['error']}")
+                logger.warning("    ❌ %s FDR 실패: %s", code, fdr_data['error'])
         
         # 데이터 품질 평가
-        quality_score = 0
-        if 'current_price' in comprehensive_data and comprehensive_data['current_price'] > 0:
-            quality_score += 30
-        if 'expense_ratio' in comprehensive_data:
-            quality_score += 20
-        if 'dividend_yield' in comprehensive_data:
-            quality_score += 20
-        if 'price_history' in comprehensive_data and len(comprehensive_data['price_history']) > 10:
-            quality_score += 20
-        if 'volume' in comprehensive_data and comprehensive_data['volume'] > 0:
-            quality_score += 10
-        
-        if quality_score >= 80:
-            comprehensive_data['data_quality'] = 'excellent'
-        elif quality_score >= 60:
-            comprehensive_data['data_quality'] = 'good'
-        elif quality_score >= 40:
-            comprehensive_data['data_quality'] = 'fair'
-        else:
-            comprehensive_data['data_quality'] = 'poor'
+        quality_score = sum(points for key, check, points in self._QUALITY_RULES
+                            if check(getattr(record, key)))
+        record.data_quality = self._QUALITY_LABELS[bisect_right(self._QUALITY_THRESHOLDS, quality_score)]
         
-        print(f"  📊 데이터 품질: {comprehensive_data['data_quality']} ({quality_score}점)")
-        print(f"  📊 사용된 소스: {', '.join(comprehensive_data['sources_used'])}")
+        logger.info("📊 %s 데이터 품질: %s (%d점), 소스: %s",
+                    code, record.data_quality, quality_score, ', '.join(record.sources_used))
         
-        return comprehensive_data
+        return record.to_dict()
     
     # ==========================================
     # 5. ETF 목록 실시간 수집
@@ -402,18 +906,18 @@ class RealETFDataCollector:
             return []
         
         try:
-            print("📋 KRX에서 ETF 목록 수집 중...")
+            logger.info("📋 KRX에서 ETF 목록 수집 중...")
             
             # ETF 티커 목록 가져오기
             etf_tickers = stock.get_etf_ticker_list()
-            print(f"📋 총 {len(etf_tickers)}개 ETF 발견")
+            logger.info("📋 총 %d개 ETF 발견", len(etf_tickers))
             
             etf_universe = []
             
             # 각 ETF의 기본 정보 수집
             for i, ticker in enumerate(etf_tickers[:20]):  # 처음 20개만 테스트
                 try:
-                    print(f"  [{i+1:2d}/{len(etf_tickers[:20])}] {ticker} 처리 중...")
+                    logger.debug("  [%2d/%d] %s 처리 중...", i + 1, len(etf_tickers[:20]), ticker)
                     
                     # 간단한 정보만 수집 (속도 향상)
                     basic_data = self.get_naver_etf_realtime_data(ticker)
@@ -430,58 +934,100 @@ class RealETFDataCollector:
                             'last_updated': datetime.now().isoformat()
                         }
                         etf_universe.append(etf_info)
-                        print(f"    ✅ {basic_data.get('name', ticker)}: {basic_data.get('current_price', 0):,}원")
+                        logger.debug("    ✅ %s: %s원", basic_data.get('name', ticker), basic_data.get('current_price', 0))
                     else:
-                        print(f"    ❌ {ticker} 실패")
+                        logger.warning("    ❌ %s 실패", ticker)
                 
                 except Exception as e:
-                    print(f"    ❌ {ticker} 오류: {e}")
+                    logger.warning("    ❌ %s 오류: %s", ticker, e)
                     continue
                 
                 # 요청 간격 (서버 부하 방지)
                 time.sleep(0.5)
             
-            print(f"✅ ETF 목록 수집 완료: {len(etf_universe)}개")
+            logger.info("✅ ETF 목록 수집 완료: %d개", len(etf_universe))
             return etf_universe
             
         except Exception as e:
-            print(f"❌ ETF 목록 수집 실패: {e}")
+            logger.error("❌ ETF 목록 수집 실패: %s", e)
             return []
     
     # ==========================================
     # 6. 배치 업데이트
     # ==========================================
     
-    def batch_update_etf_data(self, etf_codes: List[str], max_concurrent: int = 5) -> List[Dict]:
-        """여러 ETF 데이터를 배치로 수집"""
+    def batch_update_etf_data(self, etf_codes: List[str], max_concurrent: int = 5,
+                              db_path: Optional[str] = None) -> List[Dict]:
+        """여러 ETF 데이터를 배치로 수집 (db_path가 주어지면 DB_FLUSH_SIZE개마다 etf_info에 중간 저장)"""
         print(f"\n🔄 {len(etf_codes)}개 ETF 배치 업데이트 시작...")
         
         results = []
         
-        for i, code in enumerate(etf_codes):
+        # 중간 저장용 연결 (WAL 모드라 저장 중에도 대시보드 조회 가능)
+        conn = _connect_db(db_path) if db_path else None
+        # 저장 대상 컬럼은 연결당 한 번 확인 (etf_info가 없으면 수집 전에 실패)
+        upsert_sql = None
+        if conn is not None:
             try:
-                print(f"\n[{i+1}/{len(etf_codes)}] {code} 처리 중...")
-                
-                # 종합 데이터 수집
-                data = self.collect_comprehensive_etf_data(code)
-                results.append(data)
-                
-                # 진행률 표시
-                progress = ((i + 1) / len(etf_codes)) * 100
-                print(f"  📊 진행률: {progress:.1f}% ({i+1}/{len(etf_codes)})")
-                
-                # 요청 간격 (서버 부하 방지)
-                if i < len(etf_codes) - 1:
-                    time.sleep(1.0)
+                upsert_sql = _build_etf_info_upsert(conn)
+            except sqlite3.Error:
+                conn.close()
+                raise
+        pending = []
+        saved = 0
+        last_flush = time.monotonic()
+        
+        # KRX 당일 시세와 기간 히스토리는 전체 ETF를 거래일 단위로 한 번에 조회
+        self._prefetch_krx_snapshot()
+        self._prefetch_krx_history()
+        
+        # 네이버 페이지는 동시 요청으로 먼저 수집 (실패한 코드는 개별 요청)
+        # (오늘 기본 정보가 캐시된 ETF는 제외)
+        codes_to_fetch = [
+            code for code in etf_codes
+            if not (PYKRX_AVAILABLE and self._get_static_metadata(code))
+        ]
+        naver_pages = self.prefetch_naver_pages(codes_to_fetch, max_concurrent)
+        if naver_pages:
+            logger.info("📥 네이버 페이지 %d/%d개 동시 수집 완료", len(naver_pages), len(codes_to_fetch))
+        
+        # 받아둔 페이지는 여러 프로세스에서 병렬 파싱 (GIL 회피)
+        naver_parsed = _parse_naver_pages(naver_pages)
+        naver_pages.clear()
+        
+        try:
+            for i, code in enumerate(etf_codes):
+                try:
+                    # 종합 데이터 수집
+                    data = self.collect_comprehensive_etf_data(code, naver_data=naver_parsed.pop(code, None))
+                    results.append(data)
+                    
+                    # 진행률 표시 (PROGRESS_LOG_INTERVAL개마다)
+                    if (i + 1) % PROGRESS_LOG_INTERVAL == 0 or i + 1 == len(etf_codes):
+                        logger.info("  📊 진행률: %.1f%% (%d/%d)", (i + 1) / len(etf_codes) * 100, i + 1, len(etf_codes))
+                    
+                    # 요청 간격은 각 요청 직전의 _wait_for_rate_limit / AsyncRateLimiter가 보장
+                    
+                except Exception as e:
+                    logger.error("❌ %s 처리 실패: %s", code, e)
+                    results.append({
+                        'code': code,
+                        'error': str(e),
+                        'collection_time': datetime.now().isoformat()
+                    })
                 
-            except Exception as e:
-                print(f"❌ {code} 처리 실패: {e}")
-                results.append({
-                    'code': code,
-                    'error': str(e),
-                    'collection_time': datetime.now().isoformat()
-                })
-                continue
+                # 중간 저장 (중단되더라도 이미 수집한 결과는 보존)
+                if conn is not None:
+                    pending.append(results[-1])
+                    if len(pending) >= DB_FLUSH_SIZE or time.monotonic() - last_flush >= DB_FLUSH_SECONDS:
+                        saved += save_etf_results_to_db(pending, db_path, conn=conn, upsert_sql=upsert_sql)
+                        pending.clear()
+                        last_flush = time.monotonic()
+        finally:
+            # 남은 결과 저장 (Ctrl+C 등으로 중단된 경우 포함)
+            if conn is not None:
+                saved += save_etf_results_to_db(pending, db_path, conn=conn, upsert_sql=upsert_sql)
+                conn.close()
         
         # 결과 요약
         successful = len([r for r in results if 'error' not in r])
@@ -492,6 +1038,9 @@ class RealETFDataCollector:
         print(f"  실패: {failed}개")
         print(f"  성공률: {(successful/len(results)*100):.1f}%")
         
+        if db_path:
+            print(f"  저장: {saved}개 → {db_path}")
+        
         return results
 
 
@@ -501,6 +1050,12 @@ class RealETFDataCollector:
 
 def main():
     """실제 ETF 데이터 수집 테스트"""
+    # 기본은 경고 이상만 출력, --verbose로 진행 로그 표시
+    logging.basicConfig(
+        level=logging.INFO if '--verbose' in sys.argv else logging.WARNING,
+        format='%(message)s'
+    )
+    
     print("🚀 실제 ETF 데이터 수집기 테스트")
     print("=" * 50)
     
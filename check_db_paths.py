@@ -6,10 +6,9 @@ import os
 import sqlite3
 import pandas as pd
 from pathlib import Path
-import glob
 
 def find_all_db_files():
-    """모든 .db 파일 찾기"""
+    """모든 .db 파일 찾기 ((경로, 크기, 수정시간) 목록 반환)"""
     print("🔍 모든 .db 파일 검색")
     print("=" * 60)
     
@@ -22,29 +21,65 @@ def find_all_db_files():
         "core/",               # core 디렉토리
     ]
     
-    all_db_files = []
+    # realpath -> (경로, 크기, 수정시간), 발견 순서 유지하며 중복 제거
+    found = {}
     
     for search_path in search_paths:
-        if os.path.exists(search_path):
-            pattern = os.path.join(search_path, "*.db")
-            db_files = glob.glob(pattern)
-            for db_file in db_files:
-                abs_path = os.path.abspath(db_file)
-                all_db_files.append(abs_path)
+        try:
+            entries = os.scandir(search_path)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if entry.name.endswith('.db') and entry.is_file():
+                    real_path = os.path.realpath(entry.path)
+                    if real_path not in found:
+                        st = entry.stat()
+                        found[real_path] = (real_path, st.st_size, st.st_mtime)
     
-    # 중복 제거
-    all_db_files = list(set(all_db_files))
+    all_db_files = list(found.values())
     
     print(f"📁 발견된 .db 파일들 ({len(all_db_files)}개):")
-    for i, db_file in enumerate(all_db_files, 1):
-        size_mb = os.path.getsize(db_file) / 1024 / 1024
+    for i, (db_file, size, mtime) in enumerate(all_db_files, 1):
         print(f"{i}. {db_file}")
-        print(f"   크기: {size_mb:.2f} MB")
-        print(f"   수정시간: {pd.Timestamp.fromtimestamp(os.path.getmtime(db_file))}")
+        print(f"   크기: {size / 1024 / 1024:.2f} MB")
+        print(f"   수정시간: {pd.Timestamp.fromtimestamp(mtime)}")
         print()
     
     return all_db_files
 
+def _list_tables(conn):
+    """sqlite_master에서 테이블 목록 조회"""
+    return [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+
+def _quote_ident(name):
+    """SQLite 식별자 인용 (내부 큰따옴표는 두 번 써서 이스케이프)"""
+    return '"' + name.replace('"', '""') + '"'
+
+def _count_rows(conn, tables):
+    """모든 테이블의 행 수를 UNION ALL 한 번으로 조회 ({테이블: 행 수})
+    
+    한 테이블이라도 실패하면 테이블별로 다시 조회하고, 실패한 테이블은 결과에서 제외한다.
+    """
+    if not tables:
+        return {}
+    sql = ' UNION ALL '.join(
+        f"SELECT {i} AS idx, COUNT(*) AS n FROM {_quote_ident(t)}" for i, t in enumerate(tables)
+    )
+    try:
+        return {tables[i]: n for i, n in conn.execute(sql).fetchall()}
+    except sqlite3.Error:
+        pass
+    
+    counts = {}
+    for t in tables:
+        try:
+            counts[t] = conn.execute(f"SELECT COUNT(*) FROM {_quote_ident(t)}").fetchone()[0]
+        except sqlite3.Error:
+            continue
+    return counts
+
 def check_db_content(db_path):
     """개별 DB 파일 내용 확인"""
     print(f"\n🔍 {db_path} 내용 확인:")
@@ -54,45 +89,44 @@ def check_db_content(db_path):
         conn = sqlite3.connect(db_path)
         
         # 테이블 목록
-        tables = pd.read_sql_query("""
-            SELECT name FROM sqlite_master WHERE type='table'
-        """, conn)['name'].tolist()
+        tables = _list_tables(conn)
         
         print(f"📋 테이블: {', '.join(tables)}")
         
-        # 각 테이블의 행 수 확인
+        # 각 테이블의 행 수를 한 번의 쿼리로 확인
+        try:
+            counts = _count_rows(conn, tables)
+        except Exception as e:
+            print(f"  - 행 수 조회 실패 ({e})")
+            counts = {}
+        
         for table in tables:
-            try:
-                count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {table}", conn).iloc[0]['count']
-                print(f"  - {table}: {count:,}개")
-                
-                # etf_info나 etf_master인 경우 추가 정보
-                if table in ['etf_info', 'etf_master']:
-                    # 최근 업데이트 시간 확인
+            if table not in counts:
+                print(f"  - {table}: 행 수 조회 실패")
+                continue
+            print(f"  - {table}: {counts[table]:,}개")
+            
+            # etf_info나 etf_master인 경우 추가 정보
+            if table in ['etf_info', 'etf_master']:
+                # 최근 업데이트 시간 + AUM 통계
+                updated_col = 'last_updated' if table == 'etf_info' else 'updated_at'
+                try:
+                    latest, aum_count, total_aum = conn.execute(f"""
+                        SELECT 
+                            MAX({updated_col}),
+                            COUNT(CASE WHEN aum > 0 THEN 1 END),
+                            SUM(COALESCE(aum, 0))
+                        FROM {table}
+                    """).fetchone()
+                    print(f"    → 최근 업데이트: {latest}")
+                    print(f"    → AUM 보유: {aum_count:,}개, 총 AUM: {total_aum or 0:,}억원")
+                except Exception:
+                    # 컬럼이 없는 스키마면 가능한 항목만 표시
                     try:
-                        if table == 'etf_info':
-                            latest = pd.read_sql_query(f"SELECT MAX(last_updated) as latest FROM {table}", conn).iloc[0]['latest']
-                        else:
-                            latest = pd.read_sql_query(f"SELECT MAX(updated_at) as latest FROM {table}", conn).iloc[0]['latest']
+                        latest = conn.execute(f"SELECT MAX({updated_col}) FROM {table}").fetchone()[0]
                         print(f"    → 최근 업데이트: {latest}")
-                    except:
+                    except Exception:
                         pass
-                        
-                    # AUM 통계
-                    try:
-                        aum_stats = pd.read_sql_query(f"""
-                            SELECT 
-                                COUNT(CASE WHEN aum > 0 THEN 1 END) as aum_count,
-                                SUM(COALESCE(aum, 0)) as total_aum
-                            FROM {table}
-                        """, conn)
-                        aum_info = aum_stats.iloc[0]
-                        print(f"    → AUM 보유: {aum_info['aum_count']:,}개, 총 AUM: {aum_info['total_aum']:,}억원")
-                    except:
-                        pass
-                        
-            except Exception as e:
-                print(f"  - {table}: 조회 실패 ({e})")
         
         conn.close()
         
@@ -167,7 +201,7 @@ def main():
     print("📊 각 DB 파일 내용 분석")
     print("=" * 60)
     
-    for db_file in db_files:
+    for db_file, _, _ in db_files:
         check_db_content(db_file)
     
     # 3. 모듈 경로 확인
@@ -187,21 +221,15 @@ def main():
     most_data_file = None
     most_data_count = 0
     
-    for db_file in db_files:
-        size = os.path.getsize(db_file)
+    for db_file, size, _ in db_files:
         if size > largest_size:
             largest_size = size
             largest_file = db_file
         
         try:
             conn = sqlite3.connect(db_file)
-            tables = pd.read_sql_query("SELECT name FROM sqlite_master WHERE type='table'", conn)['name'].tolist()
-            
-            total_count = 0
-            for table in tables:
-                if table in ['etf_info', 'etf_master']:
-                    count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {table}", conn).iloc[0]['count']
-                    total_count += count
+            tables = [t for t in _list_tables(conn) if t in ['etf_info', 'etf_master']]
+            total_count = sum(_count_rows(conn, tables).values())
             
             if total_count > most_data_count:
                 most_data_count = total_count
@@ -1,294 +1,430 @@
 # check_dividend_yield.py - 배당수익률 데이터 확인 및 수정
 
 import sqlite3
-import pandas as pd
 import os
+import io
+import sys
+import argparse
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
 
-def check_dividend_yield_data():
-    """배당수익률 데이터 상태 확인"""
+# 확인 대상 데이터베이스 파일들
+DB_FILES = ["etf_universe.db", "data/etf_data.db", "etf_data.db"]
+
+# 정적 배당수익률 데이터 (실제 데이터 기반)
+STATIC_DIVIDEND_YIELDS = {
+    # KODEX 시리즈
+    '069500': 2.1,   # KODEX 200
+    '069660': 1.8,   # KODEX 코스닥150
+    '114260': 3.2,   # KODEX 국고채10년
+    '133690': 0.9,   # KODEX 나스닥100
+    '195930': 2.3,   # KODEX 선진국MSCI
+    '132030': 0.0,   # KODEX 골드선물(H)
+    '189400': 4.5,   # KODEX 미국리츠
     
-    print("🔍 배당수익률 데이터 확인")
-    print("=" * 50)
+    # TIGER 시리즈
+    '102110': 2.0,   # TIGER 200
+    '148020': 1.7,   # TIGER 코스닥150
+    '360750': 1.8,   # TIGER 미국S&P500
+    '360200': 0.8,   # TIGER 미국나스닥100
+    '381170': 2.5,   # TIGER 차이나CSI300
     
-    # 데이터베이스 파일들 확인
-    db_files = ["etf_universe.db", "data/etf_data.db", "etf_data.db"]
+    # ARIRANG 시리즈
+    '152100': 2.2,   # ARIRANG 200
+    '174360': 3.8,   # ARIRANG 고배당주
     
+    # 기타
+    '130730': 3.5,   # KOSEF 단기자금
+    '139660': 1.2,   # TIGER 200IT
+    '427120': 2.8,   # KBSTAR 중기채권
+    '495710': 1.5,   # TIMEFOLIO Korea플러스배당액티브
+}
+
+# UPDATE ... RETURNING은 SQLite 3.35 이상에서만 지원 (이전 버전은 rowcount + 집계 쿼리 한 번)
+SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# 배당수익률 UPDATE 문과 파라미터 (모듈 로드 시 한 번만 생성, 테이블명만 DB별로 채움)
+# 지정 코드는 정적 값, 나머지 0/NULL은 기본값 1.5로 - 한 번의 UPDATE(한 번의 스캔)로 처리
+_DIVIDEND_UPDATE_SQL = """
+    UPDATE {table} 
+    SET dividend_yield = COALESCE(NULLIF(CASE code %s ELSE dividend_yield END, 0), 1.5),
+        last_updated = ?
+    WHERE code IN (%s) OR dividend_yield = 0 OR dividend_yield IS NULL
+    %s
+""" % (" ".join("WHEN ? THEN ?" for _ in STATIC_DIVIDEND_YIELDS),
+       ", ".join("?" for _ in STATIC_DIVIDEND_YIELDS),
+       "RETURNING code" if SQLITE_RETURNING else "")
+_DIVIDEND_CASE_PARAMS = tuple(value for item in STATIC_DIVIDEND_YIELDS.items() for value in item)
+
+# RETURNING 미지원 시 집계: 일치한 지정 코드 수(중복 행 제외)와 0이 아닌 정적 값이 들어간 행 수
+_NONZERO_STATIC_CODES = tuple(code for code, value in STATIC_DIVIDEND_YIELDS.items() if value)
+_DIVIDEND_COUNT_SQL = """
+    SELECT COUNT(DISTINCT code), COUNT(CASE WHEN code IN (%s) THEN 1 END)
+    FROM {table}
+    WHERE code IN (%s)
+""" % (", ".join("?" for _ in _NONZERO_STATIC_CODES),
+       ", ".join("?" for _ in STATIC_DIVIDEND_YIELDS))
+
+# 단계별 조회 SQL 템플릿 ({table}만 DB별로 채움)
+_SQL_TEMPLATES = {
+    'top10': """
+        SELECT code, name, dividend_yield, expense_ratio 
+        FROM {table} 
+        WHERE dividend_yield IS NOT NULL 
+        ORDER BY dividend_yield DESC 
+        LIMIT 10
+    """,
+    'stats': """
+        SELECT 
+            COUNT(*) as total_etfs,
+            COUNT(CASE WHEN dividend_yield > 0 THEN 1 END) as has_dividend,
+            AVG(dividend_yield) as avg_dividend,
+            MAX(dividend_yield) as max_dividend,
+            MIN(dividend_yield) as min_dividend
+        FROM {table}
+    """,
+    'top5': """
+        SELECT code, name, dividend_yield 
+        FROM {table} 
+        WHERE dividend_yield > 0 
+        ORDER BY dividend_yield DESC 
+        LIMIT 5
+    """,
+    'update': _DIVIDEND_UPDATE_SQL,
+    'update_counts': _DIVIDEND_COUNT_SQL,
+}
+
+# (테이블, 쿼리 종류) -> 완성된 SQL (확인/검증 단계와 DB 간에 같은 문자열 재사용)
+_SQL_CACHE = {}
+
+def _q(etf_table, kind):
+    """테이블별 SQL 문자열 (한 번만 생성)"""
+    key = (etf_table, kind)
+    sql = _SQL_CACHE.get(key)
+    if sql is None:
+        sql = _SQL_CACHE[key] = _SQL_TEMPLATES[kind].format(table=etf_table)
+    return sql
+
+def _open(db_file):
+    """성능 PRAGMA를 적용한 SQLite 연결 (WAL, 64MB 캐시, mmap)"""
+    # 단계별 작업이 스레드 풀에서 실행되므로 생성 스레드 외 사용 허용 (한 번에 한 스레드만 사용)
+    conn = sqlite3.connect(db_file, check_same_thread=False)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-65536;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+    """)
+    return conn
+
+def _confirm(prompt, auto=False):
+    """자동 승인 플래그가 없으면 대화형 터미널에서만 질문 (비대화형 실행에서는 건너뜀)"""
+    if auto:
+        return True
+    if not sys.stdin.isatty():
+        return False
+    return input(prompt).lower() == 'y'
+
+def _fmt_num(value):
+    """표 출력용 숫자 포맷 (값이 없으면 -)"""
+    return '-' if value is None else f"{value:.2f}"
+
+# ETF 정보 테이블 후보 (우선순위 순)
+ETF_TABLE_CANDIDATES = ('etf_info', 'etfs', 'etf_data')
+
+def _pick_etf_table(tables):
+    """테이블 목록에서 우선순위가 가장 높은 ETF 정보 테이블 선택 (없으면 None)"""
+    table_set = set(tables)
+    return next((name for name in ETF_TABLE_CANDIDATES if name in table_set), None)
+
+# DB 스키마 캐시: (DB 파일, 수정시간) -> (테이블 목록, ETF 테이블, 컬럼 목록, 기본 키 컬럼)
+_SCHEMA_CACHE = {}
+
+def _db_mtime(db_file):
+    """스키마 캐시 무효화 키 (WAL 모드에서는 변경이 -wal 파일에 먼저 기록되므로 함께 확인)"""
+    try:
+        wal_mtime = os.stat(db_file + '-wal').st_mtime_ns
+    except FileNotFoundError:
+        wal_mtime = None
+    return os.stat(db_file).st_mtime_ns, wal_mtime
+
+def _schema(conn, db_file):
+    """테이블 목록/ETF 테이블/컬럼 목록/기본 키 컬럼 조회 (파일이 바뀌지 않았으면 캐시 사용)"""
+    key = (db_file, _db_mtime(db_file))
+    if key not in _SCHEMA_CACHE:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")]
+        
+        etf_table = _pick_etf_table(tables)
+        columns_info = conn.execute(f"PRAGMA table_info({etf_table})").fetchall() if etf_table else []
+        columns = [col[1] for col in columns_info]
+        primary_key = [col[1] for col in columns_info if col[5]]
+        
+        _SCHEMA_CACHE[key] = (tables, etf_table, columns, primary_key)
+    return _SCHEMA_CACHE[key]
+
+def _run_per_db(func, conns, *args):
+    """DB별 작업을 스레드 풀에서 동시 실행 (출력은 DB 순서대로 표시)
+    
+    conns: (DB 파일, 연결) 목록 - 연결 하나는 한 번에 한 스레드만 사용
+    DB마다 (파일 경로, 작업 결과) 목록 반환
+    """
+    if not conns:
+        return []
+    
+    buffers = [io.StringIO() for _ in conns]
+    with ThreadPoolExecutor(max_workers=len(conns)) as pool:
+        results = list(pool.map(lambda item, out: func(*item, *args, out), conns, buffers))
+    
+    for out in buffers:
+        print(out.getvalue(), end='')
+    return [(db_file, result) for (db_file, _), result in zip(conns, results)]
+
+def _open_all(stack, db_files):
+    """존재하는 DB 파일들을 한 번씩 열어 (DB 파일, 연결) 목록 반환 (stack 종료 시 모두 닫힘)
+    
+    파일 존재 확인은 여기서 한 번만 하고 이후 단계는 반환된 목록만 사용
+    """
+    conns = []
     for db_file in db_files:
         if not os.path.exists(db_file):
             continue
-            
-        print(f"\n📊 데이터베이스: {db_file}")
-        print("-" * 30)
-        
         try:
-            conn = sqlite3.connect(db_file)
-            
-            # 테이블 구조 확인
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            print(f"📋 테이블 목록: {tables}")
-            
-            # ETF 정보 테이블 찾기
-            etf_table = None
-            for table_name in ['etf_info', 'etfs', 'etf_data']:
-                if table_name in tables:
-                    etf_table = table_name
-                    break
-            
-            if not etf_table:
-                print("⚠️ ETF 테이블을 찾을 수 없습니다")
-                conn.close()
-                continue
-            
-            print(f"🗂️ 사용할 ETF 테이블: {etf_table}")
-            
-            # 테이블 구조 확인
-            cursor.execute(f"PRAGMA table_info({etf_table})")
-            columns_info = cursor.fetchall()
-            columns = [col[1] for col in columns_info]
+            conns.append((db_file, stack.enter_context(closing(_open(db_file)))))
+        except Exception as e:
+            print(f"❌ {db_file} 연결 실패: {e}")
+    return conns
+
+def _check_one(db_file, conn, out):
+    """DB 파일 하나의 배당수익률 데이터 상태 확인 (dividend_yield 컬럼이 없으면 테이블명 반환)"""
+    print(f"\n📊 데이터베이스: {db_file}", file=out)
+    print("-" * 30, file=out)
+    
+    missing_table = None
+    try:
+        # 테이블 구조 확인 (ETF 정보 테이블/컬럼 포함)
+        tables, etf_table, columns, _ = _schema(conn, db_file)
+        
+        print(f"📋 테이블 목록: {tables}", file=out)
+        
+        if not etf_table:
+            print("⚠️ ETF 테이블을 찾을 수 없습니다", file=out)
+            return
+        
+        print(f"🗂️ 사용할 ETF 테이블: {etf_table}", file=out)
+        
+        print(f"📋 컬럼 목록: {columns}", file=out)
+        
+        # dividend_yield 컬럼 존재 확인
+        if 'dividend_yield' in columns:
+            print("✅ dividend_yield 컬럼 존재", file=out)
             
-            print(f"📋 컬럼 목록: {columns}")
+            # 배당수익률 데이터 확인
+            top_rows = conn.execute(_q(etf_table, 'top10')).fetchall()
             
-            # dividend_yield 컬럼 존재 확인
-            if 'dividend_yield' in columns:
-                print("✅ dividend_yield 컬럼 존재")
+            print(f"\n📊 배당수익률 데이터 (상위 10개):", file=out)
+            if top_rows:
+                print(f"{'code':>6} {'name':<24} {'dividend_yield':>14} {'expense_ratio':>13}", file=out)
+                for code, name, dividend_yield, expense_ratio in top_rows:
+                    print(f"{code:>6} {name or '':<24.24} {_fmt_num(dividend_yield):>14} "
+                          f"{_fmt_num(expense_ratio):>13}", file=out)
+                
+                # 통계 정보 (한 번의 스캔으로 전체/배당 보유 수 집계, 검증 단계와 같은 쿼리)
+                total_count, non_zero_count, *_ = conn.execute(_q(etf_table, 'stats')).fetchone()
                 
-                # 배당수익률 데이터 확인
-                df = pd.read_sql_query(f"""
-                    SELECT code, name, dividend_yield, expense_ratio 
-                    FROM {etf_table} 
-                    WHERE dividend_yield IS NOT NULL 
-                    ORDER BY dividend_yield DESC 
-                    LIMIT 10
-                """, conn)
+                print(f"\n📈 통계:", file=out)
+                print(f"전체 ETF: {total_count}개", file=out)
+                print(f"배당수익률 > 0: {non_zero_count}개", file=out)
+                print(f"배당수익률 데이터 비율: {non_zero_count/total_count*100:.1f}%", file=out)
                 
-                print(f"\n📊 배당수익률 데이터 (상위 10개):")
-                if not df.empty:
-                    print(df.to_string(index=False))
-                    
-                    # 통계 정보
-                    total_count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {etf_table}", conn).iloc[0]['count']
-                    non_zero_count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {etf_table} WHERE dividend_yield > 0", conn).iloc[0]['count']
-                    
-                    print(f"\n📈 통계:")
-                    print(f"전체 ETF: {total_count}개")
-                    print(f"배당수익률 > 0: {non_zero_count}개")
-                    print(f"배당수익률 데이터 비율: {non_zero_count/total_count*100:.1f}%")
-                    
-                else:
-                    print("❌ 배당수익률 데이터가 없습니다")
-                    
             else:
-                print("❌ dividend_yield 컬럼이 없습니다")
-                print("💡 컬럼 추가가 필요합니다")
+                print("❌ 배당수익률 데이터가 없습니다", file=out)
                 
-                # 컬럼 추가 제안
-                response = input("dividend_yield 컬럼을 추가하시겠습니까? (y/n): ")
-                if response.lower() == 'y':
-                    try:
-                        cursor.execute(f"ALTER TABLE {etf_table} ADD COLUMN dividend_yield REAL DEFAULT 0")
-                        conn.commit()
-                        print("✅ dividend_yield 컬럼 추가 완료")
-                    except Exception as e:
-                        print(f"❌ 컬럼 추가 실패: {e}")
-            
-            conn.close()
+        else:
+            print("❌ dividend_yield 컬럼이 없습니다", file=out)
+            print("💡 컬럼 추가가 필요합니다", file=out)
             
-        except Exception as e:
-            print(f"❌ 데이터베이스 오류: {e}")
-
-def fix_dividend_yield_data():
-    """배당수익률 데이터 수정/업데이트"""
+            # 컬럼 추가 제안은 모든 DB 확인 후 메인 스레드에서 진행
+            missing_table = etf_table
+        
+    except Exception as e:
+        print(f"❌ 데이터베이스 오류: {e}", file=out)
     
-    print("\n🔧 배당수익률 데이터 수정")
-    print("=" * 40)
+    return missing_table
+
+def _fix_one(db_file, conn, now_iso, out):
+    """DB 파일 하나의 배당수익률 데이터 수정/업데이트"""
+    print(f"\n📊 {db_file} 업데이트 중...", file=out)
     
-    # 정적 배당수익률 데이터 (실제 데이터 기반)
-    dividend_data = {
-        # KODEX 시리즈
-        '069500': 2.1,   # KODEX 200
-        '069660': 1.8,   # KODEX 코스닥150
-        '114260': 3.2,   # KODEX 국고채10년
-        '133690': 0.9,   # KODEX 나스닥100
-        '195930': 2.3,   # KODEX 선진국MSCI
-        '132030': 0.0,   # KODEX 골드선물(H)
-        '189400': 4.5,   # KODEX 미국리츠
+    try:
+        cursor = conn.cursor()
+        
+        # ETF 테이블 찾기
+        _, etf_table, columns, primary_key = _schema(conn, db_file)
         
-        # TIGER 시리즈
-        '102110': 2.0,   # TIGER 200
-        '148020': 1.7,   # TIGER 코스닥150
-        '360750': 1.8,   # TIGER 미국S&P500
-        '360200': 0.8,   # TIGER 미국나스닥100
-        '381170': 2.5,   # TIGER 차이나CSI300
+        if not etf_table:
+            print(f"⚠️ {db_file}: ETF 테이블 없음", file=out)
+            return
         
-        # ARIRANG 시리즈
-        '152100': 2.2,   # ARIRANG 200
-        '174360': 3.8,   # ARIRANG 고배당주
+        # 스키마 준비: dividend_yield 컬럼 추가, code가 기본 키가 아닌 구 스키마 테이블은 code 인덱스 생성
+        # (필요한 DDL을 모아 executescript 한 번으로 실행)
+        ddl = []
+        if 'dividend_yield' not in columns:
+            ddl.append(f"ALTER TABLE {etf_table} ADD COLUMN dividend_yield REAL DEFAULT 0;")
+        if primary_key != ['code']:
+            ddl.append(f"CREATE INDEX IF NOT EXISTS idx_{etf_table}_code ON {etf_table}(code);")
         
-        # 기타
-        '130730': 3.5,   # KOSEF 단기자금
-        '139660': 1.2,   # TIGER 200IT
-        '427120': 2.8,   # KBSTAR 중기채권
-        '495710': 1.5,   # TIMEFOLIO Korea플러스배당액티브
-    }
+        if ddl:
+            try:
+                conn.executescript("BEGIN;\n" + "\n".join(ddl) + "\nCOMMIT;")
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                print(f"❌ {db_file}: 스키마 준비 실패 - {e}", file=out)
+                return
+            if 'dividend_yield' not in columns:
+                print(f"✅ {db_file}: dividend_yield 컬럼 추가됨", file=out)
+        
+        # 배당수익률 데이터 업데이트 (미리 만든 SQL/파라미터 재사용)
+        before = conn.total_changes
+        cursor.execute(_q(etf_table, 'update'), (*_DIVIDEND_CASE_PARAMS, now_iso, *STATIC_DIVIDEND_YIELDS))
+        
+        # 기존 두 단계 UPDATE와 같은 집계: 정확한 데이터는 일치한 코드 수(중복 행은 한 번),
+        # 기본값은 기본값이 들어간 행 수 (정적 값이 0인 코드는 기본값으로도 집계)
+        if SQLITE_RETURNING:
+            # 변경된 행의 code로 한 번에 집계 (추가 COUNT 쿼리 없음)
+            matched_codes = set()
+            default_updated = 0
+            for (code,) in cursor:
+                static_yield = STATIC_DIVIDEND_YIELDS.get(code)
+                if static_yield is not None:
+                    matched_codes.add(code)
+                if not static_yield:
+                    default_updated += 1
+            updated_count = len(matched_codes)
+        else:
+            changed_rows = cursor.rowcount
+            updated_count, static_rows = cursor.execute(
+                _q(etf_table, 'update_counts'), (*_NONZERO_STATIC_CODES, *STATIC_DIVIDEND_YIELDS)
+            ).fetchone()
+            default_updated = changed_rows - static_rows
+        changed_count = conn.total_changes - before
+        
+        conn.commit()
+        print(f"✅ {db_file}: 정확한 데이터 {updated_count}개, 기본값 {default_updated}개 업데이트 "
+              f"(변경 행 {changed_count}개)", file=out)
+        
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ {db_file} 업데이트 실패: {e}", file=out)
+
+def _verify_table(conn, etf_table, out):
+    """ETF 테이블의 배당수익률 통계와 상위 배당 ETF 출력"""
+    # 배당수익률 통계
+    total_etfs, has_dividend, avg_dividend, max_dividend, min_dividend = \
+        conn.execute(_q(etf_table, 'stats')).fetchone()
     
-    db_files = ["etf_universe.db", "data/etf_data.db", "etf_data.db"]
+    print(f"   전체 ETF: {total_etfs}개", file=out)
+    print(f"   배당수익률 > 0: {has_dividend}개", file=out)
+    print(f"   평균 배당수익률: {avg_dividend or 0:.2f}%", file=out)
+    print(f"   최대 배당수익률: {max_dividend or 0:.2f}%", file=out)
     
-    for db_file in db_files:
-        if not os.path.exists(db_file):
-            continue
-            
-        print(f"\n📊 {db_file} 업데이트 중...")
+    # 상위 배당 ETF (pandas는 표 출력이 필요할 때만 로드)
+    import pandas as pd
+    df_top = pd.read_sql_query(_q(etf_table, 'top5'), conn)
+    
+    if not df_top.empty:
+        print(f"\n   상위 배당 ETF:", file=out)
+        for row in df_top.itertuples(index=False):
+            print(f"     {row.code}: {row.dividend_yield:.1f}% ({row.name})", file=out)
+
+def _verify_one(db_file, conn, out):
+    """DB 파일 하나의 배당수익률 데이터 검증"""
+    print(f"\n📊 {db_file} 검증:", file=out)
+    
+    try:
+        # ETF 테이블 찾기
+        _, etf_table, _, _ = _schema(conn, db_file)
         
-        try:
-            conn = sqlite3.connect(db_file)
-            cursor = conn.cursor()
-            
-            # ETF 테이블 찾기
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            etf_table = None
-            for table_name in ['etf_info', 'etfs', 'etf_data']:
-                if table_name in tables:
-                    etf_table = table_name
-                    break
-            
-            if not etf_table:
-                print(f"⚠️ {db_file}: ETF 테이블 없음")
-                conn.close()
-                continue
-            
-            # dividend_yield 컬럼 확인 및 추가
-            cursor.execute(f"PRAGMA table_info({etf_table})")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            if 'dividend_yield' not in columns:
-                try:
-                    cursor.execute(f"ALTER TABLE {etf_table} ADD COLUMN dividend_yield REAL DEFAULT 0")
-                    conn.commit()
-                    print(f"✅ {db_file}: dividend_yield 컬럼 추가됨")
-                except Exception as e:
-                    print(f"❌ {db_file}: 컬럼 추가 실패 - {e}")
-                    conn.close()
-                    continue
-            
-            # 배당수익률 데이터 업데이트
-            updated_count = 0
-            
-            for code, dividend_yield in dividend_data.items():
-                try:
-                    cursor.execute(f"""
-                        UPDATE {etf_table} 
-                        SET dividend_yield = ?, last_updated = ?
-                        WHERE code = ?
-                    """, (dividend_yield, datetime.now().isoformat(), code))
-                    
-                    if cursor.rowcount > 0:
-                        updated_count += 1
-                        
-                except Exception as e:
-                    print(f"❌ {code} 업데이트 실패: {e}")
-            
-            # 기본값 설정 (배당수익률이 0인 ETF들)
-            cursor.execute(f"""
-                UPDATE {etf_table} 
-                SET dividend_yield = 1.5, last_updated = ?
-                WHERE dividend_yield = 0 OR dividend_yield IS NULL
-            """, (datetime.now().isoformat(),))
-            
-            default_updated = cursor.rowcount
-            
-            conn.commit()
-            conn.close()
-            
-            print(f"✅ {db_file}: 정확한 데이터 {updated_count}개, 기본값 {default_updated}개 업데이트")
-            
-        except Exception as e:
-            print(f"❌ {db_file} 업데이트 실패: {e}")
+        if etf_table:
+            # 통계/상위 목록을 같은 읽기 스냅샷에서 조회 (읽기 트랜잭션 한 번, 끝나면 ROLLBACK)
+            conn.execute("BEGIN")
+            try:
+                _verify_table(conn, etf_table, out)
+            finally:
+                conn.rollback()
+        
+    except Exception as e:
+        print(f"   ❌ 검증 실패: {e}", file=out)
 
-def verify_dividend_data():
-    """배당수익률 데이터 검증"""
+def check_dividend_yield_data(conns, auto_add=False):
+    """배당수익률 데이터 상태 확인 (conns: (DB 파일, 연결) 목록, auto_add: 묻지 않고 컬럼 추가)"""
     
-    print("\n✅ 배당수익률 데이터 검증")
-    print("=" * 35)
+    print("🔍 배당수익률 데이터 확인")
+    print("=" * 50)
     
-    db_files = ["etf_universe.db", "data/etf_data.db", "etf_data.db"]
+    results = _run_per_db(_check_one, conns)
     
-    for db_file in db_files:
-        if not os.path.exists(db_file):
+    # 컬럼 추가 제안 (출력이 섞이지 않도록 DB 확인이 끝난 뒤 순서대로 질문)
+    for (db_file, conn), (_, etf_table) in zip(conns, results):
+        if not etf_table:
             continue
-            
-        print(f"\n📊 {db_file} 검증:")
-        
-        try:
-            conn = sqlite3.connect(db_file)
-            
-            # ETF 테이블 찾기
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            etf_table = None
-            for table_name in ['etf_info', 'etfs', 'etf_data']:
-                if table_name in tables:
-                    etf_table = table_name
-                    break
-            
-            if etf_table:
-                # 배당수익률 통계
-                df_stats = pd.read_sql_query(f"""
-                    SELECT 
-                        COUNT(*) as total_etfs,
-                        COUNT(CASE WHEN dividend_yield > 0 THEN 1 END) as has_dividend,
-                        AVG(dividend_yield) as avg_dividend,
-                        MAX(dividend_yield) as max_dividend,
-                        MIN(dividend_yield) as min_dividend
-                    FROM {etf_table}
-                """, conn)
-                
-                print(f"   전체 ETF: {df_stats.iloc[0]['total_etfs']}개")
-                print(f"   배당수익률 > 0: {df_stats.iloc[0]['has_dividend']}개")
-                print(f"   평균 배당수익률: {df_stats.iloc[0]['avg_dividend']:.2f}%")
-                print(f"   최대 배당수익률: {df_stats.iloc[0]['max_dividend']:.2f}%")
-                
-                # 상위 배당 ETF
-                df_top = pd.read_sql_query(f"""
-                    SELECT code, name, dividend_yield 
-                    FROM {etf_table} 
-                    WHERE dividend_yield > 0 
-                    ORDER BY dividend_yield DESC 
-                    LIMIT 5
-                """, conn)
-                
-                if not df_top.empty:
-                    print(f"\n   상위 배당 ETF:")
-                    for _, row in df_top.iterrows():
-                        print(f"     {row['code']}: {row['dividend_yield']:.1f}% ({row['name']})")
-            
-            conn.close()
-            
-        except Exception as e:
-            print(f"   ❌ 검증 실패: {e}")
+        if _confirm(f"{db_file}: dividend_yield 컬럼을 추가하시겠습니까? (y/n): ", auto_add):
+            try:
+                conn.execute(f"ALTER TABLE {etf_table} ADD COLUMN dividend_yield REAL DEFAULT 0")
+                conn.commit()
+                print("✅ dividend_yield 컬럼 추가 완료")
+            except Exception as e:
+                print(f"❌ 컬럼 추가 실패: {e}")
 
-def main():
-    """메인 실행 함수"""
-    print("🎯 배당수익률 데이터 진단 및 수정 도구")
-    print("현재 시간:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+def fix_dividend_yield_data(conns):
+    """배당수익률 데이터 수정/업데이트 (conns: (DB 파일, 연결) 목록)"""
+    
+    print("\n🔧 배당수익률 데이터 수정")
+    print("=" * 40)
+    
+    # 모든 DB에 같은 갱신 시각 기록
+    now_iso = datetime.now().isoformat()
+    
+    _run_per_db(_fix_one, conns, now_iso)
+
+def verify_dividend_data(conns):
+    """배당수익률 데이터 검증 (conns: (DB 파일, 연결) 목록)"""
+    
+    print("\n✅ 배당수익률 데이터 검증")
+    print("=" * 35)
     
-    # 1단계: 현재 상태 확인
-    check_dividend_yield_data()
+    _run_per_db(_verify_one, conns)
+
+def parse_args(argv=None):
+    """명령행 인수 파싱"""
+    parser = argparse.ArgumentParser(description="배당수익률 데이터 진단 및 수정 도구")
+    parser.add_argument('--auto-add', action='store_true',
+                        help='dividend_yield 컬럼이 없으면 묻지 않고 추가')
+    parser.add_argument('--fix', action='store_true',
+                        help='묻지 않고 배당수익률 데이터 수정/업데이트 실행')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """메인 실행 함수 (비대화형 실행에서는 --auto-add/--fix가 없으면 수정 단계 생략)"""
+    args = parse_args(argv)
     
-    # 2단계: 데이터 수정 제안
-    print("\n" + "="*60)
-    response = input("배당수익률 데이터를 수정/업데이트하시겠습니까? (y/n): ")
+    print("🎯 배당수익률 데이터 진단 및 수정 도구")
+    print("현재 시간:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
-    if response.lower() == 'y':
-        fix_dividend_yield_data()
-        verify_dividend_data()
+    # DB마다 연결 하나를 열어 확인/수정/검증 단계에서 재사용
+    with ExitStack() as stack:
+        conns = _open_all(stack, DB_FILES)
+        
+        # 1단계: 현재 상태 확인
+        check_dividend_yield_data(conns, auto_add=args.auto_add)
+        
+        # 2단계: 데이터 수정 제안
+        print("\n" + "="*60)
+        if _confirm("배당수익률 데이터를 수정/업데이트하시겠습니까? (y/n): ", args.fix):
+            fix_dividend_yield_data(conns)
+            verify_dividend_data(conns)
     
     print("\n✅ 배당수익률 데이터 진단 완료!")
     print("💡 대시보드를 새로고침하여 변경사항을 확인하세요.")
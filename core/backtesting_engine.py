@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 import logging
+import math
+import functools
+import zlib
 
 # 최적화 라이브러리 (선택적)
 try:
@@ -19,6 +22,52 @@ except ImportError:
     SCIPY_AVAILABLE = False
     print("⚠️ scipy 없음 - 기본 통계만 사용")
 
+# JIT 컴파일러 (선택적)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("⚠️ numba 없음 - NumPy 벡터 연산 사용")
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _gbm_paths(drift, vol, s0, Z, out):
+        """GBM 가격 경로를 임시 배열 없이 out에 직접 기록 (첫날은 초기 가격)"""
+        T, K = Z.shape
+        for k in prange(K):
+            acc = s0[k]
+            if T > 0:
+                out[0, k] = acc
+            for t in range(1, T):
+                acc *= math.exp(drift[k] + vol[k] * Z[t, k])
+                out[t, k] = acc
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _port_evolve(R, w0, seg_starts, seg_ends, out_returns, out_weights):
+        """리밸런싱 구간별 비중 자연 변화와 일일 포트폴리오 수익률 계산"""
+        K = R.shape[1]
+        for s in prange(len(seg_starts)):
+            a = seg_starts[s]
+            b = seg_ends[s]
+            values = w0.copy()
+            for t in range(a, b):
+                total = 0.0
+                for k in range(K):
+                    total += values[k]
+                daily = 0.0
+                for k in range(K):
+                    if t == a:
+                        w = w0[k]  # 구간 첫날은 목표 비중 그대로
+                    elif total != 0.0:
+                        w = values[k] / total
+                    else:
+                        w = 0.0
+                    out_weights[t, k] = w
+                    daily += w * R[t, k]
+                    values[k] *= 1.0 + R[t, k]
+                out_returns[t] = daily
+
 @dataclass
 class BacktestResult:
     """백테스팅 결과"""
@@ -61,12 +110,27 @@ class BacktestingEngine:
         self.transaction_cost_rate = 0.001  # 0.1% 거래 비용
         self.min_trade_amount = 50000       # 최소 거래 금액
         
+        # 합성 데이터 기본 상관행렬에서 주식형과 무상관으로 취급할 채권형 ETF
+        self.bond_etf_codes = {'114260'}
+        
+        # 가격/수익률 배열 정밀도 (대규모 유니버스 메모리 대역폭 절감, 테스트에서 np.float64로 변경 가능)
+        self.dtype = np.float32
+        
+        # 전략 비교 시 가격/수익률 재사용 캐시 (db_path가 키에 포함되어 경로 변경 시 자동 무효화)
+        self._get_returns = functools.lru_cache(maxsize=32)(self._load_returns)
+        
         self.logger.info("📈 백테스팅 엔진 초기화 완료")
     
     def generate_synthetic_data(self, etf_codes: List[str], 
                                start_date: str, end_date: str,
-                               freq: str = 'D') -> pd.DataFrame:
-        """합성 가격 데이터 생성 (실제 데이터 없을 때)"""
+                               freq: str = 'D',
+                               correlation: Optional[np.ndarray] = None,
+                               seed: Optional[int] = None) -> pd.DataFrame:
+        """합성 가격 데이터 생성 (실제 데이터 없을 때)
+        
+        correlation이 없으면 주식형 ETF끼리 0.7, 채권형(114260)과는 0의 상관계수 사용.
+        seed가 주어지면 전역 난수 상태 대신 전용 Generator로 같은 경로를 재현
+        """
         try:
             start = pd.to_datetime(start_date)
             end = pd.to_datetime(end_date)
@@ -86,31 +150,43 @@ class BacktestingEngine:
                 '229200': {'initial_price': 9800, 'annual_return': 0.11, 'volatility': 0.24},
             }
             
-            data = pd.DataFrame(index=business_dates)
-            
-            for etf_code in etf_codes:
-                settings = etf_settings.get(etf_code, {
-                    'initial_price': 10000, 
-                    'annual_return': 0.08, 
-                    'volatility': 0.18
-                })
-                
-                # 기하 브라운 운동으로 가격 생성
-                dt = 1/252  # 일일 단위
-                num_days = len(business_dates)
-                
-                # 일일 수익률 생성
-                drift = (settings['annual_return'] - 0.5 * settings['volatility']**2) * dt
-                diffusion = settings['volatility'] * np.sqrt(dt) * np.random.normal(0, 1, num_days)
-                
-                log_returns = drift + diffusion
-                
-                # 가격 계산
-                prices = [settings['initial_price']]
-                for i in range(1, num_days):
-                    prices.append(prices[-1] * np.exp(log_returns[i]))
+            default_settings = {'initial_price': 10000, 'annual_return': 0.08, 'volatility': 0.18}
+            settings = [etf_settings.get(etf_code, default_settings) for etf_code in etf_codes]
+            
+            # ETF별 설정을 배열로 모아 전체 ETF를 한 번에 계산
+            s0 = np.array([s['initial_price'] for s in settings], dtype=float)
+            mu = np.array([s['annual_return'] for s in settings], dtype=float)
+            sigma = np.array([s['volatility'] for s in settings], dtype=float)
+            
+            # 기하 브라운 운동으로 가격 생성
+            dt = 1/252  # 일일 단위
+            num_days = len(business_dates)
+            
+            # 상관행렬 (기본값: 주식형끼리 0.7, 채권형과는 0)
+            if correlation is None:
+                is_equity = np.array([etf_code not in self.bond_etf_codes for etf_code in etf_codes])
+                correlation = np.where(np.outer(is_equity, is_equity), 0.7, 0.0)
+                np.fill_diagonal(correlation, 1.0)
+            L = np.linalg.cholesky(np.asarray(correlation, dtype=float))
+            
+            # 일일 로그 수익률 생성 (일수 × ETF 수, 촐레스키 분해로 상관된 정규난수)
+            drift = (mu - 0.5 * sigma**2) * dt
+            rng = np.random if seed is None else np.random.default_rng(seed)
+            Z = rng.standard_normal((num_days, len(etf_codes))) @ L.T
+            
+            if NUMBA_AVAILABLE:
+                # 융합 커널: exp/cumprod 임시 배열 없이 가격 경로 직접 생성
+                prices = np.empty_like(Z)
+                _gbm_paths(drift, sigma * np.sqrt(dt), s0, Z, prices)
+            else:
+                log_returns = drift + sigma * np.sqrt(dt) * Z
+                log_returns[:1] = 0.0  # 첫날은 초기 가격
                 
-                data[etf_code] = prices
+                # 가격 계산: S_t = S_0 · Π exp(r_i)
+                prices = s0 * np.exp(log_returns).cumprod(axis=0)
+            
+            data = pd.DataFrame(prices.astype(self.dtype, copy=False),
+                                index=business_dates, columns=list(etf_codes))
             
             self.logger.info(f"📊 합성 데이터 생성: {len(etf_codes)}개 ETF, {len(business_dates)}일")
             return data
@@ -120,106 +196,133 @@ class BacktestingEngine:
             return pd.DataFrame()
     
     def load_historical_data(self, etf_codes: List[str], 
-                           start_date: str, end_date: str) -> pd.DataFrame:
-        """과거 데이터 로드 (실제 DB에서)"""
+                           start_date: str, end_date: str,
+                           seed: Optional[int] = None) -> pd.DataFrame:
+        """과거 데이터 로드 (실제 DB에서, 없으면 seed로 합성 데이터 생성)"""
         try:
             conn = sqlite3.connect(self.db_path)
+            conn.executescript("PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536;")
             
-            # 성과 데이터 테이블에서 가격 조회
-            all_data = []
-            
-            for etf_code in etf_codes:
-                query = '''
-                    SELECT date, price 
-                    FROM etf_performance 
-                    WHERE code = ? AND date BETWEEN ? AND ?
-                    ORDER BY date
-                '''
-                df = pd.read_sql_query(query, conn, params=(etf_code, start_date, end_date))
-                
-                if not df.empty:
-                    df['date'] = pd.to_datetime(df['date'])
-                    df = df.set_index('date')
-                    df.columns = [etf_code]
-                    all_data.append(df)
+            # (code, date) 복합 인덱스 - 첫 로드 시 한 번만 생성
+            try:
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_etf_perf_code_date "
+                    "ON etf_performance(code, date)"
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+            
+            # 성과 데이터 테이블에서 전체 ETF 가격을 한 번에 조회
+            placeholders = ",".join("?" * len(etf_codes))
+            query = f'''
+                SELECT date, code, price 
+                FROM etf_performance 
+                WHERE code IN ({placeholders}) AND date BETWEEN ? AND ?
+                ORDER BY date
+            '''
+            df = pd.read_sql_query(query, conn, params=(*etf_codes, start_date, end_date),
+                                   parse_dates=['date'])
             
             conn.close()
             
-            if all_data:
-                # 모든 ETF 데이터 병합
-                combined_data = pd.concat(all_data, axis=1, sort=True)
-                combined_data = combined_data.fillna(method='ffill')  # 결측값 전진 채우기
+            if not df.empty:
+                # long → wide 피벗 (요청 순서대로 컬럼 정렬)
+                combined_data = df.pivot_table(index='date', columns='code',
+                                               values='price', aggfunc='last').sort_index()
+                combined_data = combined_data[[code for code in etf_codes if code in combined_data.columns]]
+                combined_data.columns.name = None
+                combined_data = combined_data.ffill()  # 결측값 전진 채우기
+                combined_data = combined_data.astype(self.dtype)
                 
                 self.logger.info(f"📊 실제 데이터 로드: {len(etf_codes)}개 ETF, {len(combined_data)}일")
                 return combined_data
             else:
                 # 실제 데이터가 없으면 합성 데이터 생성
                 self.logger.warning("⚠️ 실제 데이터 없음, 합성 데이터 생성")
-                return self.generate_synthetic_data(etf_codes, start_date, end_date)
+                return self.generate_synthetic_data(etf_codes, start_date, end_date, seed=seed)
                 
         except Exception as e:
             self.logger.error(f"❌ 과거 데이터 로드 실패: {e}")
-            return self.generate_synthetic_data(etf_codes, start_date, end_date)
+            return self.generate_synthetic_data(etf_codes, start_date, end_date, seed=seed)
+    
+    def _load_returns(self, etf_codes: Tuple[str, ...], start_date: str, end_date: str,
+                      db_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """가격 데이터와 일일 수익률 로드 (_get_returns 캐시 원본)
+        
+        합성 데이터로 대체될 때도 (기간, 유니버스)별로 고정된 시드를 사용해
+        모든 전략이 같은 시장 경로에서 비교되도록 함
+        """
+        seed = zlib.crc32(repr((start_date, end_date, etf_codes)).encode())
+        price_data = self.load_historical_data(list(etf_codes), start_date, end_date, seed=seed)
+        return price_data, price_data.pct_change(fill_method=None).fillna(0.0)
     
     def calculate_portfolio_returns(self, price_data: pd.DataFrame, 
                                   weights: Dict[str, float],
-                                  rebalance_freq: str = 'M') -> Tuple[pd.Series, pd.DataFrame]:
+                                  rebalance_freq: str = 'M',
+                                  returns: Optional[pd.DataFrame] = None) -> Tuple[pd.Series, pd.DataFrame]:
         """포트폴리오 수익률 계산"""
         try:
-            # 일일 수익률 계산
-            returns = price_data.pct_change().fillna(0)
+            # 일일 수익률 계산 (미리 계산된 수익률이 있으면 재사용)
+            if returns is None:
+                returns = price_data.pct_change(fill_method=None).fillna(0.0)
             
-            # 리밸런싱 일정 생성
+            # 리밸런싱일 표시: 거래일 인덱스에서 기간(월/분기/연)의 마지막 거래일을 직접 탐지
+            R = returns.values.astype(self.dtype, copy=False)
+            dates = price_data.index
             if rebalance_freq == 'M':  # 월별
-                rebalance_dates = pd.date_range(
-                    start=price_data.index[0], 
-                    end=price_data.index[-1], 
-                    freq='M'
-                )
+                period = np.asarray(dates.year * 12 + dates.month)
             elif rebalance_freq == 'Q':  # 분기별
-                rebalance_dates = pd.date_range(
-                    start=price_data.index[0], 
-                    end=price_data.index[-1], 
-                    freq='Q'
-                )
+                period = np.asarray(dates.year * 4 + dates.quarter)
             elif rebalance_freq == 'Y':  # 연별
-                rebalance_dates = pd.date_range(
-                    start=price_data.index[0], 
-                    end=price_data.index[-1], 
-                    freq='Y'
-                )
+                period = np.asarray(dates.year)
             else:  # 리밸런싱 없음
-                rebalance_dates = [price_data.index[0]]
+                period = None
             
-            # 포트폴리오 가치 추적
-            portfolio_values = []
-            portfolio_weights = pd.DataFrame(index=price_data.index, columns=price_data.columns)
-            
-            initial_value = 1000000  # 초기 100만원
-            current_value = initial_value
-            current_weights = pd.Series(weights)
+            if period is not None:
+                is_rebalance = np.append(period[1:] != period[:-1], False)
+            else:
+                is_rebalance = np.zeros(len(dates), dtype=bool)
+                is_rebalance[:1] = True
+            
+            num_days = len(R)
+            # 컬럼 순서 기준 목표 비중 벡터 (데이터 없는 ETF 비중은 제외)
+            target_weights = np.array([weights.get(code, 0.0) for code in price_data.columns],
+                                      dtype=self.dtype)
+            
+            # 목표 비중으로 시작하는 구간의 시작일: 첫날, 리밸런싱일, 리밸런싱 다음날
+            # (리밸런싱일에는 비중 자연 변화를 적용하지 않으므로 다음날도 목표 비중)
+            rebalance_rows = np.flatnonzero(is_rebalance)
+            segment_starts = np.union1d([0], np.concatenate([rebalance_rows, rebalance_rows + 1]))
+            segment_starts = segment_starts[segment_starts < num_days]
+            segment_ends = np.append(segment_starts[1:], num_days)
+            
+            daily_returns = np.zeros(num_days, dtype=R.dtype)
+            weights_matrix = np.zeros_like(R)
+            
+            if NUMBA_AVAILABLE:
+                _port_evolve(np.ascontiguousarray(R), target_weights,
+                             segment_starts, segment_ends, daily_returns, weights_matrix)
+            else:
+                for a, b in zip(segment_starts, segment_ends):
+                    # 구간 내 비중 자연 변화: w_t ∝ w_0 · Π(1 + r_i), i < t
+                    segment_returns = R[a:b]
+                    growth = np.cumprod(1.0 + segment_returns[:-1], axis=0)
+                    asset_values = target_weights * np.vstack([np.ones((1, R.shape[1]), dtype=R.dtype), growth])
+                    total = asset_values.sum(axis=1, keepdims=True)
+                    segment_weights = np.divide(asset_values, total, out=np.zeros_like(asset_values),
+                                                where=total != 0)
+                    segment_weights[0] = target_weights  # 구간 첫날은 목표 비중 그대로
+                    
+                    weights_matrix[a:b] = segment_weights
+                    daily_returns[a:b] = np.einsum('ij,ij->i', segment_weights, segment_returns)
             
-            for date in price_data.index:
-                # 리밸런싱 체크
-                if date in rebalance_dates:
-                    current_weights = pd.Series(weights)
-                
-                # 일일 수익률 적용
-                daily_return = (returns.loc[date] * current_weights).sum()
-                current_value *= (1 + daily_return)
-                
-                portfolio_values.append(current_value)
-                portfolio_weights.loc[date] = current_weights
-                
-                # 가중치 자연 변화 (리밸런싱 전까지)
-                if date not in rebalance_dates:
-                    asset_values = current_weights * current_value
-                    asset_values *= (1 + returns.loc[date])
-                    current_weights = asset_values / asset_values.sum()
-                    current_weights = current_weights.fillna(0)
+            # 첫날 수익률은 0 (pct_change 기준과 동일)
+            daily_returns[:1] = 0.0
             
-            portfolio_series = pd.Series(portfolio_values, index=price_data.index)
-            portfolio_returns = portfolio_series.pct_change().fillna(0)
+            portfolio_returns = pd.Series(daily_returns, index=price_data.index)
+            portfolio_weights = pd.DataFrame(weights_matrix, index=price_data.index,
+                                             columns=price_data.columns)
             
             return portfolio_returns, portfolio_weights
             
@@ -227,6 +330,12 @@ class BacktestingEngine:
             self.logger.error(f"❌ 포트폴리오 수익률 계산 실패: {e}")
             return pd.Series(), pd.DataFrame()
     
+    def _compute_drawdown(self, portfolio_values: np.ndarray) -> np.ndarray:
+        """드로우다운(%) 계산 - 누적 최고점 대비 하락률"""
+        pv = np.asarray(portfolio_values, dtype=np.float64)
+        peak = np.maximum.accumulate(pv)
+        return (pv / peak - 1.0) * 100.0
+    
     def calculate_performance_metrics(self, returns: pd.Series, 
                                     portfolio_values: pd.Series) -> PerformanceMetrics:
         """성과 지표 계산"""
@@ -235,37 +344,26 @@ class BacktestingEngine:
             cumulative_returns = (1 + returns).cumprod() - 1
             
             # 드로우다운 계산
-            peak = portfolio_values.expanding(min_periods=1).max()
-            drawdowns = (portfolio_values / peak - 1) * 100
+            drawdowns = self._compute_drawdown(portfolio_values)
             
-            # 롤링 샤프 비율 (60일 윈도우)
-            rolling_sharpe = []
-            rolling_vol = []
+            # 롤링 샤프 비율 (60일 윈도우, 앞의 59일은 NaN)
+            rolling_mean = returns.rolling(60).mean()
+            rolling_std = returns.rolling(60).std()
             
-            for i in range(60, len(returns)):
-                window_returns = returns.iloc[i-60:i]
-                excess_returns = window_returns.mean() * 252 - self.risk_free_rate
-                volatility = window_returns.std() * np.sqrt(252)
-                
-                if volatility > 0:
-                    sharpe = excess_returns / volatility
-                else:
-                    sharpe = 0
-                
-                rolling_sharpe.append(sharpe)
-                rolling_vol.append(volatility)
+            rolling_vol = (rolling_std * np.sqrt(252)).values
+            excess_returns = (rolling_mean * 252 - self.risk_free_rate).values
             
-            # 앞의 59일은 NaN으로 채움
-            rolling_sharpe = [np.nan] * 59 + rolling_sharpe
-            rolling_vol = [np.nan] * 59 + rolling_vol
+            rolling_sharpe = np.divide(excess_returns, rolling_vol,
+                                       out=np.zeros_like(rolling_vol), where=rolling_vol > 0)
+            rolling_sharpe[np.isnan(rolling_vol)] = np.nan
             
             return PerformanceMetrics(
                 returns=returns.values,
                 cumulative_returns=cumulative_returns.values,
                 portfolio_values=portfolio_values.values,
-                drawdowns=drawdowns.values,
-                rolling_sharpe=np.array(rolling_sharpe),
-                rolling_volatility=np.array(rolling_vol)
+                drawdowns=drawdowns,
+                rolling_sharpe=rolling_sharpe,
+                rolling_volatility=rolling_vol
             )
             
         except Exception as e:
@@ -282,24 +380,35 @@ class BacktestingEngine:
     def run_backtest(self, strategy_name: str, weights: Dict[str, float],
                     start_date: str, end_date: str, 
                     initial_value: float = 1000000,
-                    rebalance_freq: str = 'M') -> BacktestResult:
-        """백테스팅 실행"""
+                    rebalance_freq: str = 'M',
+                    price_data: Optional[pd.DataFrame] = None,
+                    returns_df: Optional[pd.DataFrame] = None) -> BacktestResult:
+        """백테스팅 실행 (price_data/returns_df가 주어지면 DB 조회 생략)"""
         try:
             self.logger.info(f"📈 백테스팅 시작: {strategy_name} ({start_date} ~ {end_date})")
             
             # 1. 가격 데이터 로드
             etf_codes = list(weights.keys())
-            price_data = self.load_historical_data(etf_codes, start_date, end_date)
+            if price_data is None:
+                price_data = self.load_historical_data(etf_codes, start_date, end_date)
+            else:
+                # 공유 데이터에서 이 전략의 ETF만 사용
+                columns = [code for code in etf_codes if code in price_data.columns]
+                price_data = price_data[columns]
+                if returns_df is not None:
+                    returns_df = returns_df[columns]
             
             if price_data.empty:
                 raise ValueError("가격 데이터를 로드할 수 없습니다")
             
             # 2. 포트폴리오 수익률 계산
             portfolio_returns, portfolio_weights = self.calculate_portfolio_returns(
-                price_data, weights, rebalance_freq
+                price_data, weights, rebalance_freq, returns=returns_df
             )
             
             # 3. 포트폴리오 가치 계산
+            # 누적/통계 계산은 float64로 수행
+            portfolio_returns = portfolio_returns.astype(np.float64)
             portfolio_values = initial_value * (1 + portfolio_returns).cumprod()
             
             # 4. 기본 성과 지표
@@ -317,9 +426,7 @@ class BacktestingEngine:
             sharpe_ratio = excess_return / volatility if volatility > 0 else 0
             
             # 최대 낙폭
-            peak = portfolio_values.expanding(min_periods=1).max()
-            drawdowns = (portfolio_values / peak - 1) * 100
-            max_drawdown = drawdowns.min()
+            max_drawdown = self._compute_drawdown(portfolio_values).min()
             
             # 칼마 비율
             calmar_ratio = annual_return / abs(max_drawdown) if max_drawdown < 0 else 0
@@ -380,9 +487,14 @@ class BacktestingEngine:
         
         self.logger.info(f"⚖️ 전략 비교 시작: {len(strategies)}개 전략")
         
+        # 전체 전략의 ETF 합집합을 한 번만 로드 (정렬된 튜플 키로 캐시 공유)
+        all_codes = tuple(sorted({code for weights in strategies.values() for code in weights}))
+        price_data, returns_df = self._get_returns(all_codes, start_date, end_date, self.db_path)
+        
         for strategy_name, weights in strategies.items():
             result = self.run_backtest(
-                strategy_name, weights, start_date, end_date, initial_value
+                strategy_name, weights, start_date, end_date, initial_value,
+                price_data=price_data, returns_df=returns_df
             )
             
             if result:
@@ -401,8 +513,14 @@ class BacktestingEngine:
     def monte_carlo_simulation(self, weights: Dict[str, float],
                               num_simulations: int = 1000,
                               years: int = 10,
-                              initial_value: float = 1000000) -> Dict:
-        """몬테카르로 시뮬레이션"""
+                              initial_value: float = 1000000,
+                              seed: Optional[int] = None) -> Dict:
+        """몬테카르로 시뮬레이션
+        
+        대조 변량(antithetic variates): Z와 -Z를 짝지어 사용하므로 평균 추정치는
+        그대로이고, 독립 표본 대비 분산은 (1 + ρ)배가 된다
+        (ρ = corr(f(Z), f(-Z)), 선형에 가까운 포트폴리오 수익률에서는 ρ ≈ -0.9).
+        """
         try:
             self.logger.info(f"🎲 몬테카르로 시뮬레이션: {num_simulations}회, {years}년")
             
@@ -415,35 +533,24 @@ class BacktestingEngine:
                 '195930': {'mean': 0.10, 'std': 0.20},
             }
             
-            simulation_results = []
+            # 통계가 있는 ETF만 사용
+            codes = [etf_code for etf_code in weights if etf_code in etf_stats]
+            mu = np.array([etf_stats[c]['mean'] for c in codes])
+            sigma = np.array([etf_stats[c]['std'] for c in codes])
+            w = np.array([weights[c] for c in codes])
             
-            for _ in range(num_simulations):
-                portfolio_value = initial_value
-                
-                for year in range(years):
-                    # 포트폴리오 연간 수익률 계산
-                    annual_return = 0
-                    
-                    for etf_code, weight in weights.items():
-                        if etf_code in etf_stats:
-                            stats = etf_stats[etf_code]
-                            etf_return = np.random.normal(stats['mean'], stats['std'])
-                            annual_return += weight * etf_return
-                    
-                    portfolio_value *= (1 + annual_return)
-                
-                total_return = (portfolio_value / initial_value - 1) * 100
-                annual_return = ((portfolio_value / initial_value) ** (1/years) - 1) * 100
-                
-                simulation_results.append({
-                    'final_value': portfolio_value,
-                    'total_return': total_return,
-                    'annual_return': annual_return
-                })
+            # 전체 시뮬레이션 × 연도 × ETF 연간 수익률을 한 번에 생성 (절반은 대조 변량)
+            rng = np.random.default_rng(seed)
+            Z_half = rng.standard_normal(((num_simulations + 1) // 2, years, len(codes)))
+            Z = np.concatenate([Z_half, -Z_half], axis=0)[:num_simulations]
+            asset_returns = mu + sigma * Z
+            portfolio_annual_returns = asset_returns @ w  # (시뮬레이션, 연도)
+            
+            growth = np.prod(1 + portfolio_annual_returns, axis=1)
             
             # 통계 계산
-            final_values = [r['final_value'] for r in simulation_results]
-            annual_returns = [r['annual_return'] for r in simulation_results]
+            final_values = initial_value * growth
+            annual_returns = (growth ** (1/years) - 1) * 100
             
             results = {
                 'num_simulations': num_simulations,
@@ -458,8 +565,8 @@ class BacktestingEngine:
                 'std_annual_return': np.std(annual_returns),
                 'percentile_5': np.percentile(annual_returns, 5),
                 'percentile_95': np.percentile(annual_returns, 95),
-                'probability_positive': len([r for r in annual_returns if r > 0]) / num_simulations * 100,
-                'probability_beat_inflation': len([r for r in annual_returns if r > 3]) / num_simulations * 100,
+                'probability_positive': np.count_nonzero(annual_returns > 0) / num_simulations * 100,
+                'probability_beat_inflation': np.count_nonzero(annual_returns > 3) / num_simulations * 100,
             }
             
             self.logger.info(f"✅ 몬테카르로 완료: 평균 연수익률 {results['mean_annual_return']:.2f}%")
@@ -475,19 +582,20 @@ class BacktestingEngine:
         try:
             self.logger.info(f"🔥 스트레스 테스트: {len(stress_scenarios)}개 시나리오")
             
-            results = {}
+            # 시나리오 × ETF 충격 행렬과 비중 벡터의 곱으로 전체 시나리오 영향 계산
+            codes = list(weights.keys())
+            w = np.array([weights[c] for c in codes], dtype=float)
+            shocks = np.array([[etf_shocks.get(c, 0.0) for c in codes]
+                               for etf_shocks in stress_scenarios.values()], dtype=float)
+            impacts = shocks.reshape(len(stress_scenarios), len(codes)) @ w
             
-            for scenario_name, etf_shocks in stress_scenarios.items():
-                portfolio_shock = 0
-                
-                for etf_code, weight in weights.items():
-                    shock = etf_shocks.get(etf_code, 0)
-                    portfolio_shock += weight * shock
-                
-                results[scenario_name] = {
-                    'portfolio_impact': round(portfolio_shock * 100, 2),
-                    'value_change': round(1000000 * portfolio_shock, 0)
+            results = {
+                scenario_name: {
+                    'portfolio_impact': round(float(impact) * 100, 2),
+                    'value_change': round(1000000 * float(impact), 0)
                 }
+                for scenario_name, impact in zip(stress_scenarios.keys(), impacts)
+            }
             
             self.logger.info(f"✅ 스트레스 테스트 완료")
             return results
@@ -13,14 +13,127 @@ import json
 import sqlite3
 import gzip
 import hashlib
+import heapq
+import io
+import mmap
+import time
 from datetime import datetime, timedelta
+from contextlib import ExitStack
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import yaml
 from pathlib import Path
 import zipfile
+import tarfile
 import pickle
 
+# 고속 해시 (선택적)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    print("⚠️ blake3 없음 - SHA-256 체크섬 사용")
+
+# 빠른 JSON 직렬화 (선택적)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ISA-L 가속 DEFLATE (선택적, zip 포맷 호환 - 백업 항목별 압축기로만 사용, 레벨 0~3)
+try:
+    from isal import isal_zlib
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
+# zstd 압축 (선택적)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    print("⚠️ zstandard 없음 - zip 압축만 사용")
+
+# 새 백업의 체크섬 알고리즘 (checksum_algo 없는 기존 매니페스트는 md5)
+CHECKSUM_ALGO = 'blake3' if BLAKE3_AVAILABLE else 'sha256'
+LEGACY_CHECKSUM_ALGO = 'md5'
+
+# 체크섬 읽기 단위 (1 MiB - 대용량 DB 파일의 read 시스템 콜 횟수 감소)
+CHECKSUM_BUFFER = 1 << 20
+# 이보다 큰 파일은 mmap으로 해시 (사용자 공간 버퍼 복사 생략)
+CHECKSUM_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# 카탈로그를 다시 구축할 스키마/형식 불일치 오류 (잠금 등 일시적 오류는 제외)
+CATALOG_REBUILD_ERRORS = ('no such table', 'no such column', 'file is not a database', 'malformed')
+
+# 블록 단위 증분 백업 (SQLite 페이지 정렬 고정 블록, 변경 블록만 저장)
+DELTA_BLOCK_SIZE = 64 * 1024
+DELTA_MIN_SIZE = 1024 * 1024     # 이보다 작은 파일은 통째로 복사
+DELTA_MAX_RATIO = 0.5            # 변경 블록이 원본의 절반을 넘으면 통째로 복사
+
+def _dump_manifest(manifest: Dict) -> bytes:
+    """매니페스트 직렬화 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _parse_manifest(data: bytes) -> Dict:
+    """매니페스트 역직렬화 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+def _created_ts(created_at: Optional[str]) -> float:
+    """ISO 생성일시를 POSIX 타임스탬프로 변환 (정렬/비교용, 없으면 0)"""
+    if not created_at:
+        return 0.0
+    try:
+        return datetime.fromisoformat(created_at).timestamp()
+    except ValueError:
+        return 0.0
+
+def _pack_files(entries: List[Dict]) -> Dict[str, list]:
+    """파일 항목 목록 → 열 단위 매니페스트 ({'path': [...], 'size': [...], ...}, 없는 값은 None)"""
+    columns = {}
+    for index, entry in enumerate(entries):
+        for key, value in entry.items():
+            columns.setdefault(key, [None] * len(entries))[index] = value
+    return columns
+
+def _unpack_files(files) -> List[Dict]:
+    """열 단위 매니페스트 → 파일 항목 목록 (기존 목록 형식 매니페스트는 그대로)"""
+    if isinstance(files, list):
+        return files
+    count = len(files.get('path', []))
+    return [{key: column[index] for key, column in files.items() if column[index] is not None}
+            for index in range(count)]
+
+def _file_count(files) -> int:
+    """매니페스트 파일 수 (두 형식 모두 지원)"""
+    return len(files) if isinstance(files, list) else len(files.get('path', []))
+
+# 설정 이름 → zipfile 압축 방식 (이미 압축된 파일은 stored, 용량 우선이면 lzma)
+ZIP_METHODS = {
+    'deflated': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+    'stored': zipfile.ZIP_STORED,
+}
+
+# compression_method가 zstd이면 zip 대신 멀티스레드 zstd 스트림의 tar 아카이브 생성
+ZSTD_SUFFIX = '.tar.zst'
+
+def _new_hasher(algo: str):
+    """알고리즘 이름으로 해시 객체 생성"""
+    if algo == 'blake3':
+        return blake3.blake3()
+    return hashlib.new(algo)
+
 class DataBackupManager:
     """데이터 백업 및 복구 관리자"""
     
@@ -42,6 +155,29 @@ class DataBackupManager:
         self.retention_days = self.backup_config.get('retention_days', 30)
         self.max_backups = self.backup_config.get('max_backups', 50)
         self.compression_enabled = self.backup_config.get('compression', True)
+        self.compression_method = self.backup_config.get('compression_method', 'deflated')
+        if self.compression_method == 'zstd':
+            default_level = 3
+        elif ISAL_AVAILABLE and self.compression_method == 'deflated':
+            default_level = isal_zlib.ISAL_BEST_COMPRESSION  # ISA-L 최고 레벨 (zlib 6과 비슷한 압축률)
+        else:
+            default_level = 6
+        self.compression_level = self.backup_config.get('compression_level', default_level)
+        
+        available_methods = list(ZIP_METHODS) + (['zstd'] if ZSTD_AVAILABLE else [])
+        if self.compression_method not in available_methods:
+            raise ValueError(f"지원하지 않는 압축 방식: {self.compression_method} "
+                             f"(사용 가능: {', '.join(available_methods)})")
+        
+        # ISA-L은 레벨 0~3만 지원하므로 그 이상은 표준 zlib로 압축 (레벨을 낮추지 않음)
+        self.use_isal = (ISAL_AVAILABLE and self.compression_method == 'deflated'
+                         and self.compression_level <= isal_zlib.ISAL_BEST_COMPRESSION)
+        
+        if self.compression_enabled:
+            print(f"백업 압축: {self.compression_method} (레벨 {self.compression_level})")
+            if ISAL_AVAILABLE and self.compression_method == 'deflated' and not self.use_isal:
+                print(f"⚠️ ISA-L 가속은 레벨 0~{isal_zlib.ISAL_BEST_COMPRESSION}에서만 사용됩니다 "
+                      f"(레벨 {self.compression_level}: 표준 zlib로 압축)")
         
         # 백업할 파일/폴더 목록
         self.backup_items = [
@@ -53,6 +189,13 @@ class DataBackupManager:
             'user_settings.json'
         ]
         
+        # 원본 파일 체크섬 캐시 ((mtime_ns, size)가 같으면 재해시 생략)
+        self.checksum_cache_path = self.local_backup_path / '.checksum_cache.json'
+        self._checksum_cache = self._load_checksum_cache()
+        
+        # 백업 카탈로그 (list_backups가 매번 아카이브를 열지 않도록 메타데이터 색인)
+        self.catalog_path = self.local_backup_path / 'catalog.sqlite'
+        
     def create_full_backup(self, backup_name: str = None) -> str:
         """전체 백업 생성"""
         
@@ -60,64 +203,44 @@ class DataBackupManager:
             backup_name = f"full_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         backup_path = self.local_backup_path / backup_name
-        backup_path.mkdir(exist_ok=True)
         
         print(f"전체 백업 시작: {backup_name}")
         
         backup_manifest = {
             'backup_type': 'full',
             'created_at': datetime.now().isoformat(),
+            'checksum_algo': CHECKSUM_ALGO,
             'files': [],
-            'checksums': {},
             'size_mb': 0
         }
         
         total_size = 0
+        members = []  # (원본 경로, 백업 내 경로)
         
-        # 각 백업 항목 처리
-        for item in self.backup_items:
-            source_path = Path(item)
+        # 각 백업 항목의 체크섬과 파일 목록을 병렬 수집 (파일 I/O와 해시는 GIL 해제)
+        source_paths = [Path(item) for item in self.backup_items]
+        max_workers = max(1, min(len(source_paths), os.cpu_count() or 1))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            collected = list(executor.map(self._collect_item, source_paths))
+        
+        for item in collected:
+            if item is None:
+                continue
             
-            if source_path.exists():
-                if source_path.is_file():
-                    # 파일 백업
-                    size = self._backup_file(source_path, backup_path)
-                    checksum = self._calculate_checksum(source_path)
-                    
-                    backup_manifest['files'].append({
-                        'path': str(source_path),
-                        'type': 'file',
-                        'size': size,
-                        'checksum': checksum
-                    })
-                    backup_manifest['checksums'][str(source_path)] = checksum
-                    total_size += size
-                    
-                elif source_path.is_dir():
-                    # 폴더 백업
-                    size = self._backup_directory(source_path, backup_path)
-                    
-                    backup_manifest['files'].append({
-                        'path': str(source_path),
-                        'type': 'directory',
-                        'size': size
-                    })
-                    total_size += size
+            entry, item_members = item
+            backup_manifest['files'].append(entry)
+            total_size += entry['size']
+            members.extend(item_members)
         
         backup_manifest['size_mb'] = round(total_size / (1024 * 1024), 2)
+        backup_manifest['files'] = _pack_files(backup_manifest['files'])
         
-        # 매니페스트 저장
-        manifest_path = backup_path / 'backup_manifest.json'
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_manifest, f, ensure_ascii=False, indent=2)
-        
-        # 압축 (옵션)
-        if self.compression_enabled:
-            compressed_path = self._compress_backup(backup_path)
-            # 원본 폴더 삭제
-            shutil.rmtree(backup_path)
-            backup_path = compressed_path
+        # 매니페스트와 파일 저장 (압축 시 임시 폴더 없이 아카이브에 직접 기록)
+        backup_path = self._write_backup(backup_path, backup_manifest, members)
         
+        self._save_checksum_cache()
+        self._record_backup(backup_path, backup_manifest)
         print(f"백업 완료: {backup_path} ({backup_manifest['size_mb']} MB)")
         
         # 백업 정리
@@ -138,59 +261,74 @@ class DataBackupManager:
         
         backup_name = f"incremental_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         backup_path = self.local_backup_path / backup_name
-        backup_path.mkdir(exist_ok=True)
         
         print(f"증분 백업 시작: {backup_name} (기준: {base_backup})")
         
         # 기준 백업의 매니페스트 로드
         base_manifest = self._load_backup_manifest(base_backup)
-        base_checksums = base_manifest.get('checksums', {})
+        base_entries = {f['path']: f for f in _unpack_files(base_manifest.get('files', []))}
+        base_checksums = {path: f['checksum'] for path, f in base_entries.items() if 'checksum' in f}
+        # 기준 백업과 같은 알고리즘으로 비교
+        checksum_algo = base_manifest.get('checksum_algo', LEGACY_CHECKSUM_ALGO)
         
         backup_manifest = {
             'backup_type': 'incremental',
             'base_backup': base_backup,
             'created_at': datetime.now().isoformat(),
+            'checksum_algo': checksum_algo,
             'files': [],
-            'checksums': {},
             'size_mb': 0
         }
         
         total_size = 0
+        members = []  # (원본 경로, 백업 내 경로)
         
         # 변경된 파일만 백업
         for item in self.backup_items:
             source_path = Path(item)
             
             if source_path.exists() and source_path.is_file():
-                current_checksum = self._calculate_checksum(source_path)
+                current_checksum = self._calculate_checksum(source_path, checksum_algo, use_cache=True)
                 base_checksum = base_checksums.get(str(source_path))
                 
                 # 파일이 변경되었거나 새 파일인 경우
                 if current_checksum != base_checksum:
-                    size = self._backup_file(source_path, backup_path)
-                    
-                    backup_manifest['files'].append({
+                    entry = {
                         'path': str(source_path),
                         'type': 'file',
-                        'size': size,
                         'checksum': current_checksum,
                         'status': 'modified' if base_checksum else 'new'
-                    })
-                    backup_manifest['checksums'][str(source_path)] = current_checksum
+                    }
+                    
+                    # 기준 백업에 블록 시그니처가 있으면 변경 블록만 저장
+                    base_entry = base_entries.get(str(source_path), {})
+                    delta = None
+                    if base_checksum and 'block_hashes' in base_entry:
+                        delta = self._write_delta(source_path, backup_path, base_entry, checksum_algo)
+                    
+                    if delta:
+                        entry['delta'] = delta
+                        delta_path = backup_path / delta['file']
+                        size = delta_path.stat().st_size
+                        # 비압축 백업은 블록 파일이 이미 백업 폴더에 있음
+                        if self.compression_enabled:
+                            members.append((delta_path, delta['file']))
+                    else:
+                        size = source_path.stat().st_size
+                        members.append((source_path, source_path.name))
+                    
+                    entry['size'] = size
+                    backup_manifest['files'].append(entry)
                     total_size += size
         
         backup_manifest['size_mb'] = round(total_size / (1024 * 1024), 2)
+        backup_manifest['files'] = _pack_files(backup_manifest['files'])
         
-        # 매니페스트 저장
-        manifest_path = backup_path / 'backup_manifest.json'
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_manifest, f, ensure_ascii=False, indent=2)
-        
-        if self.compression_enabled:
-            compressed_path = self._compress_backup(backup_path)
-            shutil.rmtree(backup_path)
-            backup_path = compressed_path
+        # 매니페스트와 파일 저장
+        backup_path = self._write_backup(backup_path, backup_manifest, members)
         
+        self._save_checksum_cache()
+        self._record_backup(backup_path, backup_manifest)
         print(f"증분 백업 완료: {backup_path} ({backup_manifest['size_mb']} MB)")
         
         return str(backup_path)
@@ -207,66 +345,88 @@ class DataBackupManager:
         
         print(f"백업 복구 시작: {backup_path}")
         
-        # 압축된 백업인 경우 압축 해제
-        if backup_path.suffix in ['.zip', '.gz']:
-            extracted_path = self._extract_backup(backup_path)
-            backup_path = extracted_path
-        
-        # 매니페스트 로드
-        manifest_path = backup_path / 'backup_manifest.json'
-        if not manifest_path.exists():
-            print("백업 매니페스트를 찾을 수 없습니다.")
-            return False
-        
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-        
-        backup_type = manifest.get('backup_type', 'unknown')
-        
-        if backup_type == 'incremental':
-            # 증분 백업인 경우 기준 백업도 복구
+        with ExitStack() as stack:
+            # zip은 압축 해제 없이 항목을 바로 읽고, tar 계열만 임시 폴더에 해제
+            source, extracted_path = self._open_backup_source(backup_path, stack)
+            if extracted_path is not None:
+                # 임시 압축 해제 폴더 정리
+                stack.callback(shutil.rmtree, extracted_path)
+            
+            if not self._member_exists(source, 'backup_manifest.json'):
+                print("백업 매니페스트를 찾을 수 없습니다.")
+                return False
+            
+            with self._open_member(source, 'backup_manifest.json') as f:
+                manifest = _parse_manifest(f.read())
+            
+            backup_type = manifest.get('backup_type', 'unknown')
+            checksum_algo = manifest.get('checksum_algo', LEGACY_CHECKSUM_ALGO)
+            
             base_backup = manifest.get('base_backup')
-            if base_backup and not self._is_base_backup_restored(base_backup):
-                print(f"기준 백업 먼저 복구: {base_backup}")
-                if not self.restore_backup(base_backup, target_path):
-                    return False
-        
-        # 파일 복구
-        success_count = 0
-        total_files = len(manifest.get('files', []))
-        
-        for file_info in manifest.get('files', []):
-            file_path = file_info['path']
-            source_file = backup_path / Path(file_path).name
-            target_file = target_path / file_path
+            if backup_type == 'incremental':
+                # 증분 백업인 경우 기준 백업도 복구
+                if base_backup and not self._is_base_backup_restored(base_backup):
+                    print(f"기준 백업 먼저 복구: {base_backup}")
+                    if not self.restore_backup(base_backup, target_path):
+                        return False
             
-            try:
-                # 대상 디렉토리 생성
-                target_file.parent.mkdir(parents=True, exist_ok=True)
+            # 파일 복구
+            success_count = 0
+            files = _unpack_files(manifest.get('files', []))
+            total_files = len(files)
+            
+            for file_info in files:
+                file_path = file_info['path']
+                delta = file_info.get('delta')
+                member = delta['file'] if delta else Path(file_path).name
+                target_file = target_path / file_path
                 
-                if source_file.exists():
-                    if file_info['type'] == 'file':
-                        shutil.copy2(source_file, target_file)
-                    elif file_info['type'] == 'directory':
-                        if target_file.exists():
-                            shutil.rmtree(target_file)
-                        shutil.copytree(source_file, target_file)
+                try:
+                    # 대상 디렉토리 생성
+                    target_file.parent.mkdir(parents=True, exist_ok=True)
                     
-                    # 체크섬 검증
-                    if 'checksum' in file_info:
-                        if self._calculate_checksum(target_file) == file_info['checksum']:
+                    if self._member_exists(source, member):
+                        checksum = None
+                        if (file_info['type'] == 'file' and 'checksum' in file_info
+                                and target_file.is_file()
+                                and self._calculate_checksum(target_file, checksum_algo) == file_info['checksum']):
+                            # 이미 백업 시점과 같은 파일은 건너뜀
                             success_count += 1
+                            continue
+                        
+                        if delta:
+                            # 기준 백업 상태의 파일에 변경 블록만 덮어쓰기
+                            with self._open_member(source, member) as src:
+                                applied = self._apply_delta(src, target_file, delta, checksum_algo)
+                            if not applied and base_backup and self._restore_base_file(
+                                    base_backup, Path(file_path).name, target_file,
+                                    delta['base_checksum'], checksum_algo):
+                                # 대상 파일이 기준 상태와 다르면 기준 백업의 파일로 되돌린 뒤 적용
+                                with self._open_member(source, member) as src:
+                                    applied = self._apply_delta(src, target_file, delta, checksum_algo,
+                                                                verify_base=False)
+                            if not applied:
+                                print(f"기준 파일 불일치 (기준 백업 먼저 복구 필요): {file_path}")
+                                continue
+                        elif file_info['type'] == 'file':
+                            # 복사하면서 해시 (복구된 파일을 다시 읽지 않음)
+                            checksum = self._restore_member(source, member, target_file, checksum_algo)
+                        elif file_info['type'] == 'directory':
+                            self._restore_directory(source, member, target_file)
+                        
+                        # 체크섬 검증
+                        if 'checksum' in file_info:
+                            if checksum is None:
+                                checksum = self._calculate_checksum(target_file, checksum_algo)
+                            if checksum == file_info['checksum']:
+                                success_count += 1
+                            else:
+                                print(f"체크섬 불일치: {file_path}")
                         else:
-                            print(f"체크섬 불일치: {file_path}")
-                    else:
-                        success_count += 1
-                
-            except Exception as e:
-                print(f"파일 복구 실패: {file_path} - {e}")
-        
-        # 임시 압축 해제 폴더 정리
-        if str(backup_path) != str(Path(backup_path).with_suffix('')):
-            shutil.rmtree(backup_path)
+                            success_count += 1
+                    
+                except Exception as e:
+                    print(f"파일 복구 실패: {file_path} - {e}")
         
         success_rate = (success_count / total_files * 100) if total_files > 0 else 0
         print(f"복구 완료: {success_count}/{total_files} 파일 ({success_rate:.1f}%)")
@@ -274,28 +434,209 @@ class DataBackupManager:
         return success_rate > 90  # 90% 이상 성공시 성공으로 간주
     
     def list_backups(self) -> List[Dict]:
-        """백업 목록 조회"""
+        """백업 목록 조회 (최신순)"""
+        
+        backups = self._catalog_backups()
+        
+        # 생성일시 기준 정렬
+        backups.sort(key=itemgetter('created_ts'), reverse=True)
+        
+        return backups
+    
+    def verify_backup_integrity(self, backup_path: str) -> Dict:
+        """백업 무결성 검증"""
+        
+        backup_path = Path(backup_path)
+        
+        if not backup_path.exists():
+            return {'status': 'error', 'message': 'backup_not_found'}
+        
+        with ExitStack() as stack:
+            # zip은 압축 해제 없이 항목을 스트리밍으로 해시
+            source, extracted_path = self._open_backup_source(backup_path, stack)
+            if extracted_path is not None:
+                stack.callback(shutil.rmtree, extracted_path)
+            
+            if not self._member_exists(source, 'backup_manifest.json'):
+                return {'status': 'error', 'message': 'manifest_not_found'}
+            
+            with self._open_member(source, 'backup_manifest.json') as f:
+                manifest = _parse_manifest(f.read())
+            files = _unpack_files(manifest.get('files', []))
+            
+            verification_result = {
+                'status': 'success',
+                'backup_type': manifest.get('backup_type'),
+                'created_at': manifest.get('created_at'),
+                'total_files': len(files),
+                'verified_files': 0,
+                'missing_files': [],
+                'corrupted_files': [],
+                'integrity_score': 0
+            }
+            checksum_algo = manifest.get('checksum_algo', LEGACY_CHECKSUM_ALGO)
+            
+            # 각 파일 병렬 검증 (압축 해제와 해시 계산은 GIL 해제)
+            max_workers = max(1, min(len(files), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda file_info: self._verify_file(source, file_info, checksum_algo),
+                    files
+                ))
+        
+        for file_path, status in results:
+            if status == 'missing':
+                verification_result['missing_files'].append(file_path)
+            elif status == 'corrupted':
+                verification_result['corrupted_files'].append(file_path)
+            else:
+                verification_result['verified_files'] += 1
+        
+        # 무결성 점수 계산
+        if verification_result['total_files'] > 0:
+            verification_result['integrity_score'] = (
+                verification_result['verified_files'] / verification_result['total_files'] * 100
+            )
+        
+        return verification_result
+    
+    def _verify_file(self, source, file_info: Dict, algo: str) -> Tuple[str, str]:
+        """백업 내 단일 파일 검증 ('ok', 'missing', 'corrupted')"""
+        
+        # 증분 블록 파일은 블록 파일 자체의 체크섬으로 검증
+        delta = file_info.get('delta')
+        file_path = delta['file'] if delta else Path(file_info['path']).name
+        expected_checksum = delta['checksum'] if delta else file_info.get('checksum')
+        
+        if not self._member_exists(source, file_path):
+            return file_path, 'missing'
+        
+        # 체크섬 검증
+        if expected_checksum:
+            if isinstance(source, zipfile.ZipFile):
+                try:
+                    with source.open(file_path) as f:
+                        current_checksum = self._hash_stream(f, algo)
+                except (zipfile.BadZipFile, zipfile.zlib.error, EOFError):
+                    return file_path, 'corrupted'
+            else:
+                current_checksum = self._calculate_checksum(source / file_path, algo)
+            if current_checksum != expected_checksum:
+                return file_path, 'corrupted'
+        
+        return file_path, 'ok'
+    
+    def _open_backup_source(self, backup_path: Path, stack) -> Tuple[object, Optional[Path]]:
+        """백업 항목을 읽을 소스 (zip은 ZipFile, 그 외는 폴더)와 임시 해제 폴더 반환"""
+        
+        if backup_path.suffix == '.zip':
+            return stack.enter_context(zipfile.ZipFile(backup_path, 'r')), None
+        
+        if backup_path.name.endswith(ZSTD_SUFFIX):
+            # tar 스트림은 임의 접근이 불가능하므로 해제 후 사용
+            extracted_path = self._extract_backup(backup_path)
+            return extracted_path, extracted_path
+        
+        return backup_path, None
+    
+    def _member_names(self, source, prefix: str) -> List[str]:
+        """백업 폴더 항목(prefix/...)에 속한 파일의 백업 내 경로 목록"""
+        
+        if isinstance(source, zipfile.ZipFile):
+            return [name for name in source.namelist()
+                    if name.startswith(prefix + '/') and not name.endswith('/')]
+        
+        if not (source / prefix).is_dir():
+            return []
+        members, _ = self._directory_members(source / prefix)
+        return [arcname for _, arcname in members]
+    
+    def _member_exists(self, source, name: str) -> bool:
+        """백업 내 파일 또는 폴더 항목 존재 여부"""
+        
+        if isinstance(source, zipfile.ZipFile):
+            try:
+                source.getinfo(name)
+                return True
+            except KeyError:
+                return bool(self._member_names(source, name))
+        
+        return (source / name).exists()
+    
+    def _open_member(self, source, name: str):
+        """백업 내 파일을 바이너리 스트림으로 열기"""
+        
+        if isinstance(source, zipfile.ZipFile):
+            return source.open(name)
+        return open(source / name, 'rb')
+    
+    def _restore_member(self, source, name: str, target_file: Path,
+                        algo: str = CHECKSUM_ALGO) -> str:
+        """백업 내 파일 하나를 대상 경로로 복구하고 체크섬 반환 (기존 파일은 변경 블록만 기록)"""
+        
+        with self._open_member(source, name) as src:
+            if target_file.is_file():
+                checksum = self._patch_file(src, target_file, algo)
+            else:
+                checksum = self._copy_and_hash(src, target_file, algo)
+        
+        if not isinstance(source, zipfile.ZipFile):
+            # 폴더 백업은 copy2와 같이 메타데이터 보존
+            shutil.copystat(source / name, target_file)
+        
+        return checksum
+    
+    def _restore_directory(self, source, name: str, target_dir: Path):
+        """백업 폴더 항목으로 대상 폴더 갱신 (백업에 없는 항목은 삭제, 기존 파일은 변경 블록만 기록)"""
+        
+        members = {target_dir / member[len(name) + 1:]: member
+                   for member in self._member_names(source, name)}
+        
+        if target_dir.exists() and not target_dir.is_dir():
+            target_dir.unlink()
+        
+        if target_dir.is_dir():
+            expected_dirs = {parent for path in members for parent in path.parents}
+            for root, dirnames, filenames in os.walk(target_dir, topdown=False):
+                root = Path(root)
+                for filename in filenames:
+                    if root / filename not in members:
+                        os.unlink(root / filename)
+                for dirname in dirnames:
+                    path = root / dirname
+                    if path not in expected_dirs:
+                        if path.is_symlink():
+                            path.unlink()
+                        else:
+                            shutil.rmtree(path)
+        
+        for target_file, member in members.items():
+            if target_file.is_dir() and not target_file.is_symlink():
+                shutil.rmtree(target_file)
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            self._restore_member(source, member, target_file)
+    
+    def _scan_backups(self) -> List[Dict]:
+        """백업 폴더를 스캔해 매니페스트에서 백업 목록 구성 (카탈로그 재구축용)"""
         
         backups = []
         
         for backup_file in self.local_backup_path.iterdir():
-            if backup_file.is_file() and backup_file.suffix in ['.zip']:
+            if backup_file.is_file() and backup_file.suffix in ['.zip', '.zst']:
                 # 압축된 백업
                 try:
-                    with zipfile.ZipFile(backup_file, 'r') as zip_file:
-                        if 'backup_manifest.json' in zip_file.namelist():
-                            manifest_data = zip_file.read('backup_manifest.json')
-                            manifest = json.loads(manifest_data.decode('utf-8'))
-                            
-                            backups.append({
-                                'name': backup_file.name,
-                                'path': str(backup_file),
-                                'type': manifest.get('backup_type', 'unknown'),
-                                'created_at': manifest.get('created_at'),
-                                'size_mb': manifest.get('size_mb', 0),
-                                'file_count': len(manifest.get('files', [])),
-                                'compressed': True
-                            })
+                    manifest = self._load_backup_manifest(backup_file)
+                    
+                    backups.append({
+                        'name': backup_file.name,
+                        'path': str(backup_file),
+                        'type': manifest.get('backup_type', 'unknown'),
+                        'created_at': manifest.get('created_at'),
+                        'created_ts': _created_ts(manifest.get('created_at')),
+                        'size_mb': manifest.get('size_mb', 0),
+                        'file_count': _file_count(manifest.get('files', [])),
+                        'compressed': True
+                    })
                 except:
                     continue
             
@@ -304,140 +645,529 @@ class DataBackupManager:
                 manifest_path = backup_file / 'backup_manifest.json'
                 if manifest_path.exists():
                     try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = json.load(f)
+                        manifest = _parse_manifest(manifest_path.read_bytes())
                         
                         backups.append({
                             'name': backup_file.name,
                             'path': str(backup_file),
                             'type': manifest.get('backup_type', 'unknown'),
                             'created_at': manifest.get('created_at'),
+                            'created_ts': _created_ts(manifest.get('created_at')),
                             'size_mb': manifest.get('size_mb', 0),
-                            'file_count': len(manifest.get('files', [])),
+                            'file_count': _file_count(manifest.get('files', [])),
                             'compressed': False
                         })
                     except:
                         continue
         
-        # 생성일시 기준 정렬
-        backups.sort(key=lambda x: x['created_at'], reverse=True)
-        
         return backups
     
-    def verify_backup_integrity(self, backup_path: str) -> Dict:
-        """백업 무결성 검증"""
-        
-        backup_path = Path(backup_path)
-        
-        if not backup_path.exists():
-            return {'status': 'error', 'message': 'backup_not_found'}
+    def _catalog_backups(self) -> List[Dict]:
+        """카탈로그의 백업 목록 (정렬하지 않음, 카탈로그가 없거나 이전 형식이면 폴더 스캔 후 재구축)"""
         
-        # 압축된 백업인 경우 압축 해제
-        if backup_path.suffix in ['.zip', '.gz']:
-            extracted_path = self._extract_backup(backup_path)
-            backup_path = extracted_path
-            cleanup_extracted = True
-        else:
-            cleanup_extracted = False
-        
-        manifest_path = backup_path / 'backup_manifest.json'
+        if self.catalog_path.exists():
+            try:
+                conn = sqlite3.connect(self.catalog_path)
+                conn.row_factory = sqlite3.Row
+                try:
+                    rows = conn.execute(
+                        "SELECT name, path, type, created_at, created_ts, size_mb, file_count, compressed "
+                        "FROM backups"
+                    ).fetchall()
+                finally:
+                    conn.close()
+            except sqlite3.DatabaseError as e:
+                message = str(e).lower()
+                if not any(marker in message for marker in CATALOG_REBUILD_ERRORS):
+                    # 잠금 등 일시적 오류: 카탈로그는 그대로 두고 이번에는 폴더 스캔 결과 사용
+                    print(f"⚠️ 백업 카탈로그 조회 실패 (폴더 스캔으로 대체): {e}")
+                    return self._scan_backups()
+                
+                # 이전 형식이거나 손상된 카탈로그는 다시 구축
+                try:
+                    self.catalog_path.unlink()
+                except OSError as unlink_error:
+                    print(f"⚠️ 백업 카탈로그 삭제 실패 (폴더 스캔으로 대체): {unlink_error}")
+                    return self._scan_backups()
+            else:
+                backups = [dict(row, compressed=bool(row['compressed'])) for row in rows]
+                
+                # 수동으로 삭제된 백업은 카탈로그에서도 제거
+                missing = {b['name'] for b in backups if not os.path.exists(b['path'])}
+                if missing:
+                    self._remove_from_catalog(list(missing))
+                    backups = [b for b in backups if b['name'] not in missing]
+                
+                return backups
         
-        if not manifest_path.exists():
-            return {'status': 'error', 'message': 'manifest_not_found'}
+        backups = self._scan_backups()
+        self._write_catalog(backups)
+        return backups
+    
+    def _write_catalog(self, backups: List[Dict]):
+        """카탈로그에 백업 메타데이터 기록 (없으면 테이블 생성)"""
+        
+        conn = sqlite3.connect(self.catalog_path)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS backups (
+                name TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                type TEXT,
+                created_at TEXT,
+                created_ts REAL,
+                size_mb REAL,
+                file_count INTEGER,
+                compressed INTEGER
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_backups_created_ts ON backups(created_ts)")
+        conn.executemany(
+            "INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(b['name'], b['path'], b['type'], b['created_at'], b['created_ts'], b['size_mb'],
+              b['file_count'], int(b['compressed'])) for b in backups]
+        )
+        conn.commit()
+        conn.close()
+    
+    def _record_backup(self, backup_path: Path, manifest: Dict):
+        """새 백업을 카탈로그에 추가"""
+        
+        if not self.catalog_path.exists():
+            # 첫 실행: 기존 백업까지 스캔해 카탈로그 구축 (방금 만든 백업 포함)
+            self._catalog_backups()
+            return
+        
+        self._write_catalog([{
+            'name': backup_path.name,
+            'path': str(backup_path),
+            'type': manifest.get('backup_type', 'unknown'),
+            'created_at': manifest.get('created_at'),
+            'created_ts': _created_ts(manifest.get('created_at')),
+            'size_mb': manifest.get('size_mb', 0),
+            'file_count': _file_count(manifest.get('files', [])),
+            'compressed': backup_path.is_file()
+        }])
+    
+    def _remove_from_catalog(self, names: List[str]):
+        """카탈로그에서 백업 제거"""
         
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        if not names or not self.catalog_path.exists():
+            return
         
-        verification_result = {
-            'status': 'success',
-            'backup_type': manifest.get('backup_type'),
-            'created_at': manifest.get('created_at'),
-            'total_files': len(manifest.get('files', [])),
-            'verified_files': 0,
-            'missing_files': [],
-            'corrupted_files': [],
-            'integrity_score': 0
-        }
+        conn = sqlite3.connect(self.catalog_path)
+        placeholders = ', '.join('?' * len(names))
+        conn.execute(f"DELETE FROM backups WHERE name IN ({placeholders})", names)
+        conn.commit()
+        conn.close()
+    
+    def _collect_item(self, source_path: Path) -> Optional[Tuple[Dict, List[Tuple[Path, str]]]]:
+        """백업 항목의 매니페스트 항목과 (원본 경로, 백업 내 경로) 목록 수집 (없는 항목은 None)"""
         
-        # 각 파일 검증
-        for file_info in manifest.get('files', []):
-            file_path = Path(file_info['path']).name
-            backup_file = backup_path / file_path
+        if source_path.is_file():
+            # 파일 백업
+            size = source_path.stat().st_size
             
-            if not backup_file.exists():
-                verification_result['missing_files'].append(file_path)
-                continue
+            # 큰 파일은 증분 백업용 블록 시그니처를 체크섬과 같은 읽기에서 계산
+            block_hashes = None
+            if size >= DELTA_MIN_SIZE:
+                checksum, block_hashes = self._checksum_with_blocks(source_path)
+            else:
+                checksum = self._calculate_checksum(source_path, use_cache=True)
             
-            # 체크섬 검증
-            if 'checksum' in file_info:
-                current_checksum = self._calculate_checksum(backup_file)
-                if current_checksum != file_info['checksum']:
-                    verification_result['corrupted_files'].append(file_path)
-                    continue
+            entry = {
+                'path': str(source_path),
+                'type': 'file',
+                'size': size,
+                'checksum': checksum
+            }
             
-            verification_result['verified_files'] += 1
+            if block_hashes is not None:
+                entry['block_size'] = DELTA_BLOCK_SIZE
+                entry['block_hashes'] = block_hashes
+            
+            return entry, [(source_path, source_path.name)]
         
-        # 무결성 점수 계산
-        if verification_result['total_files'] > 0:
-            verification_result['integrity_score'] = (
-                verification_result['verified_files'] / verification_result['total_files'] * 100
-            )
+        if source_path.is_dir():
+            # 폴더 백업
+            members, size = self._directory_members(source_path)
+            
+            return {
+                'path': str(source_path),
+                'type': 'directory',
+                'size': size
+            }, members
         
-        # 임시 폴더 정리
-        if cleanup_extracted:
-            shutil.rmtree(backup_path)
+        return None
+    
+    def _write_backup(self, backup_path: Path, manifest: Optional[Dict],
+                      members: List[Tuple[Path, str]]) -> Path:
+        """매니페스트와 파일을 백업 폴더 또는 압축 아카이브에 기록"""
         
-        return verification_result
+        manifest_data = None
+        if manifest is not None:
+            manifest_data = _dump_manifest(manifest)
+        
+        if self.compression_enabled:
+            archive_path = self._compress_backup(backup_path, members, manifest_data)
+            # 증분 블록 파일 등 임시 폴더 정리
+            if backup_path.exists():
+                shutil.rmtree(backup_path)
+            return archive_path
+        
+        backup_path.mkdir(exist_ok=True)
+        max_workers = max(1, min(len(members), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(
+                lambda member: self._backup_file(member[0], (backup_path / member[1]).parent),
+                members
+            ))
+        
+        if manifest_data is not None:
+            (backup_path / 'backup_manifest.json').write_bytes(manifest_data)
+        
+        return backup_path
     
     def _backup_file(self, source_path: Path, backup_path: Path) -> int:
         """단일 파일 백업"""
         
+        backup_path.mkdir(parents=True, exist_ok=True)
         target_path = backup_path / source_path.name
+        
+        # copy2는 리눅스에서 sendfile, macOS에서 fcopyfile로 커널 내 복사하고
+        # 지원하지 않는 환경에서는 일반 복사로 대체 (수정 시각 등 메타데이터 보존)
         shutil.copy2(source_path, target_path)
         
-        return source_path.stat().st_size
+        return target_path.stat().st_size
     
-    def _backup_directory(self, source_path: Path, backup_path: Path) -> int:
-        """디렉토리 백업"""
+    def _directory_members(self, source_path: Path) -> Tuple[List[Tuple[Path, str]], int]:
+        """디렉토리 내 파일의 (원본 경로, 백업 내 경로) 목록과 전체 크기
         
-        target_path = backup_path / source_path.name
-        shutil.copytree(source_path, target_path, dirs_exist_ok=True)
+        os.scandir 한 번의 순회로 목록과 크기를 함께 수집 (DirEntry 타입 정보 재사용)
+        """
         
-        # 디렉토리 크기 계산
+        members = []
         total_size = 0
-        for file_path in target_path.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        pending = [(source_path, source_path.name)]
+        
+        while pending:
+            directory, prefix = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    arcname = f"{prefix}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((Path(entry.path), arcname))
+                    elif entry.is_file():
+                        members.append((Path(entry.path), arcname))
+                        total_size += entry.stat().st_size
+        
+        return members, total_size
+    
+    def _write_delta(self, source_path: Path, backup_path: Path, base_entry: Dict,
+                     algo: str) -> Optional[Dict]:
+        """기준 시그니처와 다른 블록만 <이름>.delta로 저장 (이득이 없으면 None)"""
+        
+        block_size = base_entry['block_size']
+        base_hashes = base_entry['block_hashes']
+        backup_path.mkdir(exist_ok=True)
+        delta_path = backup_path / (source_path.name + '.delta')
+        changed_blocks = []
+        file_size = 0
+        
+        with open(source_path, 'rb') as src, open(delta_path, 'wb') as out:
+            for index, chunk in enumerate(iter(lambda: src.read(block_size), b'')):
+                file_size += len(chunk)
+                if (index >= len(base_hashes) or
+                        hashlib.blake2b(chunk, digest_size=16).hexdigest() != base_hashes[index]):
+                    changed_blocks.append(index)
+                    out.write(chunk)
+        
+        if delta_path.stat().st_size > file_size * DELTA_MAX_RATIO:
+            delta_path.unlink()
+            return None
+        
+        return {
+            'file': delta_path.name,
+            'block_size': block_size,
+            'blocks': changed_blocks,
+            'file_size': file_size,
+            'base_checksum': base_entry['checksum'],
+            'checksum': self._calculate_checksum(delta_path, algo)
+        }
+    
+    def _apply_delta(self, src, target_file: Path, delta: Dict, algo: str,
+                     verify_base: bool = True) -> bool:
+        """기준 백업 상태의 대상 파일에 변경 블록 스트림 적용 (기준과 다르면 False)"""
+        
+        if not target_file.exists():
+            return False
+        if verify_base and self._calculate_checksum(target_file, algo) != delta['base_checksum']:
+            return False
+        
+        block_size = delta['block_size']
+        file_size = delta['file_size']
         
-        return total_size
+        with open(target_file, 'r+b') as dst:
+            for index in delta['blocks']:
+                offset = index * block_size
+                dst.seek(offset)
+                dst.write(src.read(min(block_size, file_size - offset)))
+            dst.truncate(file_size)
+        
+        return True
     
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """파일 체크섬 계산"""
+    def _restore_base_file(self, base_backup: str, member: str, target_file: Path,
+                           base_checksum: str, algo: str) -> bool:
+        """기준 백업의 파일로 대상 파일을 기준 상태로 되돌림 (체크섬이 일치하면 True)"""
         
-        hash_md5 = hashlib.md5()
+        base_path = Path(base_backup)
+        if not base_path.exists():
+            return False
+        
+        with ExitStack() as stack:
+            source, extracted_path = self._open_backup_source(base_path, stack)
+            if extracted_path is not None:
+                stack.callback(shutil.rmtree, extracted_path)
+            
+            if not self._member_exists(source, member):
+                return False
+            
+            return self._restore_member(source, member, target_file, algo) == base_checksum
+    
+    def _copy_and_hash(self, src, target_path: Path, algo: str = CHECKSUM_ALGO) -> str:
+        """스트림을 대상 파일로 복사하면서 같은 버퍼로 체크섬 계산"""
+        
+        hasher = _new_hasher(algo)
+        buffer = bytearray(CHECKSUM_BUFFER)
+        view = memoryview(buffer)
+        
+        with open(target_path, 'wb') as dst:
+            while True:
+                size = src.readinto(buffer)
+                if not size:
+                    break
+                dst.write(view[:size])
+                hasher.update(view[:size])
+        
+        return hasher.hexdigest()
+    
+    def _patch_file(self, src, target_path: Path, algo: str = CHECKSUM_ALGO) -> str:
+        """기존 대상 파일과 블록 단위로 비교해 달라진 블록만 기록하고 원본 체크섬 반환"""
+        
+        hasher = _new_hasher(algo)
+        file_size = 0
+        
+        with open(target_path, 'r+b') as dst:
+            while True:
+                chunk = src.read(DELTA_BLOCK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                
+                if dst.read(len(chunk)) != chunk:
+                    dst.seek(file_size)
+                    dst.write(chunk)
+                file_size += len(chunk)
+                dst.seek(file_size)
+            dst.truncate(file_size)
+        
+        return hasher.hexdigest()
+    
+    def _hash_stream(self, stream, algo: str = CHECKSUM_ALGO) -> str:
+        """바이너리 스트림 체크섬 (zip 항목을 압축 해제하면서 해시)"""
         
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
+        hasher = _new_hasher(algo)
+        for chunk in iter(lambda: stream.read(CHECKSUM_BUFFER), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def _calculate_checksum(self, file_path: Path, algo: str = CHECKSUM_ALGO,
+                            use_cache: bool = False) -> str:
+        """파일 체크섬 계산 (blake3 또는 SHA-256, 기존 백업 검증 시 md5)
+        
+        use_cache=True면 백업 원본 파일의 (mtime_ns, size)가 이전 계산과 같을 때
+        캐시된 값을 반환한다. 검증/복구 경로는 실제 내용을 다시 읽어야 하므로 사용하지 않는다.
+        """
+        
+        if use_cache:
+            key = os.path.abspath(file_path)
+            stat = os.stat(file_path)
+            cached = self._checksum_cache.get(key)
+            if (cached and cached['algo'] == algo and cached['size'] == stat.st_size
+                    and cached['mtime_ns'] == stat.st_mtime_ns):
+                return cached['checksum']
+            
+            checksum = self._calculate_checksum(file_path, algo)
+            self._checksum_cache[key] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'algo': algo,
+                'checksum': checksum
+            }
+            return checksum
+        
+        hasher = _new_hasher(algo)
+        
+        file_size = os.path.getsize(file_path)
+        
+        if file_size > CHECKSUM_MMAP_THRESHOLD:
+            # 대용량 DB: 커널 페이지 캐시를 그대로 해시 (순차 미리읽기 힌트)
+            with open(file_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mm)
+            return hasher.hexdigest()
+        
+        if file_size < CHECKSUM_BUFFER:
+            # 작은 파일 (logs/ 등): 버퍼 할당과 읽기 루프 없이 한 번에 해시
+            with open(file_path, "rb", buffering=0) as f:
+                hasher.update(f.read())
+            return hasher.hexdigest()
+        
+        buffer = bytearray(CHECKSUM_BUFFER)
+        view = memoryview(buffer)
+        
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(os, 'posix_fadvise'):
+                # 순차 읽기 힌트 (리눅스)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            readinto = f.readinto
+            update = hasher.update
+            while True:
+                size = readinto(buffer)
+                if not size:
+                    break
+                update(view[:size])
+        
+        return hasher.hexdigest()
+    
+    def _checksum_with_blocks(self, file_path: Path,
+                              algo: str = CHECKSUM_ALGO) -> Tuple[str, List[str]]:
+        """체크섬과 고정 크기 블록별 해시 목록(증분 백업 시그니처)을 한 번의 읽기로 계산
+        
+        결과는 체크섬 캐시 항목에 함께 저장되어 (mtime_ns, size)가 같으면 파일을 읽지 않는다.
+        """
+        
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        cached = self._checksum_cache.get(key)
+        if (cached and cached['algo'] == algo and cached['size'] == stat.st_size
+                and cached['mtime_ns'] == stat.st_mtime_ns
+                and cached.get('block_size') == DELTA_BLOCK_SIZE):
+            return cached['checksum'], cached['block_hashes']
+        
+        hasher = _new_hasher(algo)
+        block_hashes = []
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(DELTA_BLOCK_SIZE), b''):
+                hasher.update(chunk)
+                block_hashes.append(hashlib.blake2b(chunk, digest_size=16).hexdigest())
+        
+        checksum = hasher.hexdigest()
+        self._checksum_cache[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'algo': algo,
+            'checksum': checksum,
+            'block_size': DELTA_BLOCK_SIZE,
+            'block_hashes': block_hashes
+        }
+        return checksum, block_hashes
+    
+    def _load_checksum_cache(self) -> Dict:
+        """체크섬 캐시 로드 (없거나 손상되면 빈 캐시)"""
         
-        return hash_md5.hexdigest()
+        try:
+            with open(self.checksum_cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_checksum_cache(self):
+        """체크섬 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        
+        tmp_path = self.checksum_cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._checksum_cache, f, ensure_ascii=False)
+            os.replace(tmp_path, self.checksum_cache_path)
+        except OSError as e:
+            print(f"체크섬 캐시 저장 실패: {e}")
     
-    def _compress_backup(self, backup_path: Path) -> Path:
-        """백업 압축"""
+    def _compress_backup(self, backup_path: Path, members: List[Tuple[Path, str]],
+                         manifest_data: Optional[bytes] = None) -> Path:
+        """원본 파일을 임시 복사 없이 압축 아카이브에 직접 기록"""
+        
+        if self.compression_method == 'zstd':
+            return self._compress_backup_zstd(backup_path, members, manifest_data)
         
         zip_path = backup_path.with_suffix('.zip')
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for file_path in backup_path.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(backup_path)
-                    zip_file.write(file_path, arcname)
+        with zipfile.ZipFile(zip_path, 'w', ZIP_METHODS[self.compression_method],
+                             compresslevel=self.compression_level) as zip_file:
+            if manifest_data is not None:
+                zip_file.writestr('backup_manifest.json', manifest_data)
+            for source_path, arcname in members:
+                if self.use_isal:
+                    self._write_isal_member(zip_file, source_path, arcname)
+                else:
+                    zip_file.write(source_path, arcname)
         
         return zip_path
     
+    def _write_isal_member(self, zip_file: zipfile.ZipFile, source_path: Path, arcname: str):
+        """ISA-L로 압축한 DEFLATE 스트림을 zip 항목으로 기록
+        
+        zipfile.zlib를 교체하지 않고 이 항목 작성기의 압축기만 바꾸므로
+        동시에 zip을 읽고 쓰는 다른 스레드(검증, openpyxl 내보내기 등)에 영향이 없다.
+        """
+        
+        zinfo = zipfile.ZipInfo.from_file(source_path, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        with open(source_path, 'rb') as src, zip_file.open(zinfo, 'w') as dst:
+            # raw DEFLATE (wbits=-15) - zipfile 기본 압축기와 같은 형식, CRC/크기는 작성기가 계산
+            dst._compressor = isal_zlib.compressobj(self.compression_level, isal_zlib.DEFLATED, -15)
+            shutil.copyfileobj(src, dst, CHECKSUM_BUFFER)
+    
+    def _compress_backup_zstd(self, backup_path: Path, members: List[Tuple[Path, str]],
+                              manifest_data: Optional[bytes] = None) -> Path:
+        """백업을 .tar.zst로 압축 (매니페스트를 맨 앞에 기록해 목록 조회 시 앞부분만 읽음)"""
+        
+        archive_path = backup_path.parent / (backup_path.name + ZSTD_SUFFIX)
+        compressor = zstandard.ZstdCompressor(level=self.compression_level, threads=-1)
+        
+        with open(archive_path, 'wb') as out, \
+             compressor.stream_writer(out) as writer, \
+             tarfile.open(mode='w|', fileobj=writer) as tar:
+            if manifest_data is not None:
+                info = tarfile.TarInfo('backup_manifest.json')
+                info.size = len(manifest_data)
+                info.mtime = int(time.time())
+                tar.addfile(info, io.BytesIO(manifest_data))
+            for source_path, arcname in members:
+                tar.add(source_path, arcname=arcname)
+        
+        return archive_path
+    
+    def _open_zstd_tar(self, backup_path: Path, stack):
+        """.tar.zst 백업을 스트리밍 tar로 열기"""
+        
+        source = stack.enter_context(open(backup_path, 'rb'))
+        reader = stack.enter_context(zstandard.ZstdDecompressor().stream_reader(source))
+        return stack.enter_context(tarfile.open(mode='r|', fileobj=reader))
+    
     def _extract_backup(self, backup_path: Path) -> Path:
         """백업 압축 해제"""
         
+        if backup_path.name.endswith(ZSTD_SUFFIX):
+            extract_path = backup_path.parent / backup_path.name[:-len(ZSTD_SUFFIX)]
+            extract_path.mkdir(exist_ok=True)
+            
+            with ExitStack() as stack:
+                self._open_zstd_tar(backup_path, stack).extractall(extract_path, filter='data')
+            
+            return extract_path
+        
         if backup_path.suffix == '.zip':
             extract_path = backup_path.parent / backup_path.stem
             extract_path.mkdir(exist_ok=True)
@@ -452,13 +1182,10 @@ class DataBackupManager:
     def _find_latest_full_backup(self) -> Optional[str]:
         """최신 전체 백업 찾기"""
         
-        backups = self.list_backups()
+        full_backups = (b for b in self._catalog_backups() if b['type'] == 'full')
+        latest = max(full_backups, key=itemgetter('created_ts'), default=None)
         
-        for backup in backups:
-            if backup['type'] == 'full':
-                return backup['path']
-        
-        return None
+        return latest['path'] if latest else None
     
     def _load_backup_manifest(self, backup_path: str) -> Dict:
         """백업 매니페스트 로드"""
@@ -467,12 +1194,16 @@ class DataBackupManager:
         
         if backup_path.suffix == '.zip':
             with zipfile.ZipFile(backup_path, 'r') as zip_file:
-                manifest_data = zip_file.read('backup_manifest.json')
-                return json.loads(manifest_data.decode('utf-8'))
+                return _parse_manifest(zip_file.read('backup_manifest.json'))
+        elif backup_path.name.endswith(ZSTD_SUFFIX):
+            with ExitStack() as stack:
+                tar = self._open_zstd_tar(backup_path, stack)
+                for member in tar:
+                    if member.name == 'backup_manifest.json':
+                        return _parse_manifest(tar.extractfile(member).read())
+            raise KeyError('backup_manifest.json')
         else:
-            manifest_path = backup_path / 'backup_manifest.json'
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _parse_manifest((backup_path / 'backup_manifest.json').read_bytes())
     
     def _is_base_backup_restored(self, base_backup: str) -> bool:
         """기준 백업이 복구되었는지 확인"""
@@ -483,25 +1214,43 @@ class DataBackupManager:
     def _cleanup_old_backups(self):
         """오래된 백업 정리"""
         
-        backups = self.list_backups()
+        backups = self._catalog_backups()
         
-        # 보존 기간 초과 백업 삭제
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        # 보존 기간 초과 백업 + 최대 백업 수 초과 백업 삭제
+        cutoff_ts = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+        expired_backups = [b for b in backups if b['created_at'] and b['created_ts'] < cutoff_ts]
         
-        # 최대 백업 수 초과시 삭제
+        excess_backups = []
         if len(backups) > self.max_backups:
-            excess_backups = backups[self.max_backups:]
-            for backup in excess_backups:
-                try:
-                    backup_path = Path(backup['path'])
-                    if backup_path.exists():
-                        if backup_path.is_file():
-                            backup_path.unlink()
-                        else:
-                            shutil.rmtree(backup_path)
-                    print(f"오래된 백업 삭제: {backup['name']}")
-                except Exception as e:
-                    print(f"백업 삭제 실패: {backup['name']} - {e}")
+            kept = {b['name'] for b in heapq.nlargest(self.max_backups, backups,
+                                                      key=itemgetter('created_ts'))}
+            excess_backups = [b for b in backups if b['name'] not in kept]
+        
+        old_backups = list({b['name']: b for b in expired_backups + excess_backups}.values())
+        if not old_backups:
+            return
+        
+        # 파일/폴더 삭제를 병렬로 수행 (느린 디스크에서 inode 작업 겹치기)
+        with ThreadPoolExecutor(max_workers=min(8, len(old_backups))) as executor:
+            deleted = list(executor.map(self._delete_backup, old_backups))
+        
+        self._remove_from_catalog([b['name'] for b, ok in zip(old_backups, deleted) if ok])
+    
+    def _delete_backup(self, backup: Dict) -> bool:
+        """단일 백업 삭제"""
+        
+        try:
+            backup_path = Path(backup['path'])
+            if backup_path.exists():
+                if backup_path.is_file():
+                    backup_path.unlink()
+                else:
+                    shutil.rmtree(backup_path)
+            print(f"오래된 백업 삭제: {backup['name']}")
+            return True
+        except Exception as e:
+            print(f"백업 삭제 실패: {backup['name']} - {e}")
+            return False
     
     def create_emergency_backup(self) -> str:
         """긴급 백업 (핵심 데이터만)"""
@@ -514,20 +1263,13 @@ class DataBackupManager:
         
         backup_name = f"emergency_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         backup_path = self.local_backup_path / backup_name
-        backup_path.mkdir(exist_ok=True)
         
         print(f"긴급 백업 시작: {backup_name}")
         
-        for item in emergency_items:
-            source_path = Path(item)
-            if source_path.exists():
-                self._backup_file(source_path, backup_path)
+        members = [(Path(item), Path(item).name) for item in emergency_items if Path(item).exists()]
         
-        # 압축
-        if self.compression_enabled:
-            compressed_path = self._compress_backup(backup_path)
-            shutil.rmtree(backup_path)
-            backup_path = compressed_path
+        # 저장 (압축 시 아카이브에 직접 기록)
+        backup_path = self._write_backup(backup_path, None, members)
         
         print(f"긴급 백업 완료: {backup_path}")
         return str(backup_path)
@@ -4,6 +4,10 @@
 
 import smtplib
 import json
+import atexit
+import re
+import threading
+import time
 import requests
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -15,6 +19,14 @@ from dataclasses import dataclass
 import logging
 import os
 
+def _smtp_body(text: str) -> bytes:
+    """DATA 본문 인코딩 (CRLF 정규화, 점 이스케이프, 종료 마커)"""
+    data = re.sub(r'\r\n|\r|\n', '\r\n', text).encode('ascii')
+    data = re.sub(br'(?m)^\.', b'..', data)
+    if not data.endswith(b'\r\n'):
+        data += b'\r\n'
+    return data + b'.\r\n'
+
 @dataclass
 class NotificationMessage:
     """알림 메시지"""
@@ -35,6 +47,8 @@ class NotificationConfig:
     email_password: str = ""
     email_from: str = ""
     email_to: List[str] = None
+    email_max_per_connection: int = 1000  # 세션당 최대 발송 수 (초과 시 재연결)
+    email_idle_timeout_s: float = 90.0    # 이 시간 이상 쉬었던 세션은 재연결
     
     slack_enabled: bool = False
     slack_webhook_url: str = ""
@@ -56,6 +70,17 @@ class NotificationSystem:
         self.notification_history = []
         self.max_history = 1000
         
+        # SMTP 세션 재사용 (메시지마다 TCP/TLS 연결과 로그인을 반복하지 않음)
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._smtp_msgs_sent = 0
+        self._smtp_last_used = 0.0
+        atexit.register(self.close)
+        
+        # 일괄 발송 모드: 이메일을 모아 두었다가 flush_batch()에서 한 세션으로 발송
+        self.batch_mode = False
+        self._pending = []
+        
         self.logger.info("📢 알림 시스템 초기화 완료")
     
     def load_config(self) -> NotificationConfig:
@@ -73,6 +98,8 @@ class NotificationSystem:
                     email_password=config_data.get('email', {}).get('password', ''),
                     email_from=config_data.get('email', {}).get('from_email', ''),
                     email_to=config_data.get('email', {}).get('to_emails', []),
+                    email_max_per_connection=config_data.get('email', {}).get('max_per_connection', 1000),
+                    email_idle_timeout_s=config_data.get('email', {}).get('idle_timeout_s', 90.0),
                     
                     slack_enabled=config_data.get('slack', {}).get('enabled', False),
                     slack_webhook_url=config_data.get('slack', {}).get('webhook_url', ''),
@@ -101,7 +128,9 @@ class NotificationSystem:
                 "username": "your_email@gmail.com",
                 "password": "your_app_password",
                 "from_email": "your_email@gmail.com",
-                "to_emails": ["recipient@gmail.com"]
+                "to_emails": ["recipient@gmail.com"],
+                "max_per_connection": 1000,
+                "idle_timeout_s": 90.0
             },
             "slack": {
                 "enabled": False,
@@ -150,10 +179,13 @@ class NotificationSystem:
             if len(self.notification_history) > self.max_history:
                 self.notification_history = self.notification_history[-self.max_history:]
             
-            # 이메일 발송
+            # 이메일 발송 (일괄 발송 모드면 대기열에 추가)
             if self.config.email_enabled:
-                email_success = self.send_email(message)
-                success = success and email_success
+                if self.batch_mode:
+                    self._pending.append(message)
+                else:
+                    email_success = self.send_email(message)
+                    success = success and email_success
             
             # 슬랙 발송
             if self.config.slack_enabled:
@@ -176,91 +208,246 @@ class NotificationSystem:
             self.logger.error(f"❌ 알림 발송 실패: {e}")
             return False
     
+    def send_notifications_bulk(self, messages: List[NotificationMessage]) -> bool:
+        """여러 알림 일괄 발송 (이메일은 한 SMTP 세션에서 파이프라이닝으로 발송)"""
+        batch_mode = self.batch_mode
+        self.batch_mode = True
+        try:
+            results = [self.send_notification(message) for message in messages]
+        finally:
+            self.batch_mode = batch_mode
+        
+        return self.flush_batch() and all(results)
+    
     def send_email(self, message: NotificationMessage) -> bool:
         """이메일 발송"""
         try:
             if not self.config.email_enabled or not self.config.email_to:
                 return True  # 비활성화시 성공으로 처리
             
-            # 이메일 메시지 구성
-            msg = MIMEMultipart()
-            msg['From'] = self.config.email_from
-            msg['To'] = ', '.join(self.config.email_to)
-            msg['Subject'] = f"[ETF 시스템] {message.title}"
+            text = self._build_email(message)
             
-            # 우선순위에 따른 제목 꾸미기
-            priority_prefix = {
-                'low': '📘',
-                'normal': '📊',
-                'high': '⚠️',
-                'urgent': '🚨'
-            }.get(message.priority, '📊')
+            # SMTP 발송 (열려 있는 세션 재사용, 끊긴 세션이면 한 번 재연결)
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().sendmail(self.config.email_from, self.config.email_to, text)
+                except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                    self._close_smtp()
+                    self._get_smtp().sendmail(self.config.email_from, self.config.email_to, text)
+                self._smtp_msgs_sent += 1
+                self._smtp_last_used = time.monotonic()
             
-            msg['Subject'] = f"{priority_prefix} [ETF 시스템] {message.title}"
+            self.logger.info(f"📧 이메일 발송 성공: {message.title}")
+            return True
             
-            # HTML 이메일 본문 생성
-            html_body = f"""
-            <html>
-            <head></head>
-            <body>
-                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px;">
-                        <h2 style="color: #2c3e50; margin-bottom: 20px;">
-                            {priority_prefix} {message.title}
-                        </h2>
-                        <div style="background-color: white; padding: 20px; border-radius: 5px; 
-                                    border-left: 4px solid #3498db;">
-                            <p style="color: #34495e; line-height: 1.6; margin-bottom: 15px;">
-                                {message.content.replace('\n', '<br>')}
-                            </p>
-                        </div>
-                        <div style="margin-top: 20px; padding-top: 15px; border-top: 1px solid #e9ecef;">
-                            <p style="color: #6c757d; font-size: 12px; margin: 0;">
-                                발송 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-                                카테고리: {message.category} | 우선순위: {message.priority}<br>
-                                ETF 장기투자 관리 시스템 v1.0.0
-                            </p>
-                        </div>
+        except Exception as e:
+            self.logger.error(f"❌ 이메일 발송 실패: {e}")
+            return False
+    
+    def _build_email(self, message: NotificationMessage) -> str:
+        """알림 메시지를 이메일 원문으로 구성"""
+        # 이메일 메시지 구성
+        msg = MIMEMultipart()
+        msg['From'] = self.config.email_from
+        msg['To'] = ', '.join(self.config.email_to)
+        msg['Subject'] = f"[ETF 시스템] {message.title}"
+        
+        # 우선순위에 따른 제목 꾸미기
+        priority_prefix = {
+            'low': '📘',
+            'normal': '📊',
+            'high': '⚠️',
+            'urgent': '🚨'
+        }.get(message.priority, '📊')
+        
+        msg['Subject'] = f"{priority_prefix} [ETF 시스템] {message.title}"
+        
+        # HTML 이메일 본문 생성
+        html_body = f"""
+        <html>
+        <head></head>
+        <body>
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px;">
+                    <h2 style="color: #2c3e50; margin-bottom: 20px;">
+                        {priority_prefix} {message.title}
+                    </h2>
+                    <div style="background-color: white; padding: 20px; border-radius: 5px; 
+                                border-left: 4px solid #3498db;">
+                        <p style="color: #34495e; line-height: 1.6; margin-bottom: 15px;">
+                            {message.content.replace('\n', '<br>')}
+                        </p>
+                    </div>
+                    <div style="margin-top: 20px; padding-top: 15px; border-top: 1px solid #e9ecef;">
+                        <p style="color: #6c757d; font-size: 12px; margin: 0;">
+                            발송 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
+                            카테고리: {message.category} | 우선순위: {message.priority}<br>
+                            ETF 장기투자 관리 시스템 v1.0.0
+                        </p>
                     </div>
                 </div>
-            </body>
-            </html>
-            """
-            
-            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
-            
-            # 첨부파일 처리
-            if message.attachments:
-                for file_path in message.attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, "rb") as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                        
-                        encoders.encode_base64(part)
-                        filename = os.path.basename(file_path)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename= {filename}'
-                        )
-                        msg.attach(part)
+            </div>
+        </body>
+        </html>
+        """
+        
+        msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+        
+        # 첨부파일 처리
+        if message.attachments:
+            for file_path in message.attachments:
+                if os.path.exists(file_path):
+                    with open(file_path, "rb") as attachment:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(attachment.read())
+                    
+                    encoders.encode_base64(part)
+                    filename = os.path.basename(file_path)
+                    part.add_header(
+                        'Content-Disposition',
+                        f'attachment; filename= {filename}'
+                    )
+                    msg.attach(part)
+        
+        return msg.as_string()
+    
+    def flush_batch(self) -> bool:
+        """대기 중인 이메일 알림을 한 SMTP 세션에서 일괄 발송"""
+        if not self._pending:
+            return True
+        
+        messages, self._pending = self._pending, []
+        
+        try:
+            if not self.config.email_enabled or not self.config.email_to:
+                return True  # 비활성화시 성공으로 처리
             
-            # SMTP 서버 연결 및 발송
-            server = smtplib.SMTP(self.config.email_smtp_server, self.config.email_smtp_port)
-            server.starttls()
-            server.login(self.config.email_username, self.config.email_password)
+            texts = [self._build_email(message) for message in messages]
+            sent = 0
             
-            text = msg.as_string()
-            server.sendmail(self.config.email_from, self.config.email_to, text)
-            server.quit()
+            with self._smtp_lock:
+                # 세션당 발송 한도를 넘지 않도록 나눠 발송 (한도에 닿으면 _get_smtp가 재연결)
+                start = 0
+                while start < len(texts):
+                    server = self._get_smtp()
+                    remaining = max(1, self.config.email_max_per_connection - self._smtp_msgs_sent)
+                    chunk = texts[start:start + remaining]
+                    start += len(chunk)
+                    
+                    if server.has_extn('pipelining'):
+                        results = self._send_pipelined(server, chunk)
+                    else:
+                        # 파이프라이닝 미지원 서버: 같은 세션에서 순차 발송
+                        results = []
+                        for text in chunk:
+                            try:
+                                server.sendmail(self.config.email_from, self.config.email_to, text)
+                                results.append(True)
+                            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused,
+                                    smtplib.SMTPDataError) as e:
+                                self.logger.error(f"❌ 이메일 발송 실패: {e}")
+                                results.append(False)
+                    
+                    sent += sum(results)
+                    self._smtp_msgs_sent += len(results)
+                    self._smtp_last_used = time.monotonic()
             
-            self.logger.info(f"📧 이메일 발송 성공: {message.title}")
-            return True
+            self.logger.info(f"📧 이메일 일괄 발송: {sent}/{len(messages)}건 성공")
+            return sent == len(messages)
             
         except Exception as e:
-            self.logger.error(f"❌ 이메일 발송 실패: {e}")
+            with self._smtp_lock:
+                self._close_smtp()
+            self.logger.error(f"❌ 이메일 일괄 발송 실패: {e}")
             return False
     
+    def _send_pipelined(self, server: smtplib.SMTP, texts: List[str]) -> List[bool]:
+        """PIPELINING(RFC 2920)으로 MAIL/RCPT/DATA를 응답 대기 없이 연속 전송
+        
+        각 메시지는 명령 묶음 전송 후 354 응답을 받으면 본문을 보내며,
+        본문 끝(.)과 다음 메시지의 명령 묶음을 한 번에 기록해 왕복을 줄인다.
+        """
+        envelope = (f"MAIL FROM:{smtplib.quoteaddr(self.config.email_from)}\r\n"
+                    + ''.join(f"RCPT TO:{smtplib.quoteaddr(to)}\r\n" for to in self.config.email_to)
+                    + "DATA\r\n").encode('ascii')
+        
+        results = []
+        pending_body = b''
+        
+        for text in texts:
+            server.send(pending_body + envelope)
+            if pending_body:
+                results.append(server.getreply()[0] == 250)
+            pending_body = b''
+            
+            mail_code = server.getreply()[0]
+            rcpt_codes = [server.getreply()[0] for _ in self.config.email_to]
+            data_code = server.getreply()[0]
+            
+            if data_code == 354:
+                if mail_code == 250 and any(code in (250, 251) for code in rcpt_codes):
+                    pending_body = _smtp_body(text)
+                    continue
+                # 수신자가 모두 거부됐는데 DATA가 수락된 경우: 빈 본문으로 종료 후 초기화
+                server.send(b'.\r\n')
+                server.getreply()
+            
+            server.rset()
+            results.append(False)
+        
+        if pending_body:
+            server.send(pending_body)
+            results.append(server.getreply()[0] == 250)
+        
+        return results
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """SMTP 세션 반환 (살아 있으면 재사용, 아니면 새로 연결 후 로그인)"""
+        if self._smtp is not None and (
+                self._smtp_msgs_sent >= self.config.email_max_per_connection
+                or time.monotonic() - self._smtp_last_used > self.config.email_idle_timeout_s):
+            # 세션당 발송 한도 초과 또는 오래 쉬었던 세션은 서버가 끊기 전에 교체
+            self._close_smtp()
+        
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.config.email_smtp_server, self.config.email_smtp_port)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(self.config.email_username, self.config.email_password)
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        self._smtp_msgs_sent = 0
+        self._smtp_last_used = time.monotonic()
+        return server
+    
+    def _close_smtp(self):
+        """SMTP 세션 종료 (이미 끊긴 경우 소켓만 정리)"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def close(self):
+        """알림 시스템 종료 (열린 SMTP 세션 정리)"""
+        with self._smtp_lock:
+            self._close_smtp()
+    
     def send_slack(self, message: NotificationMessage) -> bool:
         """슬랙 메시지 발송"""
         try:
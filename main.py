@@ -6,72 +6,120 @@ import sys
 import os
 import time
 import argparse
+import atexit
+import functools
 import logging
+import logging.handlers
+import operator
+import queue
 import json
-from datetime import datetime
+import subprocess
 from pathlib import Path
 
-# 콘솔 인코딩 설정 (Windows 안전)
+# orjson이 있으면 빠른 직렬화 사용 (없으면 표준 json)
 try:
-    if sys.platform.startswith('win'):
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
-except Exception:
-    pass  # 인코딩 설정 실패해도 계속 진행
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 콘솔 인코딩 설정 (Windows 안전, 기존 TextIOWrapper를 그대로 재설정)
+if sys.platform.startswith('win'):
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding='utf-8', errors='replace')
+        except AttributeError:
+            pass  # reconfigure 미지원 스트림(리다이렉트 등)은 그대로 사용
 
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = Path(__file__).parent.absolute()
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# 출력 디렉토리 (한 번만 생성)
+LOG_DIR = PROJECT_ROOT / 'logs'
+RESULTS_DIR = PROJECT_ROOT / 'results'
+
+def _init_dirs():
+    """로그/결과 디렉토리 생성"""
+    for directory in (LOG_DIR, RESULTS_DIR):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # 디렉토리 생성 실패해도 계속 진행
 
 # 모듈 import 상태 추적
 modules_loaded = {}
 
-# ETFUpdateManager import 시도 (안전하게)
-try:
-    from core.update_manager import ETFUpdateManager
-    modules_loaded['UpdateManager'] = True
-    print("✅ ETFUpdateManager 사용 가능")
-except ImportError as e:
-    modules_loaded['UpdateManager'] = False
-    print(f"⚠️ UpdateManager import 실패: {e}")
+# 업데이트 요약에서 사용하는 필드와 기본값
+_SUMMARY_FIELDS = ('total_etfs', 'successful_updates', 'failed_updates', 'success_rate', 'total_aum')
+_SUMMARY_DEFAULTS = (0, 0, 0, 0.0, 0)
+_extract_summary = operator.attrgetter(*_SUMMARY_FIELDS)
+
+def _summary_values(summary) -> tuple:
+    """요약 객체에서 필드 값을 한 번에 추출 (누락 필드는 기본값)"""
+    try:
+        return _extract_summary(summary)
+    except AttributeError:
+        return tuple(getattr(summary, field, default)
+                     for field, default in zip(_SUMMARY_FIELDS, _SUMMARY_DEFAULTS))
+
+# ETFUpdateManager는 실제로 필요할 때 import (status/dashboard 시작 속도 개선)
+ETFUpdateManager = None
+
+# 더미 UpdateManager 클래스
+class DummyUpdateManager:
+    def __init__(self, **kwargs):
+        self.db_path = kwargs.get('db_path', 'etf_universe.db')
     
-    # 더미 UpdateManager 클래스
-    class DummyUpdateManager:
-        def __init__(self, **kwargs):
-            self.db_path = kwargs.get('db_path', 'etf_universe.db')
+    def batch_update_all_etfs(self, **kwargs):
+        max_etfs = kwargs.get('max_etfs', 683)
+        delay = kwargs.get('delay_between_updates', 1.0)
         
-        def batch_update_all_etfs(self, **kwargs):
-            max_etfs = kwargs.get('max_etfs', 683)
-            delay = kwargs.get('delay_between_updates', 1.0)
-            
-            print(f"🔧 더미 모드: {max_etfs}개 ETF 업데이트 시뮬레이션")
-            print(f"⏱️ 지연시간: {delay}초")
-            
-            # 시뮬레이션
-            import random
-            time.sleep(1)  # 간단한 시뮬레이션
-            
-            class DummySummary:
-                def __init__(self):
-                    self.total_etfs = max_etfs or 683
-                    self.successful_updates = int(self.total_etfs * 0.85)
-                    self.failed_updates = self.total_etfs - self.successful_updates
-                    self.success_rate = (self.successful_updates / self.total_etfs) * 100
-                    self.total_aum = self.successful_updates * 3000  # 평균 3000억원
-                    self.total_duration = self.total_etfs * 0.1  # 0.1초씩
-            
-            return DummySummary()
+        print(f"🔧 더미 모드: {max_etfs}개 ETF 업데이트 시뮬레이션")
+        print(f"⏱️ 지연시간: {delay}초")
         
-        def get_etf_statistics(self):
-            return {
-                'basic_stats': {
-                    'total_etfs': 683,
-                    'total_aum': 2000000
-                }
+        # 시뮬레이션
+        import random
+        time.sleep(1)  # 간단한 시뮬레이션
+        
+        class DummySummary:
+            def __init__(self):
+                self.total_etfs = max_etfs or 683
+                self.successful_updates = int(self.total_etfs * 0.85)
+                self.failed_updates = self.total_etfs - self.successful_updates
+                self.success_rate = (self.successful_updates / self.total_etfs) * 100
+                self.total_aum = self.successful_updates * 3000  # 평균 3000억원
+                self.total_duration = self.total_etfs * 0.1  # 0.1초씩
+        
+        return DummySummary()
+    
+    def get_etf_statistics(self):
+        return {
+            'basic_stats': {
+                'total_etfs': 683,
+                'total_aum': 2000000
             }
+        }
+
+def _load_update_manager():
+    """ETFUpdateManager 지연 import (실패 시 더미 클래스 사용)"""
+    global ETFUpdateManager
     
-    ETFUpdateManager = DummyUpdateManager
+    if ETFUpdateManager is not None:
+        return ETFUpdateManager
+    
+    try:
+        from core.update_manager import ETFUpdateManager as _UpdateManager
+        modules_loaded['UpdateManager'] = True
+        print("✅ ETFUpdateManager 사용 가능")
+    except ImportError as e:
+        _UpdateManager = DummyUpdateManager
+        modules_loaded['UpdateManager'] = False
+        print(f"⚠️ UpdateManager import 실패: {e}")
+    
+    ETFUpdateManager = _UpdateManager
+    return ETFUpdateManager
 
 class SafeETFLauncher:
     """안전한 ETF 시스템 런처"""
@@ -89,38 +137,60 @@ class SafeETFLauncher:
         
         print("🚀 ETF 시스템 런처 초기화 완료")
     
+    @staticmethod
+    def _emit(*lines):
+        """여러 줄을 한 번의 write로 출력"""
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+    
     def setup_logging(self):
         """로깅 설정 (안전하게)"""
         try:
             log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             
-            # 로그 디렉토리 생성
-            log_dir = PROJECT_ROOT / 'logs'
-            log_dir.mkdir(exist_ok=True)
-            
             # 로그 파일 설정
-            log_file = log_dir / f'etf_system_{datetime.now().strftime("%Y%m%d")}.log'
+            log_file = LOG_DIR / f'etf_system_{time.strftime("%Y%m%d")}.log'
+            
+            # 파일 I/O는 백그라운드 리스너가 담당 (업데이트 루프 블로킹 방지)
+            log_queue = queue.SimpleQueue()
+            
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter(log_format))
             
             logging.basicConfig(
                 level=logging.INFO,
                 format=log_format,
-                handlers=[
-                    logging.FileHandler(log_file, encoding='utf-8'),
-                    logging.StreamHandler()
-                ]
+                handlers=[logging.StreamHandler()]
             )
+            
+            # QueueHandler는 포매터 없이 추가 (포맷은 리스너의 file_handler가 한 번만 적용)
+            logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+            
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            self._log_listener.start()
+            atexit.register(self._stop_log_listener)
         except Exception as e:
             # 로깅 설정 실패해도 계속 진행
             print(f"⚠️ 로깅 설정 실패 (계속 진행): {e}")
             logging.basicConfig(level=logging.INFO)
     
+    def _stop_log_listener(self):
+        """로그 리스너 종료 (대시보드 exec 전과 종료 시 중복 호출돼도 한 번만 정지)"""
+        log_listener = getattr(self, '_log_listener', None)
+        if log_listener:
+            self._log_listener = None
+            log_listener.stop()
+    
     def initialize_components(self) -> bool:
         """시스템 컴포넌트 초기화"""
         print("🔧 시스템 컴포넌트 초기화 중...")
         
         try:
             # UpdateManager 초기화 (더미든 실제든)
-            self.update_manager = ETFUpdateManager(
+            update_manager_cls = _load_update_manager()
+            self.update_manager = update_manager_cls(
                 db_path=self.db_path,
                 max_workers=self.max_workers
             )
@@ -139,9 +209,7 @@ class SafeETFLauncher:
     
     def run_update(self, max_etfs: int = None, force: bool = False, delay: float = 1.0) -> bool:
         """안전한 ETF 업데이트 실행"""
-        print("\n" + "="*60)
-        print("🚀 ETF 업데이트 시작")
-        print("="*60)
+        self._emit("\n" + "="*60, "🚀 ETF 업데이트 시작", "="*60)
         
         if not self.update_manager:
             print("❌ UpdateManager가 초기화되지 않았습니다")
@@ -149,12 +217,14 @@ class SafeETFLauncher:
         
         # 설정 표시
         target_etfs = max_etfs if max_etfs else 683
-        print(f"📊 업데이트 설정:")
-        print(f"  - 대상 ETF: {target_etfs}개")
-        print(f"  - 지연시간: {delay}초")
-        print(f"  - 데이터베이스: {self.db_path}")
-        print(f"  - 예상 소요시간: {target_etfs * delay / 60:.1f}분")
-        print(f"  - 모드: {'실제 데이터' if modules_loaded.get('UpdateManager') else '더미 모드'}")
+        self._emit(
+            "📊 업데이트 설정:",
+            f"  - 대상 ETF: {target_etfs}개",
+            f"  - 지연시간: {delay}초",
+            f"  - 데이터베이스: {self.db_path}",
+            f"  - 예상 소요시간: {target_etfs * delay / 60:.1f}분",
+            f"  - 모드: {'실제 데이터' if modules_loaded.get('UpdateManager') else '더미 모드'}"
+        )
         
         # 사용자 확인 (force 모드가 아닌 경우)
         if not force and target_etfs > 50:
@@ -170,8 +240,8 @@ class SafeETFLauncher:
         
         try:
             # 시작 시간 기록
-            start_time = datetime.now()
-            print(f"⏰ 업데이트 시작: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            start_mono = time.monotonic()
+            print(f"⏰ 업데이트 시작: {time.strftime('%Y-%m-%d %H:%M:%S')}")
             
             # 실제 업데이트 실행
             summary = self.update_manager.batch_update_all_etfs(
@@ -182,45 +252,45 @@ class SafeETFLauncher:
             )
             
             # 결과 처리
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - start_mono
             
             if summary:
                 # 안전한 속성 접근
-                total_etfs = getattr(summary, 'total_etfs', 0)
-                successful = getattr(summary, 'successful_updates', 0)
-                failed = getattr(summary, 'failed_updates', 0)
-                success_rate = getattr(summary, 'success_rate', 0.0)
-                total_aum = getattr(summary, 'total_aum', 0)
+                values = _summary_values(summary)
+                total_etfs, successful, failed, success_rate, total_aum = values
                 
-                print(f"\n🎉 업데이트 완료!")
-                print(f"⏰ 총 소요시간: {duration/60:.1f}분")
-                print(f"📊 총 ETF: {total_etfs}개")
-                print(f"✅ 성공: {successful}개 ({success_rate:.1f}%)")
-                print(f"❌ 실패: {failed}개")
+                lines = [
+                    "\n🎉 업데이트 완료!",
+                    f"⏰ 총 소요시간: {duration/60:.1f}분",
+                    f"📊 총 ETF: {total_etfs}개",
+                    f"✅ 성공: {successful}개 ({success_rate:.1f}%)",
+                    f"❌ 실패: {failed}개"
+                ]
                 
                 if total_aum > 0:
-                    print(f"💰 총 AUM: {total_aum:,}억원")
-                    print(f"💰 평균 AUM: {total_aum/successful:,.0f}억원" if successful > 0 else "")
+                    lines.append(f"💰 총 AUM: {total_aum:,}억원")
+                    lines.append(f"💰 평균 AUM: {total_aum/successful:,.0f}억원" if successful > 0 else "")
                 
                 # 성공률에 따른 메시지
                 if success_rate >= 90:
-                    print("🌟 훌륭한 성과로 업데이트되었습니다!")
+                    lines.append("🌟 훌륭한 성과로 업데이트되었습니다!")
                 elif success_rate >= 80:
-                    print("👍 성공적으로 업데이트되었습니다!")
+                    lines.append("👍 성공적으로 업데이트되었습니다!")
                 elif success_rate >= 60:
-                    print("✅ 대부분의 ETF가 업데이트되었습니다.")
+                    lines.append("✅ 대부분의 ETF가 업데이트되었습니다.")
                 else:
-                    print("⚠️ 일부 ETF 업데이트에 실패했습니다.")
+                    lines.append("⚠️ 일부 ETF 업데이트에 실패했습니다.")
                 
                 # 683개 전체 업데이트인 경우
                 if target_etfs >= 683:
-                    print("\n🌐 전체 ETF 수집 완료!")
-                    print("📊 이제 대시보드에서 결과를 확인할 수 있습니다:")
-                    print("   python main.py dashboard")
+                    lines.append("\n🌐 전체 ETF 수집 완료!")
+                    lines.append("📊 이제 대시보드에서 결과를 확인할 수 있습니다:")
+                    lines.append("   python main.py dashboard")
+                
+                self._emit(*lines)
                 
                 # 결과 저장
-                self._save_simple_summary(summary, duration)
+                self._save_simple_summary(values, duration)
                 
                 return True
             else:
@@ -235,37 +305,43 @@ class SafeETFLauncher:
             print(f"❌ 업데이트 실행 실패: {e}")
             return False
     
-    def _save_simple_summary(self, summary, duration: float):
+    def _save_simple_summary(self, values: tuple, duration: float):
         """간단한 요약 저장"""
         try:
-            results_dir = PROJECT_ROOT / 'results'
-            results_dir.mkdir(exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            result_file = results_dir / f'update_summary_{timestamp}.json'
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            result_file = RESULTS_DIR / f'update_summary_{timestamp}.json'
             
             # 안전한 데이터 추출
             summary_data = {
                 'timestamp': timestamp,
                 'duration_minutes': round(duration / 60, 2),
-                'total_etfs': getattr(summary, 'total_etfs', 0),
-                'successful_updates': getattr(summary, 'successful_updates', 0),
-                'failed_updates': getattr(summary, 'failed_updates', 0),
-                'success_rate': getattr(summary, 'success_rate', 0.0),
-                'total_aum': getattr(summary, 'total_aum', 0),
+                **dict(zip(_SUMMARY_FIELDS, values)),
                 'mode': 'real' if modules_loaded.get('UpdateManager') else 'dummy'
             }
             
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(summary_data, option=orjson.OPT_INDENT_2)
+                fd = os.open(str(result_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+            else:
+                with open(result_file, 'w', encoding='utf-8') as f:
+                    json.dump(summary_data, f, indent=2, ensure_ascii=False)
             
             print(f"📄 업데이트 요약 저장: {result_file}")
             
         except Exception as e:
             print(f"⚠️ 요약 저장 실패 (업데이트는 완료): {e}")
     
-    def run_dashboard(self, port: int = 8501, host: str = 'localhost') -> bool:
-        """웹 대시보드 실행"""
+    def run_dashboard(self, port: int = 8501, host: str = 'localhost',
+                      replace_process: bool = False) -> bool:
+        """웹 대시보드 실행
+        
+        replace_process=True면 (POSIX, dashboard 명령 전용) 런처 프로세스를 Streamlit으로 교체한다.
+        대화형 메뉴에서는 대시보드 종료 후 메뉴로 돌아와야 하므로 자식 프로세스로 실행한다.
+        """
         print(f"\n📊 ETF 웹 대시보드 시작")
         print(f"🌐 호스트: {host}")
         print(f"🔌 포트: {port}")
@@ -283,8 +359,6 @@ class SafeETFLauncher:
             return False
         
         try:
-            import subprocess
-            
             print("🚀 Streamlit 대시보드 실행 중...")
             print("   (브라우저가 자동으로 열립니다)")
             print("   (종료하려면 Ctrl+C 를 누르세요)")
@@ -299,9 +373,16 @@ class SafeETFLauncher:
                 '--theme.base', 'light'
             ]
             
-            # 실행
-            result = subprocess.run(cmd, check=True)
-            return result.returncode == 0
+            # 실행 (dashboard 명령은 POSIX에서 현재 프로세스를 Streamlit으로 교체해 런처 메모리 반환)
+            if not replace_process or sys.platform == 'win32':
+                result = subprocess.run(cmd, check=True)
+                return result.returncode == 0
+            
+            self._stop_log_listener()
+            logging.shutdown()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execvp(sys.executable, cmd)
             
         except subprocess.CalledProcessError as e:
             print(f"❌ 대시보드 실행 실패: {e}")
@@ -319,17 +400,18 @@ class SafeETFLauncher:
     
     def show_status(self):
         """시스템 상태 표시"""
-        print("\n📋 ETF 시스템 상태")
-        print("-" * 50)
+        lines = ["\n📋 ETF 시스템 상태", "-" * 50]
         
         # 모듈 상태
-        print("📦 모듈 상태:")
+        lines.append("📦 모듈 상태:")
+        if not modules_loaded:
+            lines.append("  - (아직 로드된 모듈 없음)")
         for module, loaded in modules_loaded.items():
             status = "✅ 사용가능" if loaded else "🔧 더미모드"
-            print(f"  - {module}: {status}")
+            lines.append(f"  - {module}: {status}")
         
         # 파일 상태
-        print(f"\n📁 파일 상태:")
+        lines.append("\n📁 파일 상태:")
         files_to_check = [
             ('데이터베이스', self.db_path),
             ('로그디렉토리', 'logs/'),
@@ -337,11 +419,29 @@ class SafeETFLauncher:
             ('대시보드', 'web/dashboard.py')
         ]
         
+        # 프로젝트 루트를 한 번만 읽어 최상위 항목 존재 여부 판단
+        try:
+            with os.scandir(PROJECT_ROOT) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        
         for desc, path in files_to_check:
-            file_path = PROJECT_ROOT / path
-            exists = file_path.exists()
+            parts = Path(path).parts
+            if len(parts) == 1:
+                exists = parts[0] in present
+            else:
+                exists = parts[0] in present and os.path.exists(PROJECT_ROOT / path)
             status = "✅ 존재" if exists else "❌ 없음"
-            print(f"  - {desc}: {status}")
+            lines.append(f"  - {desc}: {status}")
+        
+        # 데이터베이스 크기 (stat 한 번으로 확인)
+        try:
+            db_size = os.stat(PROJECT_ROOT / self.db_path).st_size
+            if db_size > 0:
+                lines.append(f"  - 데이터베이스 크기: {db_size / 1024 / 1024:.1f}MB")
+        except OSError:
+            pass
         
         # ETF 통계 (가능한 경우)
         if self.update_manager:
@@ -349,19 +449,30 @@ class SafeETFLauncher:
                 stats = self.update_manager.get_etf_statistics()
                 if stats and 'basic_stats' in stats:
                     basic = stats['basic_stats']
-                    print(f"\n📊 ETF 통계:")
-                    print(f"  - 총 ETF 수: {basic.get('total_etfs', 0):,}개")
-                    print(f"  - 총 AUM: {basic.get('total_aum', 0):,}억원")
+                    lines.append("\n📊 ETF 통계:")
+                    lines.append(f"  - 총 ETF 수: {basic.get('total_etfs', 0):,}개")
+                    lines.append(f"  - 총 AUM: {basic.get('total_aum', 0):,}억원")
             except Exception as e:
-                print(f"  - ETF 통계: 조회 실패 ({e})")
+                lines.append(f"  - ETF 통계: 조회 실패 ({e})")
         
-        print(f"\n🖥️ 시스템 정보:")
-        print(f"  - Python 버전: {sys.version.split()[0]}")
-        print(f"  - 프로젝트 경로: {PROJECT_ROOT}")
-        print(f"  - 실행 모드: {'실제 데이터' if modules_loaded.get('UpdateManager') else '더미 모드'}")
+        lines.append("\n🖥️ 시스템 정보:")
+        lines.append(f"  - Python 버전: {sys.version.split()[0]}")
+        lines.append(f"  - 프로젝트 경로: {PROJECT_ROOT}")
+        lines.append(f"  - 실행 모드: {'실제 데이터' if modules_loaded.get('UpdateManager') else '더미 모드'}")
+        
+        self._emit(*lines)
+
+# 서브커맨드별 기본값 (파서와 빠른 경로가 공유)
+_COMMAND_DEFAULTS = {
+    'update': {'max_etfs': 683, 'force': False, 'delay': 1.0},
+    'quick': {'count': 50, 'delay': 0.5},
+    'status': {},
+    'dashboard': {'port': 8501, 'host': 'localhost'},
+}
 
+@functools.cache
 def create_parser():
-    """명령행 인수 파서 생성"""
+    """명령행 인수 파서 생성 (한 번만 생성 후 재사용)"""
     parser = argparse.ArgumentParser(
         description="ETF 포트폴리오 관리 시스템 (683개 ETF 지원)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -378,18 +489,18 @@ def create_parser():
     
     # update 명령
     update_parser = subparsers.add_parser('update', help='ETF 데이터 업데이트')
-    update_parser.add_argument('--max-etfs', type=int, default=683, 
+    update_parser.add_argument('--max-etfs', type=int, default=_COMMAND_DEFAULTS['update']['max_etfs'], 
                               help='업데이트할 최대 ETF 수 (기본: 683)')
     update_parser.add_argument('--force', action='store_true',
                               help='확인 없이 강제 실행')
-    update_parser.add_argument('--delay', type=float, default=1.0,
+    update_parser.add_argument('--delay', type=float, default=_COMMAND_DEFAULTS['update']['delay'],
                               help='ETF간 지연시간(초) (기본: 1.0)')
     
     # quick 명령
     quick_parser = subparsers.add_parser('quick', help='빠른 업데이트')
-    quick_parser.add_argument('--count', type=int, default=50,
+    quick_parser.add_argument('--count', type=int, default=_COMMAND_DEFAULTS['quick']['count'],
                              help='업데이트할 ETF 수 (기본: 50)')
-    quick_parser.add_argument('--delay', type=float, default=0.5,
+    quick_parser.add_argument('--delay', type=float, default=_COMMAND_DEFAULTS['quick']['delay'],
                              help='ETF간 지연시간(초) (기본: 0.5)')
     
     # status 명령
@@ -397,13 +508,23 @@ def create_parser():
     
     # dashboard 명령
     dashboard_parser = subparsers.add_parser('dashboard', help='웹 대시보드 실행')
-    dashboard_parser.add_argument('--port', type=int, default=8501,
+    dashboard_parser.add_argument('--port', type=int, default=_COMMAND_DEFAULTS['dashboard']['port'],
                                  help='대시보드 포트 (기본: 8501)')
-    dashboard_parser.add_argument('--host', type=str, default='localhost',
+    dashboard_parser.add_argument('--host', type=str, default=_COMMAND_DEFAULTS['dashboard']['host'],
                                  help='대시보드 호스트 (기본: localhost)')
     
     return parser
 
+def parse_args(argv=None):
+    """명령행 인수 파싱 (옵션 없는 단일 명령은 argparse 생략)"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if len(argv) == 1 and argv[0] in _COMMAND_DEFAULTS:
+        return argparse.Namespace(command=argv[0], **_COMMAND_DEFAULTS[argv[0]])
+    
+    return create_parser().parse_args(argv)
+
 def main():
     """메인 함수"""
     print("🚀 ETF 포트폴리오 관리 시스템 v3.1")
@@ -412,8 +533,7 @@ def main():
     
     try:
         # 명령행 인수 파싱
-        parser = create_parser()
-        args = parser.parse_args()
+        args = parse_args()
         
         # 시스템 런처 초기화
         launcher = SafeETFLauncher()
@@ -452,7 +572,7 @@ def main():
             # 대시보드는 초기화 없이도 실행 가능
             port = getattr(args, 'port', 8501)
             host = getattr(args, 'host', 'localhost')
-            success = launcher.run_dashboard(port=port, host=host)
+            success = launcher.run_dashboard(port=port, host=host, replace_process=True)
             sys.exit(0 if success else 1)
             
         else:
@@ -466,61 +586,79 @@ def main():
         print(f"❌ 시스템 실행 중 오류: {e}")
         sys.exit(1)
 
+def _menu_status(launcher):
+    if launcher.initialize_components():
+        launcher.show_status()
+
+def _menu_quick_update(launcher):
+    if launcher.initialize_components():
+        print("⚡ 빠른 업데이트 (50개 ETF)")
+        launcher.run_update(max_etfs=50, force=True, delay=0.5)
+
+def _menu_medium_update(launcher):
+    if launcher.initialize_components():
+        print("📈 200개 ETF 업데이트")
+        confirm = input("계속 진행하시겠습니까? (y/N): ")
+        if confirm.lower() == 'y':
+            launcher.run_update(max_etfs=200, force=False, delay=1.0)
+
+def _menu_full_update(launcher):
+    if launcher.initialize_components():
+        print("🌐 전체 683개 ETF 업데이트")
+        print("⚠️ 이 작업은 30-45분 소요될 수 있습니다")
+        confirm = input("정말로 전체 업데이트를 실행하시겠습니까? (y/N): ")
+        if confirm.lower() == 'y':
+            launcher.run_update(max_etfs=None, force=False, delay=1.5)
+
+def _menu_dashboard(launcher):
+    print("📊 웹 대시보드 실행")
+    try:
+        port_input = input("포트 번호 (기본: 8501): ").strip()
+        port = int(port_input) if port_input.isdigit() else 8501
+        launcher.run_dashboard(port=port)
+    except ValueError:
+        launcher.run_dashboard(port=8501)
+
+# 메뉴 번호 -> (표시 문구, 실행 함수), None은 종료
+_MENU = {
+    '1': ("📊 시스템 상태 확인", _menu_status),
+    '2': ("⚡ 빠른 업데이트 (50개)", _menu_quick_update),
+    '3': ("📈 중간 업데이트 (200개)", _menu_medium_update),
+    '4': ("🌐 전체 업데이트 (683개)", _menu_full_update),
+    '5': ("📊 웹 대시보드 실행", _menu_dashboard),
+    '6': ("👋 종료", None),
+}
+
+_MENU_TEXT = '\n'.join(
+    [f"\n{'='*50}", "🎯 ETF 시스템 메인 메뉴", "="*50] +
+    [f"{key}. {label}" for key, (label, _) in _MENU.items()]
+)
+
 def run_interactive_menu(launcher):
     """대화형 메뉴 실행"""
+    # POSIX 터미널에서 입력 줄 편집 활성화
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+    
     while True:
-        print(f"\n{'='*50}")
-        print("🎯 ETF 시스템 메인 메뉴")
-        print("="*50)
-        print("1. 📊 시스템 상태 확인")
-        print("2. ⚡ 빠른 업데이트 (50개)")
-        print("3. 📈 중간 업데이트 (200개)")
-        print("4. 🌐 전체 업데이트 (683개)")
-        print("5. 📊 웹 대시보드 실행")
-        print("6. 👋 종료")
+        print(_MENU_TEXT)
         
         try:
             choice = input("\n메뉴 선택 (1-6): ").strip()
+            entry = _MENU.get(choice)
             
-            if choice == "1":
-                if launcher.initialize_components():
-                    launcher.show_status()
-                
-            elif choice == "2":
-                if launcher.initialize_components():
-                    print("⚡ 빠른 업데이트 (50개 ETF)")
-                    launcher.run_update(max_etfs=50, force=True, delay=0.5)
-                
-            elif choice == "3":
-                if launcher.initialize_components():
-                    print("📈 200개 ETF 업데이트")
-                    confirm = input("계속 진행하시겠습니까? (y/N): ")
-                    if confirm.lower() == 'y':
-                        launcher.run_update(max_etfs=200, force=False, delay=1.0)
-                
-            elif choice == "4":
-                if launcher.initialize_components():
-                    print("🌐 전체 683개 ETF 업데이트")
-                    print("⚠️ 이 작업은 30-45분 소요될 수 있습니다")
-                    confirm = input("정말로 전체 업데이트를 실행하시겠습니까? (y/N): ")
-                    if confirm.lower() == 'y':
-                        launcher.run_update(max_etfs=None, force=False, delay=1.5)
+            if entry is None:
+                print("❌ 1-6 중에서 선택해주세요")
+                continue
             
-            elif choice == "5":
-                print("📊 웹 대시보드 실행")
-                try:
-                    port_input = input("포트 번호 (기본: 8501): ").strip()
-                    port = int(port_input) if port_input.isdigit() else 8501
-                    launcher.run_dashboard(port=port)
-                except ValueError:
-                    launcher.run_dashboard(port=8501)
-                
-            elif choice == "6":
+            action = entry[1]
+            if action is None:
                 print("👋 ETF 시스템을 종료합니다")
                 break
-                
-            else:
-                print("❌ 1-6 중에서 선택해주세요")
+            
+            action(launcher)
                 
         except (KeyboardInterrupt, EOFError):
             print("\n👋 ETF 시스템을 종료합니다")
@@ -529,4 +667,5 @@ def run_interactive_menu(launcher):
             print(f"❌ 오류 발생: {e}")
 
 if __name__ == "__main__":
+    _init_dirs()
     main()
\ No newline at end of file
@@ -519,6 +519,99 @@ class TestBacktestingValidation(unittest.TestCase):
                 places=6
             )
 
+class TestPortfolioReturnSegments(unittest.TestCase):
+    """구간 단위 포트폴리오 수익률 계산 검증 (기존 일별 루프와 비교)"""
+    
+    def setUp(self):
+        """테스트 설정 (float64로 계산해 기존 루프와 정밀 비교)"""
+        self.backtester = BacktestingEngine()
+        self.backtester.dtype = np.float64
+        
+        dates = pd.bdate_range('2021-01-01', '2022-12-31')
+        rng = np.random.default_rng(7)
+        prices = 10000 * np.cumprod(1 + rng.normal(0.0003, 0.015, (len(dates), 3)), axis=0)
+        self.price_data = pd.DataFrame(prices, index=dates, columns=['069500', '139660', '114260'])
+        self.weights = {'069500': 0.5, '139660': 0.3, '114260': 0.2}
+    
+    def _reference_loop(self, rebalance_freq):
+        """기존 일별 루프 구현 (리밸런싱일은 각 기간의 마지막 거래일)"""
+        dates = self.price_data.index
+        returns = self.price_data.pct_change().fillna(0).values
+        target = np.array([self.weights[code] for code in self.price_data.columns])
+        
+        if rebalance_freq == 'M':
+            period = dates.to_period('M')
+        elif rebalance_freq == 'Q':
+            period = dates.to_period('Q')
+        elif rebalance_freq == 'Y':
+            period = dates.to_period('Y')
+        else:
+            period = None
+        
+        values, weight_rows = [], []
+        value = 1000000
+        current = target.copy()
+        for i in range(len(dates)):
+            if period is None:
+                is_rebalance = i == 0
+            else:
+                is_rebalance = i + 1 < len(dates) and period[i + 1] != period[i]
+            if is_rebalance:
+                current = target.copy()
+            
+            value *= 1 + (returns[i] * current).sum()
+            values.append(value)
+            weight_rows.append(current.copy())
+            
+            if not is_rebalance:
+                asset_values = current * value * (1 + returns[i])
+                current = asset_values / asset_values.sum()
+        
+        portfolio_returns = pd.Series(values, index=dates).pct_change().fillna(0)
+        return portfolio_returns, np.array(weight_rows)
+    
+    def test_segments_match_daily_loop(self):
+        """월/분기/연/리밸런싱 없음 모두 기존 루프와 수익률·비중 일치"""
+        for freq in ('M', 'Q', 'Y', 'N'):
+            with self.subTest(rebalance_freq=freq):
+                returns, weights = self.backtester.calculate_portfolio_returns(
+                    self.price_data, self.weights, freq)
+                expected_returns, expected_weights = self._reference_loop(freq)
+                
+                np.testing.assert_allclose(returns.values, expected_returns.values, atol=1e-12)
+                np.testing.assert_allclose(weights.values, expected_weights, atol=1e-12)
+
+class TestRebalanceSchedule(unittest.TestCase):
+    """리밸런싱일 탐지 테스트 (달력상 월말이 휴장일인 경우)"""
+    
+    def setUp(self):
+        """테스트 설정 (주말이 빠진 거래일 인덱스)"""
+        self.backtester = BacktestingEngine()
+        self.backtester.dtype = np.float64
+        
+        dates = pd.bdate_range('2023-08-01', '2023-11-30')
+        rng = np.random.default_rng(3)
+        prices = 10000 * np.cumprod(1 + rng.normal(0, 0.02, (len(dates), 2)), axis=0)
+        self.price_data = pd.DataFrame(prices, index=dates, columns=['069500', '139660'])
+        self.weights = {'069500': 0.6, '139660': 0.4}
+    
+    def test_rebalance_on_last_trading_day(self):
+        """2023-09-30(토)이 아닌 마지막 거래일 2023-09-29(금)에 리밸런싱"""
+        _, weights = self.backtester.calculate_portfolio_returns(
+            self.price_data, self.weights, 'M')
+        target = [0.6, 0.4]
+        
+        self.assertNotIn(pd.Timestamp('2023-09-30'), weights.index)
+        for day in ('2023-08-31', '2023-09-29', '2023-10-31'):
+            # 리밸런싱일과 다음 거래일은 목표 비중
+            row = weights.index.get_loc(pd.Timestamp(day))
+            np.testing.assert_allclose(weights.iloc[row].values, target, atol=1e-12)
+            np.testing.assert_allclose(weights.iloc[row + 1].values, target, atol=1e-12)
+        
+        # 리밸런싱 사이 거래일은 가격 변화에 따라 비중이 달라짐
+        drifted = weights.loc['2023-09-28'].values
+        self.assertGreater(np.abs(drifted - target).max(), 1e-6)
+
 if __name__ == '__main__':
     # 테스트 실행
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+데이터 백업 테스트 모듈
+블록 단위 증분 백업과 복구의 정확성을 검증하는 테스트
+"""
+
+import unittest
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 백업 모듈은 yaml 등 선택 의존성이 필요 (없으면 이 모듈의 테스트를 건너뜀)
+try:
+    from core.data_backup import DataBackupManager
+    DATA_BACKUP_AVAILABLE = True
+    DATA_BACKUP_IMPORT_ERROR = None
+except ImportError as e:
+    DATA_BACKUP_AVAILABLE = False
+    DATA_BACKUP_IMPORT_ERROR = e
+    print(f"⚠️ 백업 테스트 건너뜀 - core.data_backup import 실패: {e}")
+
+@unittest.skipUnless(DATA_BACKUP_AVAILABLE, f"core.data_backup import 실패: {DATA_BACKUP_IMPORT_ERROR}")
+class TestIncrementalBackup(unittest.TestCase):
+    """블록 단위 증분 백업/복구 테스트"""
+    
+    DB_SIZE = 4 * 1024 * 1024
+    
+    def setUp(self):
+        """테스트 설정 (백업 항목이 상대 경로라 임시 폴더에서 실행)"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        
+        with open('config.yaml', 'w', encoding='utf-8') as f:
+            f.write("backup:\n  local_path: ./backups\n  compression: true\n")
+        with open('portfolio_data.db', 'wb') as f:
+            f.write(b'portfolio')
+        with open('etf_data.db', 'wb') as f:
+            f.write(np.random.default_rng(0).bytes(self.DB_SIZE))
+        
+        self.backup_manager = DataBackupManager('config.yaml')
+    
+    def tearDown(self):
+        """테스트 정리"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _modify_db(self, offset, data):
+        with open('etf_data.db', 'r+b') as f:
+            f.seek(offset)
+            f.write(data)
+    
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def test_delta_round_trip(self):
+        """변경 블록만 저장한 증분 백업을 새 폴더에 복구"""
+        self.backup_manager.create_full_backup('base')
+        self._modify_db(100000, b'changed block')
+        incremental = self.backup_manager.create_incremental_backup()
+        expected = self._read('etf_data.db')
+        
+        manifest = self.backup_manager._load_backup_manifest(incremental)
+        self.assertEqual(manifest['files']['path'], ['etf_data.db'])
+        self.assertIsNotNone(manifest['files']['delta'][0])
+        self.assertLess(manifest['size_mb'], 1)
+        
+        self.assertEqual(self.backup_manager.verify_backup_integrity(incremental)['integrity_score'], 100)
+        
+        # 핵심 파일이 없으면 기준 백업부터 새 폴더에 복구
+        os.remove('portfolio_data.db')
+        self.assertTrue(self.backup_manager.restore_backup(incremental, 'restored'))
+        self.assertEqual(self._read(os.path.join('restored', 'etf_data.db')), expected)
+    
+    def test_incremental_restore_over_live_tree(self):
+        """기준 백업 이후 다시 바뀐 파일 위에 증분 백업 복구"""
+        self.backup_manager.create_full_backup('base')
+        self._modify_db(100000, b'changed block')
+        incremental = self.backup_manager.create_incremental_backup()
+        expected = self._read('etf_data.db')
+        
+        # 증분 백업 이후 다른 블록이 또 바뀐 상태 (기준 백업 복구는 건너뜀)
+        self._modify_db(3000000, b'changed again')
+        
+        self.assertTrue(self.backup_manager.restore_backup(incremental, '.'))
+        self.assertEqual(self._read('etf_data.db'), expected)
+
+if __name__ == '__main__':
+    # 테스트 실행
+    unittest.main(verbosity=2)
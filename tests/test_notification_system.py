@@ -0,0 +1,107 @@
+"""
+알림 시스템 테스트 모듈
+이메일 일괄 발송(SMTP PIPELINING) 동작을 스텁 서버로 검증하는 테스트
+"""
+
+import unittest
+import tempfile
+import json
+import shutil
+import smtplib
+import socket
+import threading
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.notification_system import NotificationSystem
+
+class _StubSMTPServer:
+    """PIPELINING을 지원하는 최소 SMTP 서버 (RCPT에 'bad' 포함 시 거부, 본문에 'REJECT' 포함 시 554)"""
+    
+    def __init__(self):
+        self.bodies = []
+        self.commands = []
+        self._sock = socket.socket()
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen(1)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+    
+    def _serve(self):
+        conn, _ = self._sock.accept()
+        reader = conn.makefile('rb')
+        reply = lambda line: conn.sendall(line.encode('ascii') + b'\r\n')
+        reply('220 stub')
+        for raw in reader:
+            command = raw.decode('ascii').strip()
+            verb = command.split(' ', 1)[0].split(':', 1)[0].upper()
+            self.commands.append(verb)
+            if verb == 'EHLO':
+                reply('250-stub')
+                reply('250 PIPELINING')
+            elif verb == 'RCPT':
+                reply('550 rejected' if 'bad' in command else '250 ok')
+            elif verb == 'DATA':
+                reply('354 go ahead')
+                body = b''.join(iter(reader.readline, b'.\r\n'))
+                self.bodies.append(body)
+                reply('554 rejected' if b'REJECT' in body else '250 queued')
+            elif verb == 'QUIT':
+                reply('221 bye')
+                break
+            else:  # MAIL, RSET, NOOP
+                reply('250 ok')
+        conn.close()
+        self._sock.close()
+
+class TestPipelinedEmail(unittest.TestCase):
+    """SMTP PIPELINING 일괄 발송 테스트 (스텁 서버 사용)"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, 'notification_config.json')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'email': {'enabled': True, 'from_email': 'bot@example.com',
+                                 'to_emails': ['a@example.com', 'b@example.com']}}, f)
+        self.notifier = NotificationSystem(self.config_path)
+        self.stub = _StubSMTPServer()
+    
+    def tearDown(self):
+        """테스트 정리"""
+        self.notifier.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _send(self, texts):
+        server = smtplib.SMTP('127.0.0.1', self.stub.port, timeout=5)
+        try:
+            server.ehlo()
+            self.assertTrue(server.has_extn('pipelining'))
+            return self.notifier._send_pipelined(server, texts)
+        finally:
+            server.quit()
+    
+    def test_pipelined_results_and_bodies(self):
+        """메시지별 결과가 순서대로 반환되고 본문의 점 이스케이프가 보존됨"""
+        texts = ['first\n.dot line\n', 'REJECT me', 'third']
+        
+        self.assertEqual(self._send(texts), [True, False, True])
+        self.assertEqual(self.stub.bodies, [b'first\r\n..dot line\r\n',
+                                            b'REJECT me\r\n', b'third\r\n'])
+        self.assertEqual(self.stub.commands.count('MAIL'), 3)
+    
+    def test_all_recipients_rejected(self):
+        """수신자가 모두 거부되면 빈 본문으로 DATA를 닫고 RSET 후 다음 메시지 진행"""
+        self.notifier.config.email_to = ['bad@example.com']
+        
+        self.assertEqual(self._send(['one', 'two']), [False, False])
+        self.assertEqual(self.stub.bodies, [b'', b''])
+        self.assertEqual(self.stub.commands.count('RSET'), 2)
+
+if __name__ == '__main__':
+    # 테스트 실행
+    unittest.main(verbosity=2)